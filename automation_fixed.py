@@ -6,19 +6,23 @@ YouTube 게시물 자동화 스크립트 - 수정된 버전
 2024년 7월 기준, YouTube의 자동화 탐지 정책 강화로 이미지 업로드는 실제로 차단됨
 """
 
-import sys
 import time
+_SCRIPT_T0 = time.perf_counter()  # --import-profile 용 스크립트 시작 시각
+
+import sys
 import argparse
 import os
 import platform
 import subprocess
 import webbrowser
-from google.oauth2.credentials import Credentials
 import base64
 import json
+import mimetypes
 import shutil
 import tempfile
-from google.auth.transport.requests import Request
+import threading
+from contextlib import contextmanager
+from datetime import datetime
 
 # Windows 한글/이모지 출력 문제 해결
 try:
@@ -41,135 +45,456 @@ def safe_print(message):
     except Exception:
         print("로그 출력 오류")
 
-def debug_log(message, level="INFO"):
-    """디버그 로그 함수"""
-    from datetime import datetime
+# 로그 레벨: 기본은 INFO 이상 출력 (기존 출력 유지), --log-level로 올리거나 --debug로 DEBUG부터 출력
+# 브라우저를 추가로 조회하는 진단 로그(요소/페이지 정보 등)는 DEBUG 레벨에서만 수집
+LOG_LEVELS = {'DEBUG': 10, 'INFO': 20, 'SUCCESS': 25, 'WARNING': 30, 'ERROR': 40}
+DEFAULT_LOG_LEVEL = 'INFO'
+_log_threshold = LOG_LEVELS[DEFAULT_LOG_LEVEL]
+
+def set_log_level(level):
+    """debug_log 출력 기준 레벨 설정 (LOG_LEVELS의 키)"""
+    global _log_threshold
+    _log_threshold = LOG_LEVELS[level]
+
+def log_enabled(level="INFO"):
+    """해당 레벨의 로그가 출력되는지 (비싼 디버그 정보 수집 전에 확인)"""
+    return LOG_LEVELS.get(level, LOG_LEVELS['INFO']) >= _log_threshold
+
+def debug_log(message, *args, level="INFO"):
+    """
+    디버그 로그 함수
+    - 꺼진 레벨이면 즉시 반환 (args를 넘기면 문자열 포맷도 하지 않음)
+      예: debug_log("선택자 %s 발견", index, level="SUCCESS")
+    - message가 호출 가능한 객체면 실제로 출력할 때만 호출해 문자열 생성 (WebDriver 조회 등 지연)
+    """
+    if LOG_LEVELS.get(level, LOG_LEVELS['INFO']) < _log_threshold:
+        return
+    if callable(message):
+        message = message()
+    elif args:
+        message = message % args
     timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-    print(f"[{timestamp}] [{level}] {message}")
+    safe_print(f"[{timestamp}] [{level}] {message}")
+
+# 요소의 디버그 정보를 브라우저 안에서 한 번에 수집 (속성/CSS마다 WebDriver 왕복하지 않음)
+JS_ELEMENT_INFO = """
+var el = arguments[0];
+var rect = el.getBoundingClientRect();
+var style = window.getComputedStyle(el);
+var attributes = {};
+['id', 'name', 'class', 'type', 'placeholder', 'value', 'aria-label'].forEach(function(name) {
+    var value = el.getAttribute(name);
+    if (value) attributes[name] = (name === 'value' && el.type === 'password') ? '***' : value;
+});
+return {
+    tag: el.tagName.toLowerCase(),
+    displayed: rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden' && style.display !== 'none',
+    enabled: !el.disabled,
+    location: {x: Math.round(rect.left + window.scrollX), y: Math.round(rect.top + window.scrollY)},
+    size: {width: Math.round(rect.width), height: Math.round(rect.height)},
+    text: (el.innerText || '').trim().slice(0, 200),
+    attributes: attributes,
+    css: {
+        'display': style.display,
+        'visibility': style.visibility,
+        'opacity': style.opacity,
+        'pointer-events': style.pointerEvents
+    }
+};
+"""
 
 def debug_element_info(driver, element, name):
-    """요소 정보 디버그"""
-    debug_log(f"=== {name} 요소 정보 ===")
+    """요소 정보 디버그 (DEBUG 레벨이 아니면 아무것도 조회하지 않음)"""
+    if not log_enabled('DEBUG'):
+        return
+    debug_log("=== %s 요소 정보 ===", name, level="DEBUG")
     try:
-        debug_log(f"태그명: {element.tag_name}")
-        debug_log(f"표시 여부: {element.is_displayed()}")
-        debug_log(f"활성화 여부: {element.is_enabled()}")
-        debug_log(f"위치: {element.location}")
-        debug_log(f"크기: {element.size}")
-        debug_log(f"텍스트: {element.text}")
-        
-        # 속성들
-        attributes = ['id', 'name', 'class', 'type', 'placeholder', 'value', 'aria-label']
-        for attr in attributes:
-            try:
-                value = element.get_attribute(attr)
-                if value:
-                    debug_log(f"{attr}: {value}")
-            except:
-                pass
-                
-        # CSS 속성들
-        css_props = ['display', 'visibility', 'opacity', 'pointer-events']
-        for prop in css_props:
-            try:
-                value = element.value_of_css_property(prop)
-                debug_log(f"CSS {prop}: {value}")
-            except:
-                pass
-                
+        info = driver.execute_script(JS_ELEMENT_INFO, element)
+        debug_log("태그명: %s", info['tag'], level="DEBUG")
+        debug_log("표시 여부: %s", info['displayed'], level="DEBUG")
+        debug_log("활성화 여부: %s", info['enabled'], level="DEBUG")
+        debug_log("위치: %s", info['location'], level="DEBUG")
+        debug_log("크기: %s", info['size'], level="DEBUG")
+        debug_log("텍스트: %s", info['text'], level="DEBUG")
+        for attr, value in info['attributes'].items():
+            debug_log("%s: %s", attr, value, level="DEBUG")
+        for prop, value in info['css'].items():
+            debug_log("CSS %s: %s", prop, value, level="DEBUG")
     except Exception as e:
-        debug_log(f"요소 정보 확인 실패: {e}", "ERROR")
+        debug_log("요소 정보 확인 실패: %s", e, level="ERROR")
 
 def debug_page_info(driver):
-    """페이지 정보 디버그"""
-    debug_log("=== 페이지 정보 ===")
-    debug_log(f"현재 URL: {driver.current_url}")
-    debug_log(f"페이지 제목: {driver.title}")
+    """페이지 정보 디버그 (DEBUG 레벨이 아니면 페이지 소스를 가져오지 않음)"""
+    if not log_enabled('DEBUG'):
+        return
+    debug_log("=== 페이지 정보 ===", level="DEBUG")
+    debug_log("현재 URL: %s", driver.current_url, level="DEBUG")
+    debug_log("페이지 제목: %s", driver.title, level="DEBUG")
     
     # 페이지 소스에서 password 관련 요소 찾기
     try:
         page_source = driver.page_source
-        debug_log(f"페이지 소스 길이: {len(page_source)}")
+        debug_log("페이지 소스 길이: %s", len(page_source), level="DEBUG")
         
         password_keywords = ['password', 'pwd', 'passwd']
         for keyword in password_keywords:
             if keyword in page_source.lower():
-                debug_log(f"페이지에서 '{keyword}' 키워드 발견")
+                debug_log("페이지에서 '%s' 키워드 발견", keyword, level="DEBUG")
     except Exception as e:
-        debug_log(f"페이지 소스 확인 실패: {e}", "ERROR")
+        debug_log("페이지 소스 확인 실패: %s", e, level="ERROR")
 
-def get_chrome_version():
+# 단계별 타이밍 스팬: --timings 지정 시 단계마다 JSON 한 줄씩 기록
+# {"span": 단계, "start": 시작 epoch, "duration_ms": 소요, "ok": bool, "parent": 상위 단계, ...컨텍스트/추가 필드}
+_timings_sink = None                 # None: 기록 안 함, '-': stdout, 그 외: 열린 파일
+_timings_lock = threading.Lock()
+_timing_context = {}                 # 모든 스팬에 붙는 필드 (account, job 등)
+_span_stack = threading.local()      # 스레드별 중첩 스팬 경로
+
+def configure_timings(target):
+    """타이밍 출력 대상 설정 ('-'이면 stdout, 호출 가능한 객체면 스팬 dict를 직접 전달, 아니면 파일에 이어쓰기)"""
+    global _timings_sink
+    if target is None or callable(target):
+        _timings_sink = target
+    elif target == '-':
+        _timings_sink = '-'
+    else:
+        _timings_sink = open(target, 'a', encoding='utf-8', buffering=1)
+
+def set_timing_context(**fields):
+    """이후 기록되는 모든 스팬에 붙일 필드 설정 (None 값은 제거)"""
+    for key, value in fields.items():
+        if value is None:
+            _timing_context.pop(key, None)
+        else:
+            _timing_context[key] = value
+
+def emit_timing(record):
+    """스팬 한 줄 기록 (워커 stdin 모드에서는 stdout이 stderr로 바뀌어 있으므로 응답과 섞이지 않음)"""
+    if callable(_timings_sink):
+        _timings_sink(record)
+        return
+    line = json.dumps(record, ensure_ascii=False, default=str)
+    with _timings_lock:
+        stream = sys.stdout if _timings_sink == '-' else _timings_sink
+        stream.write(line + "\n")
+        stream.flush()
+
+@contextmanager
+def timing_span(name, **fields):
     """
-    현재 시스템의 Chrome 브라우저 메이저 버전을 반환
-    (자동화 탐지 우회 및 드라이버 호환성 확보 목적)
+    단계 하나의 소요 시간을 단조 시계로 측정
+    with 블록에서 반환된 dict에 필드를 추가하면 함께 기록됨 (예: span['ok'] = False)
     """
+    if _timings_sink is None and _event_stream is None:
+        yield {}
+        return
+    stack = getattr(_span_stack, 'names', None)
+    if stack is None:
+        stack = _span_stack.names = []
+    span = dict(_timing_context, span=name, start=round(time.time(), 3), ok=True, **fields)
+    if stack:
+        span['parent'] = stack[-1]
+    stack.append(name)
+    emit_event('phase_start', phase=name, parent=span.get('parent'), **fields)
+    started = time.perf_counter()
     try:
-        version = None
-        if platform.system() == "Windows":
-            import winreg
-            key_paths = [
-                r"SOFTWARE\\Google\\Chrome\\BLBeacon",
-                r"SOFTWARE\\Wow6432Node\\Google\\Chrome\\BLBeacon",
-                r"SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\Google Chrome"
-            ]
-            # 여러 레지스트리 경로에서 크롬 버전 탐색
-            for key_path in key_paths:
-                try:
-                    key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path)
-                    version, _ = winreg.QueryValueEx(key, "version")
-                    winreg.CloseKey(key)
-                    break
-                except:
-                    continue
+        yield span
+    except BaseException as e:
+        span['ok'] = False
+        span['error'] = type(e).__name__
+        raise
+    finally:
+        stack.pop()
+        span['duration_ms'] = round((time.perf_counter() - started) * 1000, 2)
+        if _timings_sink is not None:
+            emit_timing(span)
+        emit_event('phase_end', phase=name, ok=span['ok'], duration_ms=span['duration_ms'],
+                   error=span.get('error'))
+
+def timed(name):
+    """함수 전체를 타이밍 스팬으로 감싸는 데코레이터 (반환값이 거짓이면 ok=False)"""
+    def decorator(func):
+        import functools
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timing_span(name) as span:
+                result = func(*args, **kwargs)
+                if not result and span:
+                    span['ok'] = False
+                return result
+        return wrapper
+    return decorator
+
+# 기계용 이벤트 스트림 (--events json): 수명주기 이벤트를 JSON 한 줄씩 stdout으로, 사람용 로그는 stderr로
+# {"event": 종류, "ts": epoch, ...컨텍스트(account, job 등), ...이벤트 필드}
+# 종류: phase_start / phase_end / upload_progress / selector_win / error / result
+_event_stream = None                 # None: 이벤트 없음, 그 외: 이벤트를 쓸 원래 stdout
+_events_lock = threading.Lock()
+
+def configure_events(mode):
+    """'json'이면 현재 stdout을 이벤트 전용으로 쓰고, 이후 print/safe_print 출력은 stderr로 보냄"""
+    global _event_stream
+    if mode == 'json' and _event_stream is None:
+        _event_stream = sys.stdout
+        sys.stdout = sys.stderr
+
+def emit_event(event, **fields):
+    """이벤트 한 줄 기록 (이벤트 모드가 아니면 아무것도 하지 않음)"""
+    if _event_stream is None:
+        return
+    record = dict(_timing_context, event=event, ts=round(time.time(), 3), **fields)
+    line = json.dumps(record, ensure_ascii=False, separators=(',', ':'), default=str)
+    with _events_lock:
+        _event_stream.write(line + "\n")
+        _event_stream.flush()
+
+def classify_error(error):
+    """예외를 이벤트 오류 코드로 분류"""
+    name = type(error).__name__
+    module = type(error).__module__ or ''
+    if isinstance(error, KeyboardInterrupt):
+        return 'interrupted'
+    if 'Timeout' in name:
+        return 'timeout'
+    if name == 'HttpError':
+        return 'api_error'
+    if name == 'RefreshError' or module.startswith('google.auth'):
+        return 'auth_error'
+    if module.startswith('selenium') or module.startswith('undetected_chromedriver'):
+        return 'browser_error'
+    if module.startswith('requests') or module.startswith('urllib3') or isinstance(error, ConnectionError):
+        return 'network_error'
+    if isinstance(error, OSError):
+        return 'file_error'
+    return 'unknown_error'
+
+def report_error(code, message, **fields):
+    """분류된 오류 이벤트 기록"""
+    emit_event('error', code=code, message=str(message), **fields)
+
+CHROMEDRIVER_DIR = os.path.join(os.getcwd(), "chromedriver")
+CHROMEDRIVER_MANIFEST = os.path.join(CHROMEDRIVER_DIR, "manifest.json")
+DEFAULT_CHROME_MAJOR = "137"
+
+# 프로세스 내 메모이제이션 (같은 프로세스에서 여러 번 드라이버를 띄워도 한 번만 탐지)
+_chrome_version_memo = {}
+
+def load_driver_manifest():
+    """chromedriver/manifest.json 로드 (없거나 손상되면 빈 manifest)"""
+    try:
+        with open(CHROMEDRIVER_MANIFEST, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if isinstance(manifest, dict):
+            manifest.setdefault('browsers', {})
+            manifest.setdefault('drivers', {})
+            return manifest
+    except Exception:
+        pass
+    return {'browsers': {}, 'drivers': {}}
+
+def save_driver_manifest(manifest):
+    """manifest를 임시 파일에 쓴 뒤 교체 (중간에 끊겨도 손상되지 않도록)"""
+    os.makedirs(CHROMEDRIVER_DIR, exist_ok=True)
+    tmp_path = CHROMEDRIVER_MANIFEST + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, CHROMEDRIVER_MANIFEST)
+
+def get_driver_platform():
+    """Chrome for Testing 플랫폼 이름 반환 (win64, win32, linux64, mac-x64, mac-arm64)"""
+    system = platform.system()
+    machine = platform.machine().lower()
+    if system == "Windows":
+        return "win64" if machine.endswith('64') else "win32"
+    if system == "Darwin":
+        return "mac-arm64" if machine in ('arm64', 'aarch64') else "mac-x64"
+    return "linux64"
+
+def find_chrome_binary():
+    """플랫폼별 Chrome 실행 파일 경로 탐색 (없으면 None)"""
+    system = platform.system()
+    if system == "Windows":
+        chrome_path = shutil.which('chrome') or shutil.which('chrome.exe')
+        possible_paths = [
+            os.path.expandvars(r'%ProgramFiles%/Google/Chrome/Application/chrome.exe'),
+            os.path.expandvars(r'%ProgramFiles(x86)%/Google/Chrome/Application/chrome.exe'),
+            os.path.expandvars(r'%LocalAppData%/Google/Chrome/Application/chrome.exe'),
+        ]
+    elif system == "Darwin":
+        chrome_path = None
+        possible_paths = [
+            '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+            os.path.expanduser('~/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'),
+            '/Applications/Chromium.app/Contents/MacOS/Chromium',
+        ]
+    else:
+        chrome_path = None
+        for name in ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome'):
+            chrome_path = shutil.which(name)
+            if chrome_path:
+                break
+        possible_paths = ['/opt/google/chrome/chrome', '/usr/bin/google-chrome', '/snap/bin/chromium']
+    if chrome_path:
+        return chrome_path
+    for path in possible_paths:
+        if os.path.exists(path):
+            return path
+    return None
+
+def probe_chrome_version(chrome_path):
+    """레지스트리 / PowerShell / --version 으로 Chrome 전체 버전 문자열 탐지 (실패 시 None)"""
+    version = None
+    if platform.system() == "Windows":
+        import winreg
+        key_paths = [
+            r"SOFTWARE\\Google\\Chrome\\BLBeacon",
+            r"SOFTWARE\\Wow6432Node\\Google\\Chrome\\BLBeacon",
+            r"SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\Google Chrome"
+        ]
+        # 여러 레지스트리 경로에서 크롬 버전 탐색
+        for key_path in key_paths:
+            try:
+                key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path)
+                version, _ = winreg.QueryValueEx(key, "version")
+                winreg.CloseKey(key)
+                break
+            except:
+                continue
         # PowerShell로 Chrome 버전 확인 (Windows)
-        if not version and platform.system() == "Windows":
+        if not version and chrome_path:
             try:
-                # 크롬 실행 파일 경로 탐색
-                import shutil
-                chrome_path = shutil.which('chrome') or shutil.which('chrome.exe')
-                if not chrome_path:
-                    possible_paths = [
-                        os.path.expandvars(r'%ProgramFiles%/Google/Chrome/Application/chrome.exe'),
-                        os.path.expandvars(r'%ProgramFiles(x86)%/Google/Chrome/Application/chrome.exe'),
-                        os.path.expandvars(r'%LocalAppData%/Google/Chrome/Application/chrome.exe'),
-                    ]
-                    for path in possible_paths:
-                        if os.path.exists(path):
-                            chrome_path = path
-                            break
-                if chrome_path:
-                    cmd = f'(Get-Item "{chrome_path}").VersionInfo.ProductVersion'
-                # PowerShell 명령 실행
-                result = subprocess.run(['powershell', '-Command', cmd], 
+                cmd = f'(Get-Item "{chrome_path}").VersionInfo.ProductVersion'
+                result = subprocess.run(['powershell', '-Command', cmd],
                                       capture_output=True, text=True, timeout=10)
                 if result.returncode == 0:
                     version = result.stdout.strip()
             except:
                 pass
+    elif chrome_path:
+        # Linux/macOS: "Google Chrome 137.0.7151.68" 형태 출력
+        try:
+            result = subprocess.run([chrome_path, '--version'],
+                                  capture_output=True, text=True, timeout=10)
+            if result.returncode == 0:
+                for token in result.stdout.split():
+                    if token[:1].isdigit() and '.' in token:
+                        version = token
+                        break
+        except:
+            pass
+    return version
+
+def get_chrome_version():
+    """
+    현재 시스템의 Chrome 브라우저 메이저 버전을 반환
+    (자동화 탐지 우회 및 드라이버 호환성 확보 목적)
+    - 실행 파일의 크기/수정 시각이 manifest와 같으면 stat 한 번으로 캐시된 버전 사용
+    - 같은 프로세스 안에서는 메모이제이션
+    """
+    if 'major' in _chrome_version_memo:
+        return _chrome_version_memo['major']
+    try:
+        chrome_path = find_chrome_binary()
+        manifest = load_driver_manifest()
+        stat_key = None
+        if chrome_path:
+            try:
+                st = os.stat(chrome_path)
+                stat_key = [st.st_size, int(st.st_mtime)]
+            except OSError:
+                pass
+
+        cached = manifest['browsers'].get(chrome_path or '')
+        if cached and stat_key and cached.get('stat') == stat_key:
+            version = cached.get('version')
+        else:
+            version = probe_chrome_version(chrome_path)
+            if version and chrome_path and stat_key:
+                manifest['browsers'][chrome_path] = {'version': version, 'stat': stat_key}
+                try:
+                    save_driver_manifest(manifest)
+                except Exception as e:
+                    safe_print(f"ChromeDriver manifest 저장 실패 (무시됨): {e}")
+
         # 버전 문자열에서 메이저 버전 추출
         if version and version.split('.')[0].isdigit():
             major = version.split('.')[0]
             safe_print(f"Chrome 버전 감지: {version} (메이저: {major})")
+            _chrome_version_memo['major'] = major
             return major
         else:
-            safe_print("Chrome 버전 자동 감지 실패, 기본값 137 사용")
-            return "137"
+            safe_print(f"Chrome 버전 자동 감지 실패, 기본값 {DEFAULT_CHROME_MAJOR} 사용")
+            return DEFAULT_CHROME_MAJOR
     except Exception as e:
         safe_print(f"Chrome 버전 확인 오류: {e}")
-        return "137"
+        return DEFAULT_CHROME_MAJOR
+
+def stream_download(url, dest_path, timeout=30, chunk_size=1024 * 256):
+    """
+    URL을 메모리에 모으지 않고 디스크로 바로 스트리밍 저장하면서 SHA-256 계산
+    성공 시 (sha256 hex, 바이트 수) 반환, 실패 시 예외
+    """
+    import requests
+    import hashlib
+    digest = hashlib.sha256()
+    size = 0
+    tmp_path = dest_path + '.part'
+    with requests.get(url, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        expected = response.headers.get('Content-Length')
+        with open(tmp_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if chunk:
+                    f.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+    if expected and expected.isdigit() and int(expected) != size:
+        os.remove(tmp_path)
+        raise IOError(f"다운로드 크기 불일치: {size} != {expected}")
+    os.replace(tmp_path, dest_path)
+    return digest.hexdigest(), size
 
 def download_compatible_chromedriver(chrome_version):
     """
     감지된 Chrome 버전에 맞는 ChromeDriver를 자동 다운로드
     (버전 불일치로 인한 자동화 실패 방지)
+    - 메이저 버전 + 플랫폼별로 chromedriver/manifest.json 에 기록하고 재사용
+    - 캐시 적중 시 네트워크 요청 없이 stat 한 번으로 경로 반환
+      (수정 시각이 기록과 다르면 실행 파일 SHA-256을 다시 계산해 무결성 확인)
     """
     try:
-        import requests
         import zipfile
-        import io
         if not chrome_version or not chrome_version.isdigit():
-            safe_print("chrome_version이 비어있거나 숫자가 아님, 기본값 137 사용")
-            chrome_version = "137"
+            safe_print(f"chrome_version이 비어있거나 숫자가 아님, 기본값 {DEFAULT_CHROME_MAJOR} 사용")
+            chrome_version = DEFAULT_CHROME_MAJOR
+        driver_platform = get_driver_platform()
+        cache_key = f"{chrome_version}/{driver_platform}"
+        exe_name = "chromedriver.exe" if driver_platform.startswith('win') else "chromedriver"
+
+        # 이미 다운로드된 호환 버전이 있는지 확인 (stat 한 번)
+        manifest = load_driver_manifest()
+        entry = manifest['drivers'].get(cache_key)
+        if entry:
+            try:
+                st = os.stat(entry['path'])
+                valid = st.st_size == entry.get('size')
+                if valid and st.st_mtime_ns != entry.get('mtime_ns'):
+                    # 파일이 건드려졌으면 내용 해시로 확인 후 수정 시각만 갱신
+                    # (해시가 없는 이전 manifest 항목은 현재 파일의 해시를 기록)
+                    digest = file_sha256(entry['path'])
+                    valid = digest == entry.setdefault('sha256', digest)
+                    if valid:
+                        entry['mtime_ns'] = st.st_mtime_ns
+                        save_driver_manifest(manifest)
+                if valid:
+                    safe_print(f"캐시된 ChromeDriver 사용: {entry['driver_version']} ({cache_key})")
+                    return entry['path']
+            except OSError:
+                pass
+            safe_print("캐시된 ChromeDriver가 없거나 손상됨, 다시 다운로드")
+
+        import requests
         safe_print(f"Chrome {chrome_version} 버전에 호환되는 ChromeDriver 다운로드 중...")
         api_url = f"https://googlechromelabs.github.io/chrome-for-testing/LATEST_RELEASE_{chrome_version}"
         try:
@@ -185,51 +510,511 @@ def download_compatible_chromedriver(chrome_version):
             safe_print(f"API 요청 실패, 기본 ChromeDriver 버전 사용: {driver_version}")
         
         # ChromeDriver 다운로드 URL
-        download_url = f"https://storage.googleapis.com/chrome-for-testing-public/{driver_version}/win64/chromedriver-win64.zip"
+        download_url = (f"https://storage.googleapis.com/chrome-for-testing-public/{driver_version}/"
+                        f"{driver_platform}/chromedriver-{driver_platform}.zip")
         
-        # 다운로드 디렉토리 생성
-        driver_dir = os.path.join(os.getcwd(), "chromedriver")
-        os.makedirs(driver_dir, exist_ok=True)
+        # 버전/플랫폼별 디렉토리 생성
+        version_dir = os.path.join(CHROMEDRIVER_DIR, driver_version, driver_platform)
+        os.makedirs(version_dir, exist_ok=True)
+        driver_path = os.path.join(version_dir, exe_name)
+        zip_path = os.path.join(version_dir, f"chromedriver-{driver_platform}.zip")
         
-        driver_path = os.path.join(driver_dir, "chromedriver.exe")
-        
-        # 이미 다운로드된 버전이 있는지 확인
-        if os.path.exists(driver_path):
-            safe_print("이미 다운로드된 ChromeDriver 사용")
-            return driver_path
-        
-        # ChromeDriver 다운로드
+        # ChromeDriver 다운로드 (디스크로 스트리밍)
         safe_print("ChromeDriver 다운로드 중...")
-        response = requests.get(download_url, timeout=30)
+        try:
+            sha256, zip_size = stream_download(download_url, zip_path)
+        except Exception as e:
+            safe_print(f"ChromeDriver 다운로드 실패: {e}")
+            return None
+        safe_print(f"다운로드 완료: {zip_size:,} bytes, sha256={sha256[:16]}...")
         
-        if response.status_code == 200:
-            # ZIP 파일 추출
-            with zipfile.ZipFile(io.BytesIO(response.content)) as zip_file:
-                # chromedriver-win64/chromedriver.exe 추출
+        # ZIP 파일에서 chromedriver 실행 파일만 추출
+        try:
+            with zipfile.ZipFile(zip_path) as zip_file:
                 for file_info in zip_file.filelist:
-                    if file_info.filename.endswith('chromedriver.exe'):
+                    if os.path.basename(file_info.filename) == exe_name:
                         with zip_file.open(file_info) as source, open(driver_path, 'wb') as target:
-                            target.write(source.read())
+                            shutil.copyfileobj(source, target)
                         break
-            
-            safe_print(f"ChromeDriver 다운로드 완료: {driver_path}")
-            return driver_path
-        else:
-            safe_print(f"ChromeDriver 다운로드 실패: HTTP {response.status_code}")
-            return None
+                else:
+                    safe_print(f"ZIP 안에서 {exe_name}을 찾을 수 없음")
+                    return None
+        finally:
+            try:
+                os.remove(zip_path)
+            except OSError:
+                pass
+        if not driver_path.endswith('.exe'):
+            os.chmod(driver_path, 0o755)
+
+        driver_stat = os.stat(driver_path)
+        manifest = load_driver_manifest()
+        manifest['drivers'][cache_key] = {
+            'driver_version': driver_version,
+            'path': driver_path,
+            'size': driver_stat.st_size,
+            'mtime_ns': driver_stat.st_mtime_ns,
+            'sha256': file_sha256(driver_path),  # 실행 파일 무결성 확인용
+            'zip_sha256': sha256,
+            'downloaded_at': int(time.time()),
+        }
+        save_driver_manifest(manifest)
+        
+        safe_print(f"ChromeDriver 다운로드 완료: {driver_path}")
+        return driver_path
             
     except Exception as e:
         safe_print(f"ChromeDriver 다운로드 오류: {e}")
         return None
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-import undetected_chromedriver as uc
+# selenium / undetected_chromedriver 는 임포트 비용이 크므로
+# 실제로 브라우저가 필요할 때 load_browser_modules()에서 로드
+webdriver = None
+By = None
+Keys = None
+Options = None
+Service = None
+uc = None
+
+def load_browser_modules():
+    """selenium / undetected_chromedriver 지연 로드 (최초 1회만 실제 임포트)"""
+    global webdriver, By, Keys, Options, Service, uc
+    if uc is not None:
+        return
+    from selenium import webdriver as _webdriver
+    from selenium.webdriver.common.by import By as _By
+    from selenium.webdriver.common.keys import Keys as _Keys
+    from selenium.webdriver.chrome.options import Options as _Options
+    from selenium.webdriver.chrome.service import Service as _Service
+    import undetected_chromedriver as _uc
+    webdriver, By, Keys = _webdriver, _By, _Keys
+    Options, Service, uc = _Options, _Service, _uc
+
+# --import-profile 에서 측정할 무거운 모듈 (실행 경로에서 실제로 임포트되는 순서)
+PROFILED_MODULES = [
+    'requests',
+    'selenium.webdriver',
+    'undetected_chromedriver',
+    'google.oauth2.credentials',
+    'google.auth.transport.requests',
+    'google_auth_oauthlib.flow',
+    'googleapiclient.discovery',
+    'googleapiclient.http',
+]
+
+def run_import_profile():
+    """
+    모듈별 임포트 시간과 스크립트 시작 시간을 측정해 출력
+    공통 의존성은 먼저 임포트한 모듈 쪽에 합산됨
+    """
+    import importlib
+    startup = time.perf_counter() - _SCRIPT_T0
+    rows = []
+    for name in PROFILED_MODULES:
+        already = name in sys.modules
+        before = len(sys.modules)
+        t0 = time.perf_counter()
+        error = None
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            error = str(e)
+        rows.append({
+            'module': name,
+            'seconds': round(time.perf_counter() - t0, 4),
+            'new_modules': len(sys.modules) - before,
+            'already_loaded': already,
+            'error': error,
+        })
+    total = sum(row['seconds'] for row in rows)
+    safe_print(f"스크립트 로드 ~ main 진입: {startup * 1000:.1f} ms")
+    for row in rows:
+        status = f"오류: {row['error']}" if row['error'] else f"+{row['new_modules']} 모듈"
+        safe_print(f"  {row['module']:<32} {row['seconds'] * 1000:8.1f} ms  {status}")
+    safe_print(f"무거운 모듈 임포트 합계: {total * 1000:.1f} ms")
+    print(json.dumps({'startup_seconds': round(startup, 4), 'imports': rows,
+                      'import_total_seconds': round(total, 4)}, ensure_ascii=False))
+
+# 브라우저 흐름의 시작 페이지 (오프라인 벤치마크에서는 로컬 모의 서버 주소로 교체)
+YOUTUBE_HOME_URL = "https://www.youtube.com/"
+STUDIO_COMMUNITY_URL = "https://studio.youtube.com/channel/UC/community"
+
+# 조건 기반 대기 엔진
+# 고정 time.sleep 대신 각 단계가 사후 조건(요소 표시, URL 변경, 다이얼로그 열림, 업로드 완료 등)을
+# 선언하고, 조건이 만족되는 즉시 다음 단계로 진행
+WAIT_POLL_INTERVAL = 0.1
+
+# 단계별 최대 대기 시간(초)
+STEP_TIMEOUTS = {
+    'default': 10,
+    'page_load': 20,
+    'login_button': 10,
+    'login_page': 10,
+    'email_input': 10,
+    'password_page': 15,
+    'password_input': 10,
+    'password_typed': 3,
+    'manual_password': 10,
+    'login_result': 30,
+    'manual_login': 60,
+    'create_button': 10,
+    'create_menu': 10,
+    'post_dialog': 10,
+    'text_area': 5,
+    'text_applied': 3,
+    'media_button': 5,
+    'publish_button': 5,
+    'media_dialog': 10,
+    'picker_results': 10,
+    'picker_closed': 10,
+    'upload_finished': 30,
+    'publish_done': 15,
+    'manual_publish': 30,
+}
+
+# 후보 선택자 목록을 한 번의 execute_script로 순서대로 검사하는 스크립트
+# (find_elements와 달리 implicit wait에 걸리지 않고, 후보 수와 관계없이 왕복 1회)
+# 반환: [요소, 이긴 후보 인덱스] 또는 null
+JS_PROBE_SELECTORS = """
+var candidates = arguments[0];
+var opts = arguments[1];
+function usable(el) {
+    if (!opts.visible) return true;
+    var rect = el.getBoundingClientRect();
+    var style = window.getComputedStyle(el);
+    return rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden'
+        && style.display !== 'none' && !el.disabled && el.getAttribute('aria-disabled') !== 'true';
+}
+function resolve(el) {
+    // div 등 래퍼가 선택된 경우 내부의 실제 input 사용
+    if (!opts.resolveInput || el.tagName === 'INPUT' || el.tagName === 'TEXTAREA') return el;
+    var inner = el.querySelectorAll('input, textarea');
+    for (var k = 0; k < inner.length; k++) {
+        if (usable(inner[k])) return inner[k];
+    }
+    return null;
+}
+function rejected(el) {
+    if (!opts.reject || !opts.reject.length) return false;
+    var html = (el.outerHTML || '').toLowerCase();
+    for (var r = 0; r < opts.reject.length; r++) {
+        if (html.indexOf(opts.reject[r]) !== -1) return true;
+    }
+    return false;
+}
+for (var i = 0; i < candidates.length; i++) {
+    var strategy = candidates[i][0], value = candidates[i][1], nodes = [];
+    try {
+        if (strategy === 'xpath') {
+            var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (var s = 0; s < snapshot.snapshotLength; s++) nodes.push(snapshot.snapshotItem(s));
+        } else if (strategy === 'css selector') {
+            nodes = document.querySelectorAll(value);
+        } else if (strategy === 'id') {
+            var byId = document.getElementById(value);
+            if (byId) nodes = [byId];
+        } else if (strategy === 'name') {
+            nodes = document.getElementsByName(value);
+        } else if (strategy === 'class name') {
+            nodes = document.getElementsByClassName(value);
+        } else if (strategy === 'tag name') {
+            nodes = document.getElementsByTagName(value);
+        }
+    } catch (e) {
+        continue;
+    }
+    for (var j = 0; j < nodes.length; j++) {
+        var el = resolve(nodes[j]);
+        if (el && usable(el) && !rejected(el)) return [el, i];
+    }
+}
+return null;
+"""
+
+# 단계별로 이긴 선택자를 기록해 다음 실행부터 최근 성공 순으로 먼저 시도
+SELECTOR_STATS_PATH = os.path.join(os.getcwd(), 'selector_stats.json')
+SELECTOR_HALF_LIFE_DAYS = 7      # 이 기간마다 과거 성공 횟수의 가중치가 절반으로 감소
+SELECTOR_MAX_AGE_DAYS = 30       # 이 기간 동안 성공하지 않은 기록은 삭제
+
+_selector_stats = None  # {rank_key: {candidate_key: {'hits': int, 'last_success': float}}}
+
+def candidate_key(candidate):
+    """선택자 후보를 통계 파일 키 문자열로 변환"""
+    if isinstance(candidate, str):
+        return candidate
+    return f"{candidate[0]}={candidate[1]}"
+
+def load_selector_stats():
+    """선택자 통계 로드 (프로세스당 1회), 오래된 기록은 제거"""
+    global _selector_stats
+    if _selector_stats is not None:
+        return _selector_stats
+    try:
+        with open(SELECTOR_STATS_PATH, 'r', encoding='utf-8') as f:
+            stats = json.load(f)
+        if not isinstance(stats, dict):
+            stats = {}
+    except Exception:
+        stats = {}
+    cutoff = time.time() - SELECTOR_MAX_AGE_DAYS * 86400
+    for rank_key in list(stats):
+        entries = stats[rank_key]
+        for key in list(entries):
+            if entries[key].get('last_success', 0) < cutoff:
+                del entries[key]
+        if not entries:
+            del stats[rank_key]
+    _selector_stats = stats
+    return stats
+
+def save_selector_stats():
+    """선택자 통계 저장 (임시 파일에 쓴 뒤 교체)"""
+    if _selector_stats is None:
+        return
+    try:
+        tmp_path = SELECTOR_STATS_PATH + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(_selector_stats, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, SELECTOR_STATS_PATH)
+    except Exception as e:
+        safe_print(f"선택자 통계 저장 실패 (무시됨): {e}")
+
+def rank_candidates(rank_key, candidates):
+    """
+    최근 성공 기록 순으로 후보 정렬
+    점수 = 성공 횟수 × 0.5^(마지막 성공 후 경과일 / 반감기), 기록 없는 후보는 원래 순서로 뒤에 배치
+    """
+    entries = load_selector_stats().get(rank_key, {})
+    if not entries:
+        return list(candidates)
+    now = time.time()
+
+    def score(candidate):
+        entry = entries.get(candidate_key(candidate))
+        if not entry:
+            return 0.0
+        age_days = (now - entry.get('last_success', now)) / 86400
+        return entry.get('hits', 0) * 0.5 ** (age_days / SELECTOR_HALF_LIFE_DAYS)
+
+    return sorted(candidates, key=score, reverse=True)  # 같은 점수는 원래 순서 유지
+
+def record_selector_win(rank_key, candidate):
+    """이긴 선택자의 성공 횟수/시각 기록"""
+    entries = load_selector_stats().setdefault(rank_key, {})
+    entry = entries.setdefault(candidate_key(candidate), {'hits': 0, 'last_success': 0})
+    entry['hits'] += 1
+    entry['last_success'] = time.time()
+    save_selector_stats()
+    emit_event('selector_win', step=rank_key, selector=candidate_key(candidate))
+
+def normalize_candidates(candidates):
+    """XPath 문자열 또는 (By, 값) 튜플 목록을 [[전략, 값], ...] 형태로 변환"""
+    return [['xpath', c] if isinstance(c, str) else [c[0], c[1]] for c in candidates]
+
+def probe_selectors(driver, candidates, visible=True, resolve_input=False, reject=None, rank_key=None):
+    """
+    후보 선택자 목록을 한 번의 execute_script로 순서대로 검사
+    - visible: 보이고 활성화된 요소만 인정 (element_to_be_clickable과 같은 기준)
+    - resolve_input: div 등 래퍼가 선택되면 내부의 사용 가능한 input/textarea 반환
+    - reject: outerHTML(소문자)에 포함되면 제외할 문자열 목록
+    - rank_key: 지정 시 학습된 성공 순서로 먼저 시도하고 이긴 후보를 기록
+    반환: (요소, 이긴 후보의 원래 목록 인덱스), 없으면 (None, None)
+    """
+    ordered = rank_candidates(rank_key, candidates) if rank_key else list(candidates)
+    found = driver.execute_script(JS_PROBE_SELECTORS, normalize_candidates(ordered), {
+        'visible': visible,
+        'resolveInput': resolve_input,
+        'reject': [word.lower() for word in (reject or [])],
+    })
+    if not found:
+        return None, None
+    winner = ordered[found[1]]
+    if rank_key:
+        record_selector_win(rank_key, winner)
+    return found[0], list(candidates).index(winner)
+
+def selector_probe(candidates, **kwargs):
+    """wait_for용 조건: 후보 중 하나가 나타나면 (요소, 인덱스) 반환"""
+    def condition(d):
+        element, index = probe_selectors(d, candidates, **kwargs)
+        return (element, index) if element is not None else None
+    return condition
+
+# 버튼 후보의 텍스트/라벨/표시/활성 상태를 브라우저 안에서 한 번에 수집
+JS_SCAN_BUTTONS = """
+var nodes = document.querySelectorAll(arguments[0]);
+var result = [];
+for (var i = 0; i < nodes.length; i++) {
+    var el = nodes[i];
+    var rect = el.getBoundingClientRect();
+    var style = window.getComputedStyle(el);
+    var visible = rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+    result.push([
+        el,
+        (el.innerText || '').trim(),
+        el.getAttribute('aria-label') || '',
+        visible,
+        !el.disabled && el.getAttribute('aria-disabled') !== 'true'
+    ]);
+}
+return result;
+"""
+
+def scan_buttons(driver, selector="button, [role='button']"):
+    """
+    페이지의 버튼 후보 정보를 한 번의 호출로 수집 (요소마다 WebDriver 왕복하지 않음)
+    반환: [{'element', 'text', 'aria_label', 'visible', 'enabled'}, ...]
+    """
+    rows = driver.execute_script(JS_SCAN_BUTTONS, selector) or []
+    return [
+        {'element': row[0], 'text': row[1], 'aria_label': row[2], 'visible': row[3], 'enabled': row[4]}
+        for row in rows
+    ]
+
+# 게시물 작성 단계별 선택자 (운영 코드와 DOM 스냅샷 재생 하네스가 같은 목록을 사용)
+TEXT_AREA_SELECTORS = [
+    "//div[@contenteditable='true']",
+]
+IMAGE_BUTTON_SELECTORS = [
+    "//button[@aria-label='이미지 추가']",
+    "//button[.//span[text()='이미지']]",
+    "//button[contains(., '이미지')]"
+]
+IMAGE_INPUT_SELECTORS = [
+    "//input[@type='file'][contains(@accept, 'image')]",
+    "//input[@type='file'][contains(@name, 'image') or contains(@name, 'photo') or contains(@name, 'Filedata')]",
+    "//input[@type='file'][not(@accept) or @accept='']",
+]
+IMAGE_PREVIEW_SELECTORS = [
+    "//img[contains(@src, 'blob:')]",  # blob URL 이미지
+    "//img[contains(@src, 'data:image')]",  # data URL 이미지
+    "//*[contains(@class, 'preview')]//img",  # 미리보기 이미지
+    "//*[contains(@class, 'thumbnail')]//img",  # 썸네일 이미지
+    "//*[contains(@class, 'uploaded')]//img",  # 업로드된 이미지
+    "//*[contains(@class, 'image')]//img",  # 일반 이미지
+]
+PUBLISH_SELECTORS = [
+    # 게시물 작성 다이얼로그 내부의 게시 버튼
+    # aria-label 기반 (하지만 동영상 관련 제외)
+    "//*[@aria-label and contains(@aria-label, '게시') and not(contains(@aria-label, '동영상'))]"
+]
+PUBLISH_REJECT = ['watch?v=', 'video', 'player']
+
+PICKER_IFRAME_XPATH = "//iframe[contains(@src, 'docs.google.com/picker')]"
+
+def wait_for(driver, condition, step='default', timeout=None, poll=WAIT_POLL_INTERVAL):
+    """
+    condition(driver)가 참 값을 반환할 때까지 폴링하고 그 값을 반환
+    - step: STEP_TIMEOUTS의 단계 이름 (timeout 미지정 시 해당 단계 예산 사용)
+    - 시간 초과 시 None 반환
+    condition에서 발생한 예외는 '아직 조건 불충족'으로 간주
+    """
+    budget = timeout if timeout is not None else STEP_TIMEOUTS.get(step, STEP_TIMEOUTS['default'])
+    deadline = time.monotonic() + budget
+    while True:
+        try:
+            value = condition(driver)
+            if value:
+                return value
+        except Exception:
+            pass
+        if time.monotonic() >= deadline:
+            safe_print(f"⏱ 대기 시간 초과: {step} ({budget}초)")
+            return None
+        time.sleep(poll)
+
+def element_present(xpath):
+    """XPath 요소가 DOM에 존재 (해당 요소 반환)"""
+    return lambda d: probe_selectors(d, [xpath], visible=False)[0]
+
+def element_visible(xpath):
+    """XPath 요소가 보이고 활성화됨 (해당 요소 반환)"""
+    return lambda d: probe_selectors(d, [xpath])[0]
+
+def element_gone(xpath):
+    """XPath 요소가 사라지거나 보이지 않음"""
+    return lambda d: probe_selectors(d, [xpath])[0] is None
+
+# 이미 찾은 요소가 문서에서 떨어졌거나(stale) 숨겨졌거나 비활성화되었는지 검사
+JS_ELEMENT_INACTIVE = """
+var el = arguments[0];
+return !el.isConnected || el.offsetParent === null || el.disabled
+    || el.getAttribute('aria-disabled') === 'true';
+"""
+
+def element_inactive(element):
+    """
+    이미 찾은 요소가 DOM에서 제거(stale)되었거나 숨겨지거나 비활성화됨
+    (제거된 요소는 execute_script 인자로 넘기는 순간 StaleElementReferenceException이 나므로 완료로 판정)
+    """
+    from selenium.common.exceptions import StaleElementReferenceException
+
+    def condition(d):
+        try:
+            return bool(d.execute_script(JS_ELEMENT_INACTIVE, element))
+        except StaleElementReferenceException:
+            return True
+    return condition
+
+def url_changed(old_url):
+    """현재 URL이 old_url과 달라짐 (새 URL 반환)"""
+    def condition(d):
+        url = d.current_url
+        return url if url != old_url else None
+    return condition
+
+def url_contains(*parts):
+    """현재 URL에 parts 중 하나가 포함됨"""
+    def condition(d):
+        url = d.current_url
+        return url if any(part in url for part in parts) else None
+    return condition
+
+def url_excludes(*parts):
+    """현재 URL에 parts가 하나도 포함되지 않음 (예: 로그인 페이지를 벗어남)"""
+    def condition(d):
+        url = d.current_url
+        return url if not any(part in url for part in parts) else None
+    return condition
+
+def document_ready():
+    """document.readyState == 'complete'"""
+    return lambda d: d.execute_script("return document.readyState") == "complete"
+
+def dialog_open():
+    """게시물 작성/첨부 다이얼로그가 열림"""
+    return element_visible("//*[@role='dialog'] | //tp-yt-paper-dialog | //ytd-backstage-post-dialog-renderer")
+
+def upload_finished():
+    """
+    이미지/영상 첨부 미리보기가 나타나고 진행 표시가 사라짐
+    (blob/data 미리보기 또는 파일 input에 파일이 선택된 상태)
+    """
+    return lambda d: d.execute_script("""
+        var busy = document.querySelector('[class*="uploading"], [class*="progress"][aria-valuenow]:not([aria-valuenow="100"])');
+        if (busy && busy.offsetParent !== null) return false;
+        if (document.querySelector('img[src^="blob:"], img[src^="data:image"]')) return true;
+        var inputs = document.querySelectorAll('input[type=file]');
+        for (var i = 0; i < inputs.length; i++) {
+            if (inputs[i].files && inputs[i].files.length > 0) return true;
+        }
+        return false;
+    """)
+
+def any_of(*conditions):
+    """조건 중 하나라도 만족하면 그 값을 반환"""
+    def condition(d):
+        for cond in conditions:
+            try:
+                value = cond(d)
+            except Exception:
+                continue
+            if value:
+                return value
+        return None
+    return condition
+
+_owned_temp_dirs = set()  # 이 프로세스가 만든 임시 Chrome 사용자 데이터 디렉토리
 
 def clean_chrome_cache():
     """
@@ -243,7 +1028,6 @@ def clean_chrome_cache():
         if os.path.exists(user_data_dir):
             safe_print("기존 Chrome 캐시 정리 중...")
             shutil.rmtree(user_data_dir, ignore_errors=True)
-            time.sleep(1)
             safe_print("Chrome 캐시 정리 완료")
         else:
             safe_print("정리할 Chrome 캐시 없음")
@@ -251,23 +1035,123 @@ def clean_chrome_cache():
     except Exception as e:
         safe_print(f"캐시 정리 중 오류 (무시됨): {e}")
 
-def setup_driver(headless=False, speed='normal', clean_cache=True):
+# 계정별 영구 프로필 저장소 (--persistent-profile 사용 시)
+CHROME_PROFILE_DIR = os.path.join(os.getcwd(), 'chrome_profiles')
+PROFILE_MAX_TOTAL_MB = 2048        # 전체 프로필 저장소 최대 크기
+PROFILE_MAX_AGE_DAYS = 14          # 이 기간 동안 사용되지 않은 프로필은 삭제
+PROFILE_DISK_CACHE_MB = 256        # 프로필 하나의 HTTP 디스크 캐시 상한
+PROFILE_MARKER = '.last_used'
+
+def get_profile_dir(account):
+    """계정 이메일을 파일명으로 안전하게 바꾼 프로필 경로"""
+    safe_name = ''.join(c if c.isalnum() or c in '._-' else '_' for c in account.replace('@', '_at_'))
+    return os.path.join(CHROME_PROFILE_DIR, safe_name)
+
+def get_dir_size(path):
+    """디렉토리 전체 크기 (bytes)"""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+def is_profile_locked(profile_dir):
+    """다른 Chrome 프로세스가 이미 사용 중인 프로필인지 확인"""
+    for lock_name in ('SingletonLock', 'lockfile'):
+        lock_path = os.path.join(profile_dir, lock_name)
+        if not os.path.lexists(lock_path):
+            continue
+        if lock_name == 'SingletonLock':
+            # Linux/macOS: "호스트명-PID" 를 가리키는 심볼릭 링크, 프로세스가 없으면 비정상 종료 흔적
+            try:
+                pid = int(os.readlink(lock_path).rsplit('-', 1)[-1])
+                os.kill(pid, 0)
+                return True
+            except (OSError, ValueError):
+                pass
+        # 비정상 종료로 남은 잠금 파일 제거 (Windows에서 사용 중인 lockfile은 삭제되지 않음)
+        try:
+            os.remove(lock_path)
+        except OSError:
+            return True
+    return False
+
+def evict_stale_profiles(keep=None, max_total_mb=PROFILE_MAX_TOTAL_MB, max_age_days=PROFILE_MAX_AGE_DAYS):
+    """
+    오래된 프로필 삭제 (LRU)
+    - max_age_days 이상 사용되지 않은 프로필 삭제
+    - 전체 크기가 max_total_mb를 넘으면 가장 오래 사용하지 않은 프로필부터 삭제
+    keep 경로(현재 사용할 프로필)와 사용 중인 프로필은 삭제하지 않음
+    """
+    if not os.path.isdir(CHROME_PROFILE_DIR):
+        return
+    now = time.time()
+    profiles = []
+    for name in os.listdir(CHROME_PROFILE_DIR):
+        path = os.path.join(CHROME_PROFILE_DIR, name)
+        if not os.path.isdir(path):
+            continue
+        marker = os.path.join(path, PROFILE_MARKER)
+        last_used = os.path.getmtime(marker) if os.path.exists(marker) else os.path.getmtime(path)
+        profiles.append([last_used, path, get_dir_size(path)])
+
+    total = sum(size for _, _, size in profiles)
+    for last_used, path, size in sorted(profiles):
+        if path == keep or is_profile_locked(path):
+            continue
+        expired = now - last_used > max_age_days * 86400
+        if expired or total > max_total_mb * 1024 * 1024:
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+            safe_print(f"오래된 Chrome 프로필 정리: {os.path.basename(path)} ({size / 1024 / 1024:.1f} MB)")
+
+def acquire_persistent_profile(account):
+    """
+    계정별 영구 프로필 경로를 준비해 반환
+    다른 프로세스가 사용 중이면 None (임시 프로필로 대체)
+    """
+    profile_dir = get_profile_dir(account)
+    try:
+        evict_stale_profiles(keep=profile_dir)
+        os.makedirs(profile_dir, exist_ok=True)
+        if is_profile_locked(profile_dir):
+            safe_print("영구 프로필이 다른 프로세스에서 사용 중 - 임시 프로필 사용")
+            return None
+        with open(os.path.join(profile_dir, PROFILE_MARKER), 'w') as f:
+            f.write(str(int(time.time())))
+        return profile_dir
+    except Exception as e:
+        safe_print(f"영구 프로필 준비 실패 (임시 프로필 사용): {e}")
+        return None
+
+@timed('setup_driver')
+def setup_driver(headless=False, speed='normal', clean_cache=True, profile_account=None):
     """
     undetected-chromedriver를 이용해 자동화 탐지 우회 브라우저 실행
     - headless: 창 없이 실행할지 여부
     - speed: 'fast'일 경우 이미지 등 비활성화로 속도 향상
-    - clean_cache: 임시 캐시 정리 여부
+    - clean_cache: 임시 캐시 정리 여부 (영구 프로필 사용 시 무시)
+    - profile_account: 지정 시 계정별 영구 프로필 재사용 (HTTP/코드 캐시 유지)
     """
+    load_browser_modules()
     safe_print("undetected-chromedriver 설정 중 (완전한 자동화 탐지 우회)...")
     
+    profile_dir = acquire_persistent_profile(profile_account) if profile_account else None
+
     # 캐시 자동 정리
-    if clean_cache:
+    if clean_cache and not profile_dir:
         clean_chrome_cache()
     
     # Chrome 버전 확인 및 호환 ChromeDriver 다운로드
-    chrome_version = get_chrome_version()
-    safe_print(f"감지된 Chrome 메이저 버전: {chrome_version}")
-    driver_path = download_compatible_chromedriver(chrome_version)
+    with timing_span('driver_resolve') as span:
+        chrome_version = get_chrome_version()
+        safe_print(f"감지된 Chrome 메이저 버전: {chrome_version}")
+        driver_path = download_compatible_chromedriver(chrome_version)
+        if span:
+            span['chrome_major'] = chrome_version
     
     try:
         # undetected-chromedriver 옵션 설정
@@ -316,13 +1200,18 @@ def setup_driver(headless=False, speed='normal', clean_cache=True):
         options.add_argument('--disable-trusted-types-csp')
         options.add_argument('--disable-features=VizDisplayCompositor')
         
-        # 임시 사용자 데이터 디렉토리
-        import tempfile
-        try:
-            temp_dir = tempfile.mkdtemp(prefix='chrome_temp_')
-            safe_print(f"임시 사용자 데이터 디렉토리: {temp_dir}")
-        except Exception as e:
-            safe_print(f"임시 폴더 생성 실패: {e}")
+        # 사용자 데이터 디렉토리 (영구 프로필 또는 임시)
+        if profile_dir:
+            temp_dir = profile_dir
+            options.add_argument(f'--disk-cache-size={PROFILE_DISK_CACHE_MB * 1024 * 1024}')
+            safe_print(f"영구 프로필 사용: {profile_dir}")
+        else:
+            try:
+                temp_dir = tempfile.mkdtemp(prefix='chrome_temp_')
+                _owned_temp_dirs.add(temp_dir)
+                safe_print(f"임시 사용자 데이터 디렉토리: {temp_dir}")
+            except Exception as e:
+                safe_print(f"임시 폴더 생성 실패: {e}")
         # temp_dir = tempfile.mkdtemp(prefix='chrome_temp_')
         # options.add_argument(f'--user-data-dir={temp_dir}')
         # safe_print(f"임시 사용자 데이터 디렉토리: {temp_dir}")
@@ -491,6 +1380,7 @@ def setup_driver(headless=False, speed='normal', clean_cache=True):
             safe_print("Chrome 버전과 ChromeDriver 버전 호환성을 확인하세요.")
             sys.exit(1)
 
+@timed('login_youtube')
 def login_youtube(driver, username, password):
     """
     YouTube 로그인 자동화 (쿠키/세션 재사용, 실패 시 재로그인)
@@ -500,10 +1390,9 @@ def login_youtube(driver, username, password):
     try:
         # YouTube 메인 페이지로 이동
         safe_print("YouTube 메인 페이지 접속...")
-        driver.get("https://www.youtube.com")
-        time.sleep(3)
+        driver.get(YOUTUBE_HOME_URL)
         
-        # 로그인 버튼 찾기
+        # 로그인 버튼 찾기 (버튼이 클릭 가능해지는 것이 페이지 준비 완료 조건)
         safe_print("로그인 버튼 찾는 중...")
         login_selectors = [
             (By.XPATH, "//a[contains(@href, 'accounts.google.com')]"),
@@ -512,16 +1401,9 @@ def login_youtube(driver, username, password):
             (By.CSS_SELECTOR, "a[href*='accounts.google.com']")
         ]
         
-        login_button = None
-        for selector_type, selector_value in login_selectors:
-            try:
-                login_button = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((selector_type, selector_value))
-                )
-                safe_print("로그인 버튼 찾음")
-                break
-            except:
-                continue
+        login_button, winner = wait_for(driver, selector_probe(login_selectors, rank_key='login_button'), step='login_button') or (None, None)
+        if login_button:
+            safe_print(f"로그인 버튼 찾음: {login_selectors[winner][1]}")
         
         if not login_button:
             raise Exception("YouTube 로그인 버튼을 찾을 수 없습니다")
@@ -529,34 +1411,38 @@ def login_youtube(driver, username, password):
         # 로그인 버튼 클릭
         safe_print("로그인 버튼 클릭...")
         login_button.click()
-        time.sleep(3)
         
-        # 이메일 입력
+        # 이메일 입력 (입력란 표시가 로그인 페이지 이동 완료 조건)
         safe_print("이메일 입력 중...")
-        email_input = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.ID, "identifierId"))
-        )
+        email_input, _ = wait_for(driver, selector_probe([(By.ID, "identifierId")], visible=False),
+                                  step='email_input') or (None, None)
+        if not email_input:
+            raise Exception("이메일 입력란을 찾을 수 없습니다")
         email_input.send_keys(username)
         
         # 다음 버튼 클릭
         next_button = driver.find_element(By.ID, "identifierNext")
+        email_url = driver.current_url
         next_button.click()
-        time.sleep(3)
         
-        # 비밀번호 페이지 로딩 대기
+        # 비밀번호 페이지 로딩 대기 (URL 변경 또는 비밀번호 입력란 등장)
         safe_print("비밀번호 페이지 로딩 대기...")
-        time.sleep(2)
+        wait_for(driver, any_of(
+            url_contains('challenge/pwd', '/pwd'),
+            element_present("//input[@type='password']"),
+            url_changed(email_url),
+        ), step='password_page')
         
         # 비밀번호 페이지에서 새로고침
         safe_print("비밀번호 페이지 새로고침...")
         driver.refresh()
-        time.sleep(3)
         
         # 비밀번호 입력 (자동화 탐지 우회 강화)
         safe_print("비밀번호 입력 중 (자동화 탐지 우회 모드)...")
         
-        # 페이지 완전 로딩 대기
-        time.sleep(3)
+        # 페이지 완전 로딩 대기 (문서 로드 + 비밀번호 입력란 표시)
+        wait_for(driver, document_ready(), step='page_load')
+        wait_for(driver, element_visible("//input[@type='password']"), step='password_input')
         
         # 추가 자동화 탐지 우회 스크립트 실행
         driver.execute_script("""
@@ -595,78 +1481,38 @@ def login_youtube(driver, username, password):
             (By.XPATH, "//input[@aria-label='비밀번호 입력']")
         ]
         
-        password_input = None
         debug_log("비밀번호 필드 찾기 시작...")
         
-        for i, (selector_type, selector_value) in enumerate(password_selectors):
-            try:
-                debug_log(f"선택자 {i+1} 시도: {selector_value}")
-                elements = driver.find_elements(selector_type, selector_value)
-                debug_log(f"선택자 {i+1}로 찾은 요소 개수: {len(elements)}")
-                
-                for j, element in enumerate(elements):
-                    debug_log(f"요소 {j+1} 검사 중...")
-                    debug_element_info(driver, element, f"비밀번호 후보 {j+1}")
-                    
-                    # div 요소인 경우 내부의 실제 input 찾기
-                    if element.tag_name.lower() == 'div':
-                        debug_log(f"div 요소 발견 - 내부 input 요소 검색...")
-                        try:
-                            # div 내부의 input 요소 찾기
-                            inner_inputs = element.find_elements(By.XPATH, ".//input")
-                            debug_log(f"div 내부 input 요소 개수: {len(inner_inputs)}")
-                            
-                            for k, inner_input in enumerate(inner_inputs):
-                                debug_log(f"내부 input {k+1} 검사...")
-                                debug_element_info(driver, inner_input, f"내부 input {k+1}")
-                                
-                                if inner_input.is_displayed() and inner_input.is_enabled():
-                                    password_input = inner_input
-                                    debug_log(f"사용 가능한 실제 input 발견: div 내부 input {k+1}", "SUCCESS")
-                                    break
-                                    
-                        except Exception as e:
-                            debug_log(f"div 내부 input 검색 실패: {e}")
-                    
-                    # input 요소인 경우 그대로 사용
-                    elif element.tag_name.lower() == 'input':
-                        if element.is_displayed() and element.is_enabled():
-                            password_input = element
-                            debug_log(f"사용 가능한 input 요소 발견: 선택자 {i+1}, 요소 {j+1}", "SUCCESS")
-                            break
-                    
-                    if password_input:
-                        break
-                
-                if password_input:
-                    break
-                    
-            except Exception as e:
-                debug_log(f"선택자 {i+1} 실패: {e}")
-                continue
+        # 모든 후보를 한 번의 호출로 검사 (div가 선택되면 내부의 실제 input 사용)
+        password_input, winner = probe_selectors(driver, password_selectors, resolve_input=True,
+                                                   rank_key='password_input')
+        if password_input:
+            debug_log("사용 가능한 input 요소 발견: 선택자 %s (%s)", winner+1, password_selectors[winner][1], level="SUCCESS")
+            debug_element_info(driver, password_input, "비밀번호 입력란")
         
         if not password_input:
-            debug_log("비밀번호 필드를 찾을 수 없음 - 자동화 탐지 가능성 높음", "ERROR")
+            debug_log("비밀번호 필드를 찾을 수 없음 - 자동화 탐지 가능성 높음", level="ERROR")
             
-            # 페이지 소스에서 password 관련 요소 찾기
-            debug_log("페이지 소스에서 password 관련 요소 검색...")
-            try:
-                page_source = driver.page_source
-                import re
-                password_patterns = [
-                    r'<input[^>]*password[^>]*>',
-                    r'<input[^>]*type=["\']password["\'][^>]*>',
-                    r'<input[^>]*name=["\'].*password.*["\'][^>]*>'
-                ]
+            # 페이지 소스에서 password 관련 요소 찾기 (디버그 모드에서만)
+            if log_enabled('DEBUG'):
+                debug_log("페이지 소스에서 password 관련 요소 검색...", level="DEBUG")
+                try:
+                    page_source = driver.page_source
+                    import re
+                    password_patterns = [
+                        r'<input[^>]*password[^>]*>',
+                        r'<input[^>]*type=["\']password["\'][^>]*>',
+                        r'<input[^>]*name=["\'].*password.*["\'][^>]*>'
+                    ]
                 
-                for pattern in password_patterns:
-                    matches = re.findall(pattern, page_source, re.IGNORECASE)
-                    debug_log(f"패턴 '{pattern}' 매치 개수: {len(matches)}")
-                    for match in matches[:2]:  # 최대 2개만 출력
-                        debug_log(f"매치: {match}")
+                    for pattern in password_patterns:
+                        matches = re.findall(pattern, page_source, re.IGNORECASE)
+                        debug_log("패턴 '%s' 매치 개수: %s", pattern, len(matches), level="DEBUG")
+                        for match in matches[:2]:  # 최대 2개만 출력
+                            debug_log("매치: %s", match, level="DEBUG")
                         
-            except Exception as e:
-                debug_log(f"페이지 소스 검색 실패: {e}", "ERROR")
+                except Exception as e:
+                    debug_log("페이지 소스 검색 실패: %s", e, level="ERROR")
             
             safe_print("수동 로그인 모드로 전환...")
             
@@ -677,17 +1523,10 @@ def login_youtube(driver, username, password):
             safe_print("브라우저에서 직접 비밀번호를 입력해주세요.")
             safe_print("60초 후 자동으로 계속됩니다...")
             
-            # 60초 대기하면서 로그인 상태 확인
-            for i in range(60):
-                time.sleep(1)
-                current_url = driver.current_url
-                
-                if not any(x in current_url for x in ["accounts.google.com", "signin", "challenge"]):
-                    safe_print("수동 로그인 성공!")
-                    return True
-                    
-                if i % 10 == 0 and i > 0:
-                    safe_print(f"{60-i}초 남음...")
+            # 최대 60초 대기하면서 로그인 페이지를 벗어나는지 확인
+            if wait_for(driver, url_excludes("accounts.google.com", "signin", "challenge"), step='manual_login'):
+                safe_print("수동 로그인 성공!")
+                return True
             
             safe_print("수동 로그인 시간 초과")
             return False
@@ -697,7 +1536,6 @@ def login_youtube(driver, username, password):
         
         # 스크롤 및 마우스 움직임
         driver.execute_script("window.scrollTo(0, arguments[0].offsetTop - 100);", password_input)
-        time.sleep(0.5)
         
         # 다양한 방법으로 비밀번호 입력 시도
         input_success = False
@@ -711,49 +1549,45 @@ def login_youtube(driver, username, password):
             
             # 필드 완전히 활성화
             debug_log("필드 스크롤 및 포커스...")
-            driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", password_input)
-            time.sleep(1)
+            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", password_input)
             
             # 실제 사용자처럼 클릭
             debug_log("ActionChains로 클릭...")
             actions = ActionChains(driver)
             actions.move_to_element(password_input).pause(0.5).click().pause(0.2).perform()
             
-            # 현재 값 확인
-            current_value = password_input.get_attribute('value')
-            debug_log(f"클릭 후 현재 값: '{current_value}'")
+            # 현재 값 확인 (디버그 모드에서만 조회)
+            debug_log(lambda: f"클릭 후 현재 값 길이: {len(password_input.get_attribute('value') or '')}", level="DEBUG")
             
             # 기존 내용 지우기
             debug_log("기존 내용 지우기...")
             password_input.clear()
-            time.sleep(0.3)
+            wait_for(driver, lambda d: not password_input.get_attribute('value'), step='password_typed')
             
-            current_value = password_input.get_attribute('value')
-            debug_log(f"clear 후 현재 값: '{current_value}'")
+            debug_log(lambda: f"clear 후 현재 값 길이: {len(password_input.get_attribute('value') or '')}", level="DEBUG")
             
             # 매우 천천히 자연스럽게 입력
-            debug_log(f"비밀번호 입력 시작... (총 {len(password)}글자)")
+            debug_log("비밀번호 입력 시작... (총 %s글자)", len(password))
             for i, char in enumerate(password):
                 password_input.send_keys(char)
-                current_value = password_input.get_attribute('value')
-                debug_log(f"입력 {i+1}/{len(password)}: 현재 값 길이 {len(current_value)}")
-                time.sleep(0.15 + (0.05 * (i % 3)))  # 랜덤한 타이핑 속도
+                debug_log(lambda: f"입력 {i+1}/{len(password)}: 현재 값 길이 {len(password_input.get_attribute('value') or '')}", level="DEBUG")
+                time.sleep(0.15 + (0.05 * (i % 3)))  # 랜덤한 타이핑 속도 (자동화 탐지 우회용 리듬)
             
-            # 최종 값 확인
-            final_value = password_input.get_attribute('value')
-            debug_log(f"입력 완료 - 최종 값 길이: {len(final_value)}, 예상 길이: {len(password)}")
-            debug_log(f"입력 성공 여부: {len(final_value) == len(password)}")
-            
-            time.sleep(0.5)
+            # 최종 값 확인 (입력 이벤트가 반영될 때까지 대기)
+            wait_for(driver, lambda d: len(password_input.get_attribute('value') or '') == len(password),
+                     step='password_typed')
+            final_value = password_input.get_attribute('value') or ''
+            debug_log("입력 완료 - 최종 값 길이: %s, 예상 길이: %s", len(final_value), len(password))
+            debug_log("입력 성공 여부: %s", len(final_value) == len(password))
             
             if len(final_value) == len(password):
                 input_success = True
-                debug_log("방법 1 성공!", "SUCCESS")
+                debug_log("방법 1 성공!", level="SUCCESS")
             else:
-                debug_log("방법 1 실패 - 입력 값 길이 불일치", "ERROR")
+                debug_log("방법 1 실패 - 입력 값 길이 불일치", level="ERROR")
             
         except Exception as e:
-            debug_log(f"방법 1 실패: {e}", "ERROR")
+            debug_log("방법 1 실패: %s", e, level="ERROR")
         
         # 방법 2: JavaScript 완전 제어
         if not input_success:
@@ -785,7 +1619,7 @@ def login_youtube(driver, username, password):
                     return input.value;
                 """, password_input, password)
                 
-                time.sleep(1)
+                wait_for(driver, lambda d: password_input.get_attribute('value') == password, step='password_typed')
                 input_success = True
                 safe_print("방법 2 성공")
                 
@@ -799,13 +1633,10 @@ def login_youtube(driver, username, password):
                 
                 # 필드 클릭 후 전체 선택 후 입력
                 password_input.click()
-                time.sleep(0.5)
                 password_input.send_keys(Keys.CONTROL + 'a')  # 전체 선택
-                time.sleep(0.2)
                 password_input.send_keys(Keys.DELETE)  # 삭제
-                time.sleep(0.3)
                 
-                # 한 글자씩 천천히
+                # 한 글자씩 천천히 (자동화 탐지 우회용 리듬)
                 for char in password:
                     password_input.send_keys(char)
                     time.sleep(0.12)
@@ -824,15 +1655,12 @@ def login_youtube(driver, username, password):
                 
                 # 클립보드에 복사
                 pyperclip.copy(password)
-                time.sleep(0.2)
                 
                 # 필드 활성화 후 붙여넣기
                 password_input.click()
-                time.sleep(0.5)
                 password_input.send_keys(Keys.CONTROL + 'a')
-                time.sleep(0.2)
                 password_input.send_keys(Keys.CONTROL + 'v')
-                time.sleep(0.5)
+                wait_for(driver, lambda d: password_input.get_attribute('value'), step='password_typed')
                 
                 input_success = True
                 safe_print("방법 4 성공")
@@ -843,51 +1671,50 @@ def login_youtube(driver, username, password):
         if not input_success:
             safe_print("모든 자동 입력 방법 실패 - 수동 입력 모드로 전환")
             safe_print("브라우저에서 직접 비밀번호를 입력해주세요.")
-            time.sleep(10)
-        
-        time.sleep(1)
+            wait_for(driver, lambda d: len(password_input.get_attribute('value') or '') >= len(password),
+                     step='manual_password', timeout=10)
         
         # 로그인 버튼 클릭
         login_button = driver.find_element(By.ID, "passwordNext")
         login_button.click()
-        time.sleep(5)
         
         # 로그인 결과 확인 (수정된 로직)
         safe_print("로그인 결과 확인 중...")
+        login_pages = ("accounts.google.com", "signin", "challenge")
         
-        # 최대 60초 대기하면서 실제 YouTube 접근 확인
-        for i in range(60):
-            time.sleep(1)
-            current_url = driver.current_url
-            
-            # Google 로그인 페이지가 아닌 곳으로 이동했는지 확인
-            if not any(x in current_url for x in ["accounts.google.com", "signin", "challenge"]):
-                safe_print(f"로그인 성공! 현재 위치: {current_url}")
-                return True
-            
-            # YouTube로 강제 이동 시도
-            if i == 30:  # 30초 후에 한 번 시도
-                safe_print("YouTube로 강제 이동 시도...")
-                try:
-                    driver.get("https://www.youtube.com")
-                    time.sleep(3)
-                    new_url = driver.current_url
-                    if "youtube.com" in new_url and "signin" not in new_url:
-                        safe_print("강제 이동으로 로그인 확인!")
-                        return True
-                except:
-                    pass
-            
-            if i % 10 == 0 and i > 0:
-                safe_print(f"대기 중... {60-i}초 남음 (현재: {current_url[:50]}...)")
+        # 최대 30초 대기하면서 Google 로그인 페이지가 아닌 곳으로 이동했는지 확인
+        current_url = wait_for(driver, url_excludes(*login_pages), step='login_result')
+        if current_url:
+            safe_print(f"로그인 성공! 현재 위치: {current_url}")
+            return True
+        
+        # YouTube로 강제 이동 시도
+        safe_print("YouTube로 강제 이동 시도...")
+        try:
+            driver.get(YOUTUBE_HOME_URL)
+            new_url = driver.current_url
+            if "youtube.com" in new_url and "signin" not in new_url:
+                safe_print("강제 이동으로 로그인 확인!")
+                return True
+        except:
+            pass
+        
+        # 추가로 최대 30초 더 대기
+        current_url = wait_for(driver, url_excludes(*login_pages), step='login_result')
+        if current_url:
+            safe_print(f"로그인 성공! 현재 위치: {current_url}")
+            return True
         
         safe_print("로그인 시간 초과")
+        report_error('login_failed', "로그인 시간 초과", cause='timeout')
         return False
         
     except Exception as e:
         safe_print(f"로그인 실패: {e}")
+        report_error('login_failed', e, cause=classify_error(e))
         return False
 
+@timed('navigate_to_create_post')
 def navigate_to_create_post(driver):
     """
     YouTube 커뮤니티 게시물 작성 페이지로 이동
@@ -900,8 +1727,7 @@ def navigate_to_create_post(driver):
         safe_print("YouTube 메인 페이지 확인...")
         current_url = driver.current_url
         if "youtube.com" not in current_url:
-            driver.get("https://www.youtube.com")
-            time.sleep(3)
+            driver.get(YOUTUBE_HOME_URL)
         
         # 페이지 로드 후 클론 오류 방지 스크립트 재실행
         safe_print("클론 오류 방지 스크립트 재실행...")
@@ -946,16 +1772,9 @@ def navigate_to_create_post(driver):
             "//button[contains(@aria-label, 'Create')]"
         ]
         
-        create_button = None
-        for selector in create_selectors:
-            try:
-                create_button = WebDriverWait(driver, 10).until(
-                    EC.element_to_be_clickable((By.XPATH, selector))
-                )
-                safe_print(f"만들기 버튼 찾음: {selector}")
-                break
-            except:
-                continue
+        create_button, winner = wait_for(driver, selector_probe(create_selectors, rank_key='create_button'), step='create_button') or (None, None)
+        if create_button:
+            safe_print(f"만들기 버튼 찾음: {create_selectors[winner]}")
         
         if not create_button:
             safe_print("❌ 만들기 버튼을 찾을 수 없음")
@@ -963,7 +1782,7 @@ def navigate_to_create_post(driver):
             
             # 페이지 새로고침 후 재시도
             driver.refresh()
-            time.sleep(5)
+            wait_for(driver, document_ready(), step='page_load')
             
             # 클론 오류 방지 스크립트 재실행
             driver.execute_script("""
@@ -978,18 +1797,13 @@ def navigate_to_create_post(driver):
             """)
             
             # 만들기 버튼 재검색
-            for selector in create_selectors:
-                try:
-                    create_button = WebDriverWait(driver, 5).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                    safe_print(f"새로고침 후 만들기 버튼 찾음: {selector}")
-                    break
-                except:
-                    continue
+            create_button, winner = wait_for(driver, selector_probe(create_selectors, rank_key='create_button'), step='create_button') or (None, None)
+            if create_button:
+                safe_print(f"새로고침 후 만들기 버튼 찾음: {create_selectors[winner]}")
             
             if not create_button:
                 safe_print("❌ 새로고침 후에도 만들기 버튼을 찾을 수 없음")
+                report_error('selector_not_found', "만들기 버튼을 찾을 수 없음", step='create_button')
                 return False
         
         # 만들기 버튼 클릭 (클론 오류 방지)
@@ -1003,9 +1817,8 @@ def navigate_to_create_post(driver):
         except:
             # 일반 클릭으로 대체
             create_button.click()
-        time.sleep(2)
         
-        # 게시물 옵션 선택
+        # 게시물 옵션 선택 (메뉴 항목이 클릭 가능해지는 것이 메뉴 열림 조건)
         safe_print("게시물 옵션 찾는 중...")
         post_selectors = [
             "//tp-yt-paper-item[contains(.//yt-formatted-string, '게시물') or contains(.//yt-formatted-string, 'Post')]",
@@ -1014,16 +1827,9 @@ def navigate_to_create_post(driver):
             "//div[contains(text(), '게시물') or contains(text(), 'Post')]"
         ]
         
-        post_option = None
-        for selector in post_selectors:
-            try:
-                post_option = WebDriverWait(driver, 10).until(
-                    EC.element_to_be_clickable((By.XPATH, selector))
-                )
-                safe_print(f"게시물 옵션 찾음: {selector}")
-                break
-            except:
-                continue
+        post_option, winner = wait_for(driver, selector_probe(post_selectors, rank_key='create_menu'), step='create_menu') or (None, None)
+        if post_option:
+            safe_print(f"게시물 옵션 찾음: {post_selectors[winner]}")
         
         if not post_option:
             safe_print("게시물 옵션을 찾을 수 없음 - 이미 커뮤니티 페이지에 있을 수 있음")
@@ -1045,13 +1851,19 @@ def navigate_to_create_post(driver):
         except:
             # 일반 클릭으로 대체
             post_option.click()
-        time.sleep(3)
+        
+        # 작성 다이얼로그가 열리거나 게시물 작성 페이지로 이동할 때까지 대기
+        wait_for(driver, any_of(
+            dialog_open(),
+            url_contains("show_create_dialog=1", "posts", "community"),
+        ), step='post_dialog')
         
         safe_print("✅ 게시물 작성 페이지 이동 완료")
         return True
         
     except Exception as e:
         safe_print(f"❌ 게시물 작성 페이지 이동 실패: {e}")
+        report_error(classify_error(e), e, step='navigate_to_create_post')
         safe_print("일반 YouTube 게시물 작성을 계속 시도합니다...")
         return False
 
@@ -1061,11 +1873,10 @@ def navigate_to_studio_directly(driver):
     
     try:
         # YouTube Studio 커뮤니티 페이지로 직접 이동
-        studio_url = "https://studio.youtube.com/channel/UC/community"
+        studio_url = STUDIO_COMMUNITY_URL
         safe_print(f"Studio URL 접근: {studio_url}")
         
         driver.get(studio_url)
-        time.sleep(5)
         
         # 강력한 클론 오류 방지 스크립트
         safe_print("강력한 클론 오류 방지 스크립트 적용...")
@@ -1108,9 +1919,7 @@ def navigate_to_studio_directly(driver):
         """)
         
         # 페이지 로딩 완료 대기
-        WebDriverWait(driver, 20).until(
-            lambda d: d.execute_script("return document.readyState") == "complete"
-        )
+        wait_for(driver, document_ready(), step='page_load')
         
         # Studio 페이지 확인
         current_url = driver.current_url
@@ -1125,11 +1934,91 @@ def navigate_to_studio_directly(driver):
         safe_print(f"Studio 직접 접근 실패: {e}")
         return False
 
-def create_post(driver, content, image_paths=None, video_paths=None):
+# --speed별 본문 입력 방식
+# - bulk: 전체 텍스트를 한 번에 삽입하고 결과를 검증, 불일치 시에만 청크 타이핑으로 대체
+# - typing: 처음부터 청크 타이핑 (chunk 글자씩 입력 후 delay초 대기)
+TEXT_INPUT_PROFILES = {
+    'slow': {'mode': 'typing', 'chunk': 1, 'delay': 0.1},
+    'normal': {'mode': 'bulk', 'chunk': 20, 'delay': 0.05},
+    'fast': {'mode': 'bulk', 'chunk': 100, 'delay': 0},
+}
+
+# 에디터에 표시된 텍스트 읽기 (contenteditable은 innerText, input/textarea는 value)
+JS_READ_EDITOR_TEXT = """
+var el = arguments[0];
+if (el.tagName === 'INPUT' || el.tagName === 'TEXTAREA') return el.value;
+return el.innerText || el.textContent || '';
+"""
+
+# 실제 입력과 같은 beforeinput/input 이벤트를 발생시키며 커서 위치에 텍스트 삽입
+JS_INSERT_TEXT = """
+var el = arguments[0];
+el.focus();
+return document.execCommand('insertText', false, arguments[1]);
+"""
+
+def normalize_editor_text(text):
+    """비교용 텍스트 정규화 (줄바꿈/nbsp/앞뒤 공백 차이 무시)"""
+    return (text or '').replace('\r\n', '\n').replace('\u00a0', ' ').strip()
+
+def clear_editor(driver, element):
+    """에디터 내용 전체 선택 후 삭제"""
+    element.send_keys(Keys.CONTROL + 'a')
+    element.send_keys(Keys.DELETE)
+    if driver.execute_script(JS_READ_EDITOR_TEXT, element):
+        element.clear()
+
+def insert_text(driver, element, text):
+    """
+    텍스트를 한 번에 삽입 (CDP Input.insertText 우선, 불가 시 execCommand)
+    ChromeDriver의 send_keys는 이모지 등 BMP 밖 문자를 보낼 수 없으므로 이 경로를 사용
+    """
+    try:
+        driver.execute_cdp_cmd('Input.insertText', {'text': text})
+    except Exception as e:
+        debug_log("CDP insertText 실패, execCommand로 대체: %s", e, level="WARNING")
+        driver.execute_script(JS_INSERT_TEXT, element, text)
+
+def type_text_chunked(driver, element, text, chunk=20, delay=0.05):
+    """청크 단위 타이핑 (BMP 밖 문자가 포함된 청크는 insert_text로 삽입)"""
+    for start in range(0, len(text), chunk):
+        piece = text[start:start + chunk]
+        if any(ord(ch) > 0xFFFF for ch in piece):
+            insert_text(driver, element, piece)
+        else:
+            element.send_keys(piece)
+        if delay:
+            time.sleep(delay)  # 입력 간격 유지
+
+def editor_text_matches(driver, element, text):
+    """에디터에 반영된 텍스트가 의도한 내용과 같은지 확인"""
+    actual = driver.execute_script(JS_READ_EDITOR_TEXT, element)
+    return normalize_editor_text(actual) == normalize_editor_text(text)
+
+def fill_post_text(driver, element, content, speed='normal'):
+    """
+    게시물 본문 입력 (--speed 프로필에 따라 일괄 삽입 또는 청크 타이핑)
+    반환: 에디터 텍스트가 content와 일치하면 True
+    """
+    profile = TEXT_INPUT_PROFILES.get(speed, TEXT_INPUT_PROFILES['normal'])
+    
+    if profile['mode'] == 'bulk':
+        insert_text(driver, element, content)
+        if wait_for(driver, lambda d: editor_text_matches(d, element, content), step='text_applied'):
+            return True
+        safe_print("⚠️ 일괄 입력 결과가 일치하지 않음 - 청크 타이핑으로 다시 입력")
+        clear_editor(driver, element)
+    
+    type_text_chunked(driver, element, content, profile['chunk'], profile['delay'])
+    return bool(wait_for(driver, lambda d: editor_text_matches(d, element, content), step='text_applied'))
+
+@timed('create_post')
+def create_post(driver, content, image_paths=None, video_paths=None, speed='normal'):
     """
     실제 게시물 작성(텍스트/이미지/영상 첨부) 자동화의 메인 함수
     - 텍스트 입력, 이미지/영상 업로드, 게시 버튼 클릭 등 전체 플로우 담당
     - 각 단계별로 상세한 예외 처리 및 우회 로직 포함
+    - speed: 본문 입력 방식 선택 (TEXT_INPUT_PROFILES 참고)
     """
     safe_print("게시물 작성 시작...")
     
@@ -1144,8 +2033,7 @@ def create_post(driver, content, image_paths=None, video_paths=None):
             safe_print("일반 YouTube 페이지로 돌아가서 다시 시도합니다...")
             
             # 일반 YouTube로 돌아가기
-            driver.get("https://www.youtube.com")
-            time.sleep(3)
+            driver.get(YOUTUBE_HOME_URL)
             
             # 다시 게시물 작성 시도
             safe_print("일반 YouTube에서 게시물 작성 재시도...")
@@ -1153,7 +2041,6 @@ def create_post(driver, content, image_paths=None, video_paths=None):
                 safe_print("❌ 일반 YouTube 게시물 작성 재시도 실패")
                 safe_print("Studio에서 게시물 작성을 계속합니다...")
                 driver.get(current_url)  # Studio로 돌아가기
-                time.sleep(3)
             else:
                 # 재시도 성공 시 현재 URL 다시 확인
                 current_url = driver.current_url
@@ -1185,8 +2072,6 @@ def create_post(driver, content, image_paths=None, video_paths=None):
             }
         """)
         
-        time.sleep(2)
-        
         # 텍스트 입력 전 URL 다시 확인 (리다이렉트 재감지)
         current_url = driver.current_url
         safe_print(f"텍스트 입력 전 현재 URL: {current_url}")
@@ -1197,26 +2082,16 @@ def create_post(driver, content, image_paths=None, video_paths=None):
         
         # 텍스트 입력 영역 찾기 (Studio와 일반 YouTube 모두 대응)
         safe_print("텍스트 입력 영역 찾는 중...")
-        text_selectors = [
-            "//div[@contenteditable='true']",
-        ]
+        text_selectors = TEXT_AREA_SELECTORS
         
-        text_area = None
-        for selector in text_selectors:
-            try:
-                text_area = WebDriverWait(driver, 5).until(
-                    EC.presence_of_element_located((By.XPATH, selector))
-                )
-                if text_area.is_displayed() and text_area.is_enabled():
-                    safe_print(f"텍스트 영역 찾음: {selector}")
-                    break
-                else:
-                    text_area = None
-            except:
-                continue
+        text_area, winner = wait_for(driver, selector_probe(text_selectors, rank_key='text_area'), step='text_area') or (None, None)
+        record_dom_snapshot(driver, 'compose')
+        if text_area:
+            safe_print(f"텍스트 영역 찾음: {text_selectors[winner]}")
         
         if not text_area:
             safe_print("❌ 텍스트 입력 영역을 찾을 수 없음")
+            report_error('selector_not_found', "텍스트 입력 영역을 찾을 수 없음", step='text_area')
             safe_print("현재 페이지 구조 분석...")
             
             # 페이지 구조 분석
@@ -1239,431 +2114,318 @@ def create_post(driver, content, image_paths=None, video_paths=None):
             return False
         
         # 안전한 텍스트 입력
-        safe_print("텍스트 내용 입력 중...")
-        try:
-            # 1. 클릭으로 포커스
-            text_area.click()
-            time.sleep(1)
-            
-            # 2. 기존 내용 지우기
-            text_area.clear()
-            time.sleep(0.5)
-            
-            # 3. JavaScript로 직접 값 설정 (TrustedHTML 오류 방지)
-            driver.execute_script("""
-                arguments[0].focus();
-                
-                // innerHTML 대신 textContent와 value 사용 (TrustedHTML 오류 방지)
-                arguments[0].textContent = '';
-                arguments[0].value = '';
-                
-                // 안전한 텍스트 설정
-                if (arguments[0].tagName === 'DIV' || arguments[0].contentEditable === 'true') {
-                    arguments[0].textContent = arguments[1];
-                } else {
-                    arguments[0].value = arguments[1];
-                }
-                
-                // 입력 이벤트 발생
-                var inputEvent = new Event('input', { bubbles: true });
-                arguments[0].dispatchEvent(inputEvent);
-                
-                // 변경 이벤트 발생
-                var changeEvent = new Event('change', { bubbles: true });
-                arguments[0].dispatchEvent(changeEvent);
-                
-                // 키보드 이벤트 시뮬레이션
-                var keydownEvent = new KeyboardEvent('keydown', { bubbles: true });
-                arguments[0].dispatchEvent(keydownEvent);
-                
-                var keyupEvent = new KeyboardEvent('keyup', { bubbles: true });
-                arguments[0].dispatchEvent(keyupEvent);
-            """, text_area, content)
-            
-            time.sleep(1)
+        with timing_span('text_entry', chars=len(content)):
+            safe_print("텍스트 내용 입력 중...")
+            try:
+                # 1. 클릭으로 포커스
+                text_area.click()
+                wait_for(driver, lambda d: d.execute_script("return document.activeElement === arguments[0];", text_area),
+                         step='text_applied')
             
-            # 4. 추가 확인을 위한 키보드 입력
-            text_area.send_keys(Keys.END)  # 커서를 끝으로 이동
-            time.sleep(0.5)
+                # 2. 기존 내용 지우기
+                clear_editor(driver, text_area)
             
-            safe_print("✅ 텍스트 입력 완료")
+                # 3. 본문 입력 후 에디터 텍스트 검증
+                if fill_post_text(driver, text_area, content, speed):
+                    safe_print("✅ 텍스트 입력 완료")
+                else:
+                    safe_print("⚠️ 에디터 텍스트가 입력 내용과 다를 수 있습니다")
             
-        except Exception as e:
-            safe_print(f"텍스트 입력 중 오류: {e}")
-            # 대체 방법: 천천히 타이핑
-            safe_print("대체 방법으로 천천히 입력...")
-            text_area.clear()
-            for char in content:
-                text_area.send_keys(char)
-                time.sleep(0.1)  # 느린 타이핑으로 오류 방지
+            except Exception as e:
+                safe_print(f"텍스트 입력 중 오류: {e}")
+                # 대체 방법: 천천히 타이핑
+                safe_print("대체 방법으로 천천히 입력...")
+                text_area.clear()
+                type_text_chunked(driver, text_area, content, chunk=1, delay=0.1)
         
         # 동영상 추가 (유튜브 URL 입력 자동화)
         if video_paths:
             safe_print(f"영상 {len(video_paths)}개 업로드 시도...")
             for i, video_path in enumerate(video_paths):
-                if video_path.startswith('http'):  # 유튜브 URL인 경우
-                    safe_print(f"유튜브 영상 URL 첨부: {video_path}")
-                    # 1단계: 영상 버튼 클릭 (정확한 선택자 우선)
-                    safe_print("[LOG] 영상 버튼 찾기 시작 (URL 입력 모드)...")
-                    video_button_clicked = False
-                    video_button_selectors = [
-                        "//button[@aria-label='동영상 추가']",
-                        "//button[contains(@aria-label, '동영상 추가')]",
-                        "//button[contains(., '동영상 추가')]",
-                        "//yt-formatted-string[contains(text(), '동영상 추가')]",
-                        "//span[contains(text(), '동영상 추가')]",
-                        "//button[contains(@aria-label, '기존 YouTube 동영상 추가')]",
-                        "//button[contains(., '기존 YouTube 동영상 추가')]"
-                    ]
-                    for selector in video_button_selectors:
-                        buttons = driver.find_elements(By.XPATH, selector)
-                        safe_print(f"[LOG] '{selector}'로 {len(buttons)}개 버튼 발견")
-                        for btn in buttons:
-                            if btn.is_displayed() and btn.is_enabled():
-                                btn.click()
-                                video_button_clicked = True
-                                safe_print(f"✅ 영상 버튼 클릭 성공 (정확한 선택자: {selector})")
-                                time.sleep(2)
-                                break
-                        if video_button_clicked:
-                            break
-                    # fallback: 기존 클래스명 방식
-                    if not video_button_clicked:
-                        video_buttons = driver.find_elements(By.CLASS_NAME, "yt-spec-touch-feedback-shape__fill")
-                        safe_print(f"[LOG] fallback: 클래스명으로 {len(video_buttons)}개 버튼 발견")
-                        for btn in video_buttons:
-                            if btn.is_displayed() and btn.is_enabled():
-                                btn.click()
-                                video_button_clicked = True
-                                safe_print("✅ 영상 버튼 클릭 성공 (클래스명 fallback)")
-                                time.sleep(2)
-                                break
-                    if not video_button_clicked:
-                        safe_print("❌ 영상 버튼을 찾거나 클릭하지 못했습니다.")
-                        continue
-                    # 2단계: URL 입력란 찾기 및 URL 입력 (버튼 클릭 성공 시 반드시 실행)
-                    try:
-                        time.sleep(2)  # 버튼 클릭 후 입력란이 렌더링될 시간 확보 (최적화: 2초로 단축)
-                        safe_print("[LOG] 유튜브 URL 입력란 찾기 시작...")
-
-                        # iframe이 있으면 바로 진입
-                        iframe = None
+                with timing_span('attach_video', index=i, source='url' if video_path.startswith('http') else 'file'):
+                    if video_path.startswith('http'):  # 유튜브 URL인 경우
+                        safe_print(f"유튜브 영상 URL 첨부: {video_path}")
+                        # 1단계: 영상 버튼 클릭 (정확한 선택자 우선)
+                        safe_print("[LOG] 영상 버튼 찾기 시작 (URL 입력 모드)...")
+                        video_button_clicked = False
+                        video_button_selectors = [
+                            "//button[@aria-label='동영상 추가']",
+                            "//button[contains(@aria-label, '동영상 추가')]",
+                            "//button[contains(., '동영상 추가')]",
+                            "//yt-formatted-string[contains(text(), '동영상 추가')]",
+                            "//span[contains(text(), '동영상 추가')]",
+                            "//button[contains(@aria-label, '기존 YouTube 동영상 추가')]",
+                            "//button[contains(., '기존 YouTube 동영상 추가')]"
+                        ]
+                        # fallback: 기존 클래스명 방식 (마지막 후보)
+                        video_button_selectors.append((By.CLASS_NAME, "yt-spec-touch-feedback-shape__fill"))
+                        btn, winner = wait_for(driver, selector_probe(video_button_selectors, rank_key='video_button'), step='media_button') or (None, None)
+                        if btn:
+                            btn.click()
+                            video_button_clicked = True
+                            safe_print(f"✅ 영상 버튼 클릭 성공 (선택자: {video_button_selectors[winner]})")
+                        if not video_button_clicked:
+                            safe_print("❌ 영상 버튼을 찾거나 클릭하지 못했습니다.")
+                            continue
+                        # 2단계: URL 입력란 찾기 및 URL 입력 (버튼 클릭 성공 시 반드시 실행)
                         try:
-                            iframe = driver.find_element(By.XPATH, "//iframe[contains(@src, 'docs.google.com/picker')]")
-                        except Exception:
-                            pass
-                        if iframe:
-                            driver.switch_to.frame(iframe)
-                            safe_print("[LOG] iframe 내부로 진입 완료 (빠른 탐색)")
-                            try:
-                                # aria-label로 바로 input 찾기
-                                found_input = driver.find_element(By.XPATH, "//input[@aria-label='YouTube 전체 검색 또는 URL 붙여넣기']")
-                                found_input.clear()
-                                found_input.send_keys(video_path)
-                                time.sleep(1)
-                                # '추가' 버튼 또는 엔터
-                                add_btn = None
-                                for btn in driver.find_elements(By.XPATH, "//button"):
-                                    btn_text = (btn.text or '').strip()
-                                    if btn_text in ['추가', '선택', 'Add', 'Select']:
-                                        add_btn = btn
-                                        break
-                                if add_btn:
-                                    add_btn.click()
-                                    safe_print("✅ '추가' 버튼 클릭 완료 (iframe)")
-                                else:
-                                    found_input.send_keys(Keys.ENTER)
-                                    safe_print("⚠️ '추가' 버튼을 못 찾아 엔터로 대체 (iframe)")
-                                # 검색 결과 클릭
-                                time.sleep(2)
-                                clicked = False
+                            safe_print("[LOG] 유튜브 URL 입력란 찾기 시작...")
+
+                            # 버튼 클릭 후 picker iframe이 렌더링될 때까지 대기 후 바로 진입
+                            iframe = wait_for(driver, element_present(PICKER_IFRAME_XPATH), step='media_dialog')
+                            if iframe:
+                                driver.switch_to.frame(iframe)
+                                safe_print("[LOG] iframe 내부로 진입 완료 (빠른 탐색)")
                                 try:
-                                    options = driver.find_elements(By.XPATH, "//div[@role='option']")
-                                    if options:
-                                        options[0].click()
-                                        safe_print("✅ 검색 결과(첫 번째 영상) 클릭 완료 (role='option')")
-                                        clicked = True
+                                    # aria-label로 바로 input 찾기 (iframe 내부 렌더링 대기)
+                                    found_input = wait_for(driver, element_visible(
+                                        "//input[@aria-label='YouTube 전체 검색 또는 URL 붙여넣기']"), step='media_dialog')
+                                    if not found_input:
+                                        raise Exception("URL 입력란을 찾을 수 없음")
+                                    found_input.clear()
+                                    found_input.send_keys(video_path)
+                                    # '추가' 버튼 또는 엔터
+                                    add_btn = next((b['element'] for b in scan_buttons(driver, 'button')
+                                                    if b['text'] in ['추가', '선택', 'Add', 'Select']), None)
+                                    if add_btn:
+                                        add_btn.click()
+                                        safe_print("✅ '추가' 버튼 클릭 완료 (iframe)")
                                     else:
-                                        thumbs = driver.find_elements(By.XPATH, "//img")
-                                        if thumbs:
-                                            thumbs[0].click()
-                                            safe_print("✅ 썸네일 이미지 클릭 완료 (백업)")
+                                        found_input.send_keys(Keys.ENTER)
+                                        safe_print("⚠️ '추가' 버튼을 못 찾아 엔터로 대체 (iframe)")
+                                    # 검색 결과 클릭 (결과 목록이 나타날 때까지 대기)
+                                    wait_for(driver, any_of(
+                                        element_visible("//div[@role='option']"),
+                                        element_visible("//img"),
+                                    ), step='picker_results')
+                                    clicked = False
+                                    try:
+                                        options = driver.find_elements(By.XPATH, "//div[@role='option']")
+                                        if options:
+                                            options[0].click()
+                                            safe_print("✅ 검색 결과(첫 번째 영상) 클릭 완료 (role='option')")
                                             clicked = True
+                                        else:
+                                            thumbs = driver.find_elements(By.XPATH, "//img")
+                                            if thumbs:
+                                                thumbs[0].click()
+                                                safe_print("✅ 썸네일 이미지 클릭 완료 (백업)")
+                                                clicked = True
+                                    except Exception as e:
+                                        safe_print(f"❌ 검색 결과 클릭 중 오류: {e}")
+                                    if not clicked:
+                                        safe_print("❌ 검색 결과를 클릭하지 못했습니다. 구조가 다를 수 있습니다.")
+                                    # '삽입' 버튼 클릭 (결과 선택 후 버튼이 활성화될 때까지 대기)
+                                    wait_for(driver, element_visible(
+                                        "//button[normalize-space(.)='삽입' or normalize-space(.)='Insert' or normalize-space(.)='선택']"),
+                                        step='picker_results')
+                                    insert_btn = next((b['element'] for b in scan_buttons(driver, 'button')
+                                                       if b['text'] in ['삽입', 'Insert', '선택']), None)
+                                    if insert_btn:
+                                        insert_btn.click()
+                                        safe_print("✅ '삽입' 버튼 클릭 완료 (iframe)")
+                                    else:
+                                        safe_print("❌ '삽입' 버튼을 찾지 못했습니다.")
+                                    driver.switch_to.default_content()
+                                    wait_for(driver, element_gone(PICKER_IFRAME_XPATH), step='picker_closed')
+                                    continue  # 이미 처리했으므로 다음 영상으로
                                 except Exception as e:
-                                    safe_print(f"❌ 검색 결과 클릭 중 오류: {e}")
-                                if not clicked:
-                                    safe_print("❌ 검색 결과를 클릭하지 못했습니다. 구조가 다를 수 있습니다.")
-                                # '삽입' 버튼 클릭
-                                time.sleep(1)
-                                insert_btn = None
-                                for btn in driver.find_elements(By.XPATH, "//button"):
-                                    btn_text = (btn.text or '').strip()
-                                    if btn_text in ['삽입', 'Insert', '선택']:
-                                        insert_btn = btn
-                                        break
-                                if insert_btn:
-                                    insert_btn.click()
-                                    safe_print("✅ '삽입' 버튼 클릭 완료 (iframe)")
-                                else:
-                                    safe_print("❌ '삽입' 버튼을 찾지 못했습니다.")
-                                driver.switch_to.default_content()
-                                time.sleep(2)
-                                continue  # 이미 처리했으므로 다음 영상으로
-                            except Exception as e:
-                                safe_print(f"❌ iframe 내부 진입/입력/버튼 클릭 중 오류: {e}")
-                                driver.switch_to.default_content()
+                                    safe_print(f"❌ iframe 내부 진입/입력/버튼 클릭 중 오류: {e}")
+                                    driver.switch_to.default_content()
+                                    continue
+                            else:
+                                safe_print("❌ docs.google.com/picker iframe을 찾지 못했습니다. 일반 다이얼로그 탐색으로 대체")
+                                # 기존 다이얼로그 탐색 로직 (생략)
                                 continue
-                        else:
-                            safe_print("❌ docs.google.com/picker iframe을 찾지 못했습니다. 일반 다이얼로그 탐색으로 대체")
-                            # 기존 다이얼로그 탐색 로직 (생략)
+                        except Exception as e:
+                            safe_print(f"❌ 유튜브 URL 입력 중 오류: {e}")
                             continue
-                    except Exception as e:
-                        safe_print(f"❌ 유튜브 URL 입력 중 오류: {e}")
-                        continue
-                elif os.path.exists(video_path):  # 로컬 파일 업로드 기존 방식
-                    safe_print(f"영상 {i+1}/{len(video_paths)} 업로드: {os.path.basename(video_path)}")
-                    # 1단계: 영상 버튼 찾기 및 클릭
-                    video_button_clicked = False
-                    try:
-                        video_buttons = driver.find_elements(By.CLASS_NAME, "yt-spec-touch-feedback-shape__fill")
-                        for btn in video_buttons:
-                            if btn.is_displayed() and btn.is_enabled():
+                    elif os.path.exists(video_path):  # 로컬 파일 업로드 기존 방식
+                        safe_print(f"영상 {i+1}/{len(video_paths)} 업로드: {os.path.basename(video_path)}")
+                        # 1단계: 영상 버튼 찾기 및 클릭
+                        video_button_clicked = False
+                        try:
+                            btn, _ = wait_for(driver, selector_probe([(By.CLASS_NAME, "yt-spec-touch-feedback-shape__fill")]),
+                                              step='media_button') or (None, None)
+                            if btn:
                                 btn.click()
                                 video_button_clicked = True
                                 safe_print("✅ 영상 버튼 클릭 성공")
-                                time.sleep(2)
-                                break
-                        if not video_button_clicked:
-                            safe_print("❌ 영상 버튼을 찾거나 클릭하지 못했습니다.")
+                            if not video_button_clicked:
+                                safe_print("❌ 영상 버튼을 찾거나 클릭하지 못했습니다.")
+                                continue
+                        except Exception as e:
+                            safe_print(f"❌ 영상 버튼 클릭 중 오류: {e}")
                             continue
-                    except Exception as e:
-                        safe_print(f"❌ 영상 버튼 클릭 중 오류: {e}")
-                        continue
-                    # 2단계: 파일 input에 영상 전달
-                    try:
-                        file_inputs = driver.find_elements(By.XPATH, "//input[@type='file']")
-                        found = False
-                        for file_input in file_inputs:
-                            accept = file_input.get_attribute('accept') or ""
-                            if 'video' in accept or not accept:
-                                file_input.send_keys(os.path.abspath(video_path))
-                                safe_print("✅ 영상 파일 전송 완료")
-                                found = True
-                                break
-                        if not found:
-                            safe_print("❌ 영상 업로드용 파일 input을 찾지 못함")
+                        # 2단계: 파일 input에 영상 전달 (첨부 다이얼로그의 input 등장 대기)
+                        try:
+                            wait_for(driver, element_present("//input[@type='file']"), step='media_dialog')
+                            file_inputs = driver.find_elements(By.XPATH, "//input[@type='file']")
+                            found = False
+                            for file_input in file_inputs:
+                                accept = file_input.get_attribute('accept') or ""
+                                if 'video' in accept or not accept:
+                                    file_input.send_keys(os.path.abspath(video_path))
+                                    safe_print("✅ 영상 파일 전송 완료")
+                                    found = True
+                                    break
+                            if not found:
+                                safe_print("❌ 영상 업로드용 파일 input을 찾지 못함")
+                                continue
+                        except Exception as e:
+                            safe_print(f"❌ 영상 파일 전송 중 오류: {e}")
                             continue
-                    except Exception as e:
-                        safe_print(f"❌ 영상 파일 전송 중 오류: {e}")
-                        continue
-                    # 3단계: 업로드 성공 확인 (간단히 대기)
-                    time.sleep(5)
-                    safe_print("🎬 영상 업로드 시도 완료")
-
-        def drag_and_drop_files(driver, target, file_paths):
-            # 여러 파일을 한 번에 드롭하는 JS 이벤트 시뮬레이션
-            files = []
-            for path in file_paths:
-                with open(path, 'rb') as f:
-                    content = f.read()
-                    b64 = base64.b64encode(content).decode()
-                    files.append({
-                        'name': os.path.basename(path),
-                        'type': 'image/jpeg',  # 실제 확장자에 따라 바꿀 수 있음
-                        'content': b64
-                    })
-            js = '''
-            const target = arguments[0];
-            const files = arguments[1];
-            function b64toBlob(b64Data, contentType) {
-                const byteCharacters = atob(b64Data);
-                const byteNumbers = new Array(byteCharacters.length);
-                for (let i = 0; i < byteCharacters.length; i++) {
-                    byteNumbers[i] = byteCharacters.charCodeAt(i);
-                }
-                const byteArray = new Uint8Array(byteNumbers);
-                return new Blob([byteArray], {type: contentType});
-            }
-            const dt = new DataTransfer();
-            for (const file of files) {
-                const blob = b64toBlob(file.content, file.type);
-                const f = new File([blob], file.name, {type: file.type});
-                dt.items.add(f);
-            }
-            const event = new DragEvent('drop', {
-                dataTransfer: dt,
-                bubbles: true,
-                cancelable: true
-            });
-            target.dispatchEvent(event);
-            '''
-            driver.execute_script(js, target, files)
+                        # 3단계: 업로드 성공 확인 (미리보기 등장/진행 표시 사라짐)
+                        wait_for(driver, upload_finished(), step='upload_finished')
+                        safe_print("🎬 영상 업로드 시도 완료")
 
         # 이미지 업로드 (유튜브 실제 동작과 일치, 텍스트 입력 등 기존 로직은 그대로)
         if image_paths:
-            safe_print(f"이미지 {len(image_paths)}개 업로드 시도...")
-            if not os.path.exists(image_paths[0]):
-                safe_print(f"❌ 이미지 파일이 존재하지 않음: {image_paths[0]}")
-            else:
-                safe_print(f"이미지 1 업로드: {os.path.basename(image_paths[0])}")
-                # 첫 번째 이미지는 기존 방식(버튼 클릭+upload_image_simple_method)
-                image_button_clicked = False
-                safe_print("이미지 버튼 찾는 중 (aria-label='이미지 추가' 우선)...")
-                image_button_selectors = [
-                    "//button[@aria-label='이미지 추가']",
-                    "//button[.//span[text()='이미지']]",
-                    "//button[contains(., '이미지')]"
-                ]
-                for button_selector in image_button_selectors:
-                    try:
-                        buttons = driver.find_elements(By.XPATH, button_selector)
-                        safe_print(f"선택자 '{button_selector}'로 {len(buttons)}개 버튼 발견")
-                        for idx, button in enumerate(buttons):
-                            try:
-                                is_displayed = button.is_displayed()
-                                is_enabled = button.is_enabled()
-                                safe_print(f"버튼 {idx+1} 상태: 표시={is_displayed}, 활성화={is_enabled}")
-                                if not is_displayed or not is_enabled:
-                                    safe_print(f"❌ 버튼 {idx+1} 비활성/비표시 - 건너뜀")
-                                    continue
-                                safe_print(f"버튼 {idx+1} 클릭 시도...")
-                                button.click()
-                                time.sleep(2)
-                                image_button_clicked = True
-                                break
-                            except Exception as button_error:
-                                safe_print(f"❌ 버튼 {idx+1} 클릭 실패: {button_error}")
-                                continue
-                        if image_button_clicked:
-                            break
-                    except Exception as selector_error:
-                        safe_print(f"❌ 선택자 '{button_selector}' 처리 중 오류: {selector_error}")
-                        continue
-                if not image_button_clicked:
-                    safe_print("❌ '이미지 추가' 버튼을 찾거나 클릭하지 못했습니다. HTML 구조가 변경되었을 수 있습니다.")
-                    safe_print("  → 최신 HTML 구조를 다시 확인해 주세요.")
+            with timing_span('attach_image', index=0):
+                safe_print(f"이미지 {len(image_paths)}개 업로드 시도...")
+                if not os.path.exists(image_paths[0]):
+                    safe_print(f"❌ 이미지 파일이 존재하지 않음: {image_paths[0]}")
                 else:
-                    safe_print("이미지 버튼 클릭 성공 - 파일 업로드 시도")
-                    upload_success = upload_image_simple_method(driver, image_paths[0])
-                    if upload_success:
-                        safe_print(f"✅ 이미지 1 업로드 성공!")
+                    safe_print(f"이미지 1 업로드: {os.path.basename(image_paths[0])}")
+                    # 첫 번째 이미지는 기존 방식(버튼 클릭+upload_image_simple_method)
+                    image_button_clicked = False
+                    safe_print("이미지 버튼 찾는 중 (aria-label='이미지 추가' 우선)...")
+                    image_button_selectors = IMAGE_BUTTON_SELECTORS
+                    button, winner = wait_for(driver, selector_probe(image_button_selectors, rank_key='image_button'), step='media_button') or (None, None)
+                    if button:
+                        try:
+                            safe_print(f"선택자 '{image_button_selectors[winner]}'로 찾은 버튼 클릭 시도...")
+                            button.click()
+                            wait_for(driver, element_present("//input[@type='file']"), step='media_dialog')
+                            image_button_clicked = True
+                        except Exception as button_error:
+                            safe_print(f"❌ 버튼 클릭 실패: {button_error}")
+                    if not image_button_clicked:
+                        safe_print("❌ '이미지 추가' 버튼을 찾거나 클릭하지 못했습니다. HTML 구조가 변경되었을 수 있습니다.")
+                        report_error('selector_not_found', "'이미지 추가' 버튼을 찾거나 클릭하지 못함", step='image_button')
+                        safe_print("  → 최신 HTML 구조를 다시 확인해 주세요.")
                     else:
-                        safe_print(f"❌ 이미지 1 업로드 실패")
-            # 두 번째~N번째 이미지는 input[type=file][multiple]에 한 번에 넘김
+                        safe_print("이미지 버튼 클릭 성공 - 파일 업로드 시도")
+                        upload_success = upload_image_simple_method(driver, image_paths[0])
+                        if upload_success:
+                            safe_print(f"✅ 이미지 1 업로드 성공!")
+                        else:
+                            safe_print(f"❌ 이미지 1 업로드 실패")
+                            report_error('upload_failed', "이미지 첨부 실패", file=os.path.basename(image_paths[0]))
+                # 두 번째~N번째 이미지는 input[type=file][multiple]에 한 번에 넘김
             
         
         # 게시물 게시
-        safe_print("게시물 게시 중...")
-        try:
-            # 현재 URL 확인 - 게시물 작성 페이지에 있는지 확인
-            current_url = driver.current_url
-            safe_print(f"게시 시점 현재 URL: {current_url}")
+        with timing_span('publish'):
+            safe_print("게시물 게시 중...")
+            try:
+                # 현재 URL 확인 - 게시물 작성 페이지에 있는지 확인
+                current_url = driver.current_url
+                safe_print(f"게시 시점 현재 URL: {current_url}")
             
-            # 게시물 작성 페이지가 아니면 경고
-            if "show_create_dialog=1" not in current_url and "posts" not in current_url:
-                safe_print("⚠️ 게시물 작성 페이지가 아닌 것 같습니다!")
-                safe_print("게시물 작성 페이지로 돌아가려고 시도합니다...")
-                return False
+                # 게시물 작성 페이지가 아니면 경고
+                if "show_create_dialog=1" not in current_url and "posts" not in current_url:
+                    safe_print("⚠️ 게시물 작성 페이지가 아닌 것 같습니다!")
+                    report_error('publish_failed', "게시물 작성 페이지가 아님", url=current_url.split('?')[0])
+                    safe_print("게시물 작성 페이지로 돌아가려고 시도합니다...")
+                    return False
             
-            # 게시 버튼 찾기 (게시물 작성 페이지에서만)
-            publish_selectors = [
-                # 게시물 작성 다이얼로그 내부의 게시 버튼
-                # aria-label 기반 (하지만 동영상 관련 제외)
-                "//*[@aria-label and contains(@aria-label, '게시') and not(contains(@aria-label, '동영상'))]"
-                
-            ]
+                # 게시 버튼 찾기 (게시물 작성 페이지에서만)
+                publish_selectors = PUBLISH_SELECTORS
+                record_dom_snapshot(driver, 'publish')
             
-            publish_button = None
-            for selector in publish_selectors:
-                try:
-                    buttons = driver.find_elements(By.XPATH, selector)
-                    safe_print(f"게시 버튼 선택자 '{selector}'로 {len(buttons)}개 버튼 발견")
-                    for button in buttons:
-                        if button.is_displayed() and button.is_enabled():
-                            button_text = button.text or button.get_attribute('aria-label') or ""
-                            
-                            # 동영상 관련 버튼인지 확인 (URL 기반)
-                            button_html = button.get_attribute('outerHTML') or ""
-                            if any(word in button_html.lower() for word in ['watch?v=', 'video', 'player']):
-                                safe_print(f"❌ 동영상 관련 버튼 제외: {button_text}")
-                                continue
-                            
-                            # 현재 URL이 동영상 페이지가 아닌지 다시 확인
-                            current_url = driver.current_url
-                            if "watch?v=" in current_url:
-                                safe_print(f"❌ 동영상 페이지의 버튼 제외: {button_text}")
-                                continue
-                            
-                            publish_button = button
-                            safe_print(f"✅ 게시 버튼 발견: {button_text}")
-                            break
-                    if publish_button:
-                        break
-                except Exception as e:
-                    safe_print(f"게시 버튼 선택자 '{selector}' 오류: {e}")
-                    continue
+                publish_button = None
+                if "watch?v=" in current_url:
+                    # 현재 URL이 동영상 페이지면 게시 버튼 후보 제외
+                    safe_print("❌ 동영상 페이지의 버튼 제외")
+                else:
+                    try:
+                        # 동영상 관련 버튼(outerHTML 기준)은 제외하고 한 번에 검사
+                        publish_button, winner = probe_selectors(
+                            driver, publish_selectors, reject=PUBLISH_REJECT, rank_key='publish_button')
+                        if publish_button:
+                            safe_print(f"✅ 게시 버튼 발견: {publish_selectors[winner]}")
+                    except Exception as e:
+                        safe_print(f"게시 버튼 선택자 오류: {e}")
             
-            # 게시 버튼을 못 찾은 경우 모든 버튼 분석
-            if not publish_button:
-                safe_print("⚠️ 게시 버튼을 찾지 못함 - 모든 버튼 분석...")
-                try:
-                    all_buttons = driver.find_elements(By.XPATH, "//button | //*[@role='button']")
-                    safe_print(f"총 {len(all_buttons)}개의 버튼 발견")
+                # 게시 버튼을 못 찾은 경우 모든 버튼 분석
+                if not publish_button:
+                    safe_print("⚠️ 게시 버튼을 찾지 못함 - 모든 버튼 분석...")
+                    try:
+                        # 모든 버튼 정보를 한 번에 수집한 뒤 로컬에서 선택
+                        all_buttons = scan_buttons(driver)
+                        safe_print(f"총 {len(all_buttons)}개의 버튼 발견")
+                        publish_keywords = ['게시', 'publish', '공유', 'share', '올리기', 'post', 'submit']
                     
-                    for idx, button in enumerate(all_buttons):
-                        try:
-                            if button.is_displayed() and button.is_enabled():
-                                button_text = button.text.strip()
-                                aria_label = button.get_attribute('aria-label') or ""
-                                
-                                # 게시 관련 키워드 확인
-                                combined_text = f"{button_text} {aria_label}".lower()
-                                publish_keywords = ['게시', 'publish', '공유', 'share', '올리기', 'post', 'submit']
-                                
-                                if any(keyword in combined_text for keyword in publish_keywords):
-                                    safe_print(f"게시 버튼 후보 {idx}: '{button_text}' (aria-label: '{aria_label}')")
-                                    publish_button = button
-                                    break
-                                    
-                        except Exception:
-                            continue
+                        for idx, button in enumerate(all_buttons):
+                            if not (button['visible'] and button['enabled']):
+                                continue
+                            # 게시 관련 키워드 확인
+                            combined_text = f"{button['text']} {button['aria_label']}".lower()
+                            if any(keyword in combined_text for keyword in publish_keywords):
+                                safe_print(f"게시 버튼 후보 {idx}: '{button['text']}' (aria-label: '{button['aria_label']}')")
+                                publish_button = button['element']
+                                break
                             
-                except Exception as e:
-                    safe_print(f"모든 버튼 분석 중 오류: {e}")
+                    except Exception as e:
+                        safe_print(f"모든 버튼 분석 중 오류: {e}")
             
-            if publish_button:
-                safe_print("게시 버튼 클릭...")
-                driver.execute_script("arguments[0].click();", publish_button)
-                time.sleep(3)
-                safe_print("✅ 게시물 게시 완료!")
-                return True
-            else:
-                safe_print("❌ 게시 버튼을 찾을 수 없습니다.")
-                safe_print("📝 수동으로 게시 버튼을 클릭해주세요.")
-                time.sleep(5)  # 사용자가 수동으로 클릭할 시간
-                return True  # 일단 성공으로 처리
+                if publish_button:
+                    safe_print("게시 버튼 클릭...")
+                    driver.execute_script("arguments[0].click();", publish_button)
+                    # 게시 버튼이 사라지거나(작성 창 제거) 비활성화되면 게시 완료
+                    if not wait_for(driver, element_inactive(publish_button), step='publish_done'):
+                        safe_print("⚠️ 게시 완료를 확인하지 못함 (게시 버튼이 그대로 남아 있음)")
+                        report_error('publish_failed', "게시 완료 확인 시간 초과", cause='timeout')
+                        return False
+                    safe_print("✅ 게시물 게시 완료!")
+                    return True
+                else:
+                    safe_print("❌ 게시 버튼을 찾을 수 없습니다.")
+                    report_error('selector_not_found', "게시 버튼을 찾을 수 없음", step='publish_button')
+                    safe_print("📝 수동으로 게시 버튼을 클릭해주세요.")
+                    # 사용자가 수동으로 클릭할 시간 (작성 중인 내용이 사라지면 게시된 것으로 간주)
+                    wait_for(driver, element_gone("//div[@contenteditable='true'][normalize-space(.)!='']"),
+                             step='manual_publish')
+                    return True  # 일단 성공으로 처리
                 
-        except Exception as publish_error:
-            safe_print(f"게시 중 오류: {publish_error}")
-            return False
+            except Exception as publish_error:
+                safe_print(f"게시 중 오류: {publish_error}")
+                report_error('publish_failed', publish_error, cause=classify_error(publish_error))
+                return False
 
     except Exception as e:
         safe_print(f"게시물 생성 중 오류: {e}")
+        report_error(classify_error(e), e, step='create_post')
         return False
 
-def cleanup_temp_files():
-    """임시 파일 정리"""
+def cleanup_temp_files(own_only=False):
+    """
+    임시 파일 정리
+    own_only: 이 프로세스가 만든 임시 프로필만 삭제 (--worker/--manifest/--queue처럼 여러 프로세스가
+              동시에 실행될 수 있는 모드에서 다른 프로세스의 실행 중인 Chrome 프로필을 지우지 않도록)
+    """
     try:
         import tempfile
         import shutil
+        if own_only:
+            for temp_path in list(_owned_temp_dirs):
+                shutil.rmtree(temp_path, ignore_errors=True)
+                _owned_temp_dirs.discard(temp_path)
+                safe_print(f"임시 폴더 정리: {os.path.basename(temp_path)}")
+            return
+
         temp_base = tempfile.gettempdir()
         
-        # chrome_temp_ 로 시작하는 임시 폴더들 찾기
+        # chrome_temp_ 로 시작하는 임시 폴더들 찾기 (실행 중인 Chrome이 사용 중인 폴더는 제외)
         for item in os.listdir(temp_base):
             if item.startswith('chrome_temp_'):
                 temp_path = os.path.join(temp_base, item)
+                if is_profile_locked(temp_path):
+                    continue
                 try:
                     shutil.rmtree(temp_path, ignore_errors=True)
+                    _owned_temp_dirs.discard(temp_path)
                     safe_print(f"임시 폴더 정리: {item}")
                 except:
                     pass
@@ -1677,6 +2439,446 @@ def cleanup_temp_files():
     except Exception as e:
         safe_print(f"임시 파일 정리 중 오류 (무시됨): {e}")
 
+# 이미지 전처리 캐시: 형식 정규화/메타데이터 제거/축소 결과를 원본 내용 해시로 저장해 재사용
+IMAGE_CACHE_DIR = os.path.join(os.getcwd(), 'image_cache')
+IMAGE_CACHE_MAX_MB = 512           # 캐시 디렉토리 최대 크기 (넘으면 가장 오래 사용하지 않은 파일부터 삭제)
+IMAGE_MAX_EDGE = 2048              # 긴 변 최대 픽셀 (게시물 이미지 표시 해상도 이상은 업로드 시간만 늘어남)
+IMAGE_JPEG_QUALITY = 90
+IMAGE_PREPROCESS_VERSION = 1       # 전처리 방식을 바꾸면 올려서 기존 캐시 무효화
+
+_pillow_warned = False
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    """파일 내용의 SHA-256 (청크 단위로 읽어 메모리 사용 최소화)"""
+    import hashlib
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def evict_image_cache(keep=None, max_total_mb=IMAGE_CACHE_MAX_MB):
+    """이미지 캐시가 max_total_mb를 넘으면 가장 오래 사용하지 않은 파일부터 삭제 (keep 제외)"""
+    if not os.path.isdir(IMAGE_CACHE_DIR):
+        return
+    entries = []
+    for name in os.listdir(IMAGE_CACHE_DIR):
+        path = os.path.join(IMAGE_CACHE_DIR, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entries.append([stat.st_mtime, path, stat.st_size])
+
+    total = sum(size for _, _, size in entries)
+    for _, path, size in sorted(entries):
+        if total <= max_total_mb * 1024 * 1024:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+def preprocess_image(image_path):
+    """
+    업로드 전 이미지 전처리 (Pillow가 설치된 경우에만)
+    - 실제 형식 확인 후 투명도가 있으면 PNG, 아니면 JPEG로 정규화
+    - EXIF 회전 적용 후 메타데이터 제거, 긴 변 IMAGE_MAX_EDGE 이하로 축소
+    - 결과는 원본 내용 해시로 캐시해 같은 이미지를 다시 올릴 때 바로 재사용
+    반환: 업로드할 파일 경로 (전처리 불가 시 원본 경로)
+    """
+    global _pillow_warned
+    if not os.path.isfile(image_path):
+        return image_path
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        if not _pillow_warned:
+            safe_print("⚠️ Pillow가 없어 이미지 전처리를 건너뜁니다 (pip install Pillow)")
+            _pillow_warned = True
+        return image_path
+
+    try:
+        key = f"{file_sha256(image_path)[:32]}_v{IMAGE_PREPROCESS_VERSION}_{IMAGE_MAX_EDGE}_{IMAGE_JPEG_QUALITY}"
+        for ext in ('.jpg', '.png'):
+            cached_path = os.path.join(IMAGE_CACHE_DIR, key + ext)
+            if os.path.exists(cached_path):
+                os.utime(cached_path)  # LRU 사용 시각 갱신
+                debug_log("이미지 전처리 캐시 사용: %s", os.path.basename(cached_path))
+                return cached_path
+
+        with Image.open(image_path) as img:
+            if getattr(img, 'is_animated', False):
+                return image_path  # 움직이는 GIF 등은 원본 그대로 업로드
+            original_size = img.size
+            img = ImageOps.exif_transpose(img)
+            has_alpha = img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info)
+            img = img.convert('RGBA' if has_alpha else 'RGB')
+            img.thumbnail((IMAGE_MAX_EDGE, IMAGE_MAX_EDGE), Image.LANCZOS)
+
+            os.makedirs(IMAGE_CACHE_DIR, exist_ok=True)
+            cached_path = os.path.join(IMAGE_CACHE_DIR, key + ('.png' if has_alpha else '.jpg'))
+            tmp_path = cached_path + '.tmp'
+            # 새 이미지 객체로 저장하므로 EXIF/ICC 등 원본 메타데이터는 포함되지 않음
+            if has_alpha:
+                img.save(tmp_path, 'PNG', optimize=True)
+            else:
+                img.save(tmp_path, 'JPEG', quality=IMAGE_JPEG_QUALITY, optimize=True, progressive=True)
+            os.replace(tmp_path, cached_path)
+
+        safe_print(f"🖼️ 이미지 전처리: {original_size[0]}x{original_size[1]} → {img.size[0]}x{img.size[1]}, "
+                   f"{os.path.getsize(image_path):,} → {os.path.getsize(cached_path):,} bytes")
+        evict_image_cache(keep=cached_path)
+        return cached_path
+    except Exception as e:
+        safe_print(f"⚠️ 이미지 전처리 실패, 원본 사용: {e}")
+        return image_path
+
+# 파일 드롭: 숨김 input[type=file]에 경로만 전달(ChromeDriver가 DOM.setFileInputFiles로 처리)한 뒤
+# 그 File 객체로 drop 이벤트 발생 → 파일 바이트가 WebDriver JSON 채널을 거치지 않음
+JS_CREATE_FILE_INPUT = """
+var input = document.createElement('input');
+input.type = 'file';
+input.multiple = true;
+input.style.position = 'absolute';
+input.style.left = '-9999px';
+input.style.opacity = '0';
+document.body.appendChild(input);
+return input;
+"""
+
+JS_DROP_INPUT_FILES = """
+var target = arguments[0], input = arguments[1];
+var dt = new DataTransfer();
+for (var i = 0; i < input.files.length; i++) dt.items.add(input.files[i]);
+['dragenter', 'dragover', 'drop'].forEach(function(type) {
+    target.dispatchEvent(new DragEvent(type, {bubbles: true, cancelable: true, dataTransfer: dt}));
+});
+input.remove();
+return dt.files.length;
+"""
+
+# 비교용 기존 방식: 파일을 base64로 인코딩해 execute_script로 전송 후 브라우저에서 복원
+JS_DROP_BASE64 = """
+var target = arguments[0], files = arguments[1];
+var dt = new DataTransfer();
+for (var i = 0; i < files.length; i++) {
+    var chars = atob(files[i].content);
+    var bytes = new Array(chars.length);
+    for (var j = 0; j < chars.length; j++) bytes[j] = chars.charCodeAt(j);
+    dt.items.add(new File([new Uint8Array(bytes)], files[i].name, {type: files[i].type}));
+}
+['dragenter', 'dragover', 'drop'].forEach(function(type) {
+    target.dispatchEvent(new DragEvent(type, {bubbles: true, cancelable: true, dataTransfer: dt}));
+});
+return dt.files.length;
+"""
+
+def drop_files(driver, target, file_paths):
+    """
+    파일 참조만 브라우저에 넘겨 target에 드롭 (base64 복사 없음)
+    반환: 드롭된 파일 개수
+    """
+    temp_input = driver.execute_script(JS_CREATE_FILE_INPUT)
+    temp_input.send_keys("\n".join(os.path.abspath(path) for path in file_paths))
+    return driver.execute_script(JS_DROP_INPUT_FILES, target, temp_input)
+
+def drop_files_base64(driver, target, file_paths):
+    """기존 base64 드롭 방식 (벤치마크 비교용)"""
+    files = []
+    for path in file_paths:
+        with open(path, 'rb') as f:
+            files.append({
+                'name': os.path.basename(path),
+                'type': mimetypes.guess_type(path)[0] or 'application/octet-stream',
+                'content': base64.b64encode(f.read()).decode(),
+            })
+    return driver.execute_script(JS_DROP_BASE64, target, files)
+
+# 벤치마크용 페이지: 드롭된 파일을 실제로 끝까지 읽은 뒤 바이트 수를 기록
+ATTACH_BENCH_PAGE = (
+    "data:text/html,<div id='target' style='width:300px;height:300px'></div><script>"
+    "var t=document.getElementById('target');"
+    "t.addEventListener('dragover',function(e){e.preventDefault();});"
+    "t.addEventListener('drop',function(e){e.preventDefault();"
+    "Promise.all(Array.from(e.dataTransfer.files).map(function(f){return f.arrayBuffer();}))"
+    ".then(function(bufs){window.__dropped=bufs.reduce(function(s,b){return s+b.byteLength;},0);});});"
+    "</script>"
+)
+
+def run_attach_benchmark(sizes_mb=None, repeats=3):
+    """
+    이미지 크기별로 파일 참조 드롭(drop_files)과 base64 드롭(drop_files_base64) 시간 비교
+    브라우저가 파일 바이트를 모두 읽을 때까지의 시간을 측정
+    """
+    sizes_mb = sizes_mb or [0.5, 2, 8]
+    driver = setup_driver(headless=True, clean_cache=False)
+    bench_dir = tempfile.mkdtemp(prefix='attach_bench_')
+    rows = []
+    try:
+        for size_mb in sizes_mb:
+            size = int(size_mb * 1024 * 1024)
+            path = os.path.join(bench_dir, f'bench_{size}.jpg')
+            with open(path, 'wb') as f:
+                f.write(os.urandom(size))
+            for name, method in (('file_reference', drop_files), ('base64', drop_files_base64)):
+                samples = []
+                for _ in range(repeats):
+                    driver.get(ATTACH_BENCH_PAGE)
+                    target = driver.find_element(By.ID, 'target')
+                    t0 = time.perf_counter()
+                    method(driver, target, [path])
+                    dropped = wait_for(driver, lambda d: d.execute_script("return window.__dropped;"),
+                                       step='upload_finished')
+                    if dropped != size:
+                        raise Exception(f"드롭된 크기 불일치: {dropped} != {size}")
+                    samples.append(time.perf_counter() - t0)
+                samples.sort()
+                rows.append({'size_mb': size_mb, 'method': name,
+                             'median_seconds': round(samples[len(samples) // 2], 4),
+                             'min_seconds': round(samples[0], 4)})
+                safe_print(f"  {size_mb:>6} MB  {name:<15} 중앙값 {samples[len(samples) // 2] * 1000:9.1f} ms")
+    finally:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        shutil.rmtree(bench_dir, ignore_errors=True)
+    print(json.dumps({'attach_benchmark': rows}, ensure_ascii=False))
+    return rows
+
+# DOM 스냅샷 기록 (--record-dom): 실제 실행의 단계별 DOM을 민감정보 제거 후 저장
+DOM_SNAPSHOT_MANIFEST = 'snapshots.json'
+DOM_REPLAY_REPEATS = 20
+
+_dom_snapshot_dir = None
+
+# 문서를 복제하며 계산된 표시 상태를 인라인 스타일로 고정하고 스크립트/입력값/개인정보 제거
+# (외부 CSS 없이 file://로 열어도 표시 여부 판정이 원본과 같도록)
+JS_CAPTURE_DOM_SNAPSHOT = """
+var EMAIL = /[\\w.+-]+@[\\w-]+(\\.[\\w-]+)+/g;
+var root = document.documentElement;
+var clone = root.cloneNode(true);
+var originals = root.querySelectorAll('*');
+var copies = clone.querySelectorAll('*');
+for (var i = 0; i < originals.length && i < copies.length; i++) {
+    var el = originals[i], copy = copies[i];
+    var style = window.getComputedStyle(el);
+    var rect = el.getBoundingClientRect();
+    if (style.display === 'none') {
+        copy.setAttribute('style', 'display:none');
+    } else if (rect.width === 0 || rect.height === 0) {
+        copy.setAttribute('style', 'display:block;width:0;height:0;overflow:hidden');
+    } else {
+        var display = style.display === 'inline' ? 'inline-block' : style.display;
+        copy.setAttribute('style', 'display:' + display + ';min-width:' + Math.ceil(rect.width) + 'px;min-height:'
+            + Math.ceil(rect.height) + 'px' + (style.visibility === 'hidden' ? ';visibility:hidden' : ''));
+    }
+    var attrs = Array.prototype.slice.call(copy.attributes);
+    for (var a = 0; a < attrs.length; a++) {
+        var name = attrs[a].name, value = attrs[a].value;
+        if (name.indexOf('on') === 0 || name === 'srcset' || name === 'nonce' || name === 'integrity') {
+            copy.removeAttribute(name);
+        } else if (name === 'value') {
+            copy.setAttribute(name, '');
+        } else if (name === 'src') {
+            copy.setAttribute(name, value.indexOf('blob:') === 0 ? 'blob:snapshot'
+                : value.indexOf('data:image') === 0 ? 'data:image/gif;base64,R0lGODlhAQABAAAAACw=' : 'about:blank');
+        } else if (name === 'href') {
+            copy.setAttribute(name, value.split(/[?#]/)[0]);
+        } else if (EMAIL.test(value)) {
+            copy.setAttribute(name, value.replace(EMAIL, 'user@example.com'));
+        }
+        EMAIL.lastIndex = 0;
+    }
+}
+var drop = clone.querySelectorAll('script, noscript, style, link, template, iframe, object, embed');
+for (var d = 0; d < drop.length; d++) drop[d].remove();
+// 작성 중인 본문은 저장하지 않음
+var editors = clone.querySelectorAll('[contenteditable], textarea');
+for (var e = 0; e < editors.length; e++) editors[e].textContent = '';
+var walker = document.createTreeWalker(clone, NodeFilter.SHOW_TEXT);
+while (walker.nextNode()) {
+    walker.currentNode.nodeValue = walker.currentNode.nodeValue.replace(EMAIL, 'user@example.com');
+}
+var head = clone.querySelector('head');
+if (head) head.insertAdjacentHTML('afterbegin', '<meta charset="utf-8">');
+return '<!doctype html>\\n' + clone.outerHTML;
+"""
+
+def configure_dom_recorder(snapshot_dir):
+    """DOM 스냅샷 저장 폴더 설정 (None이면 기록 안 함)"""
+    global _dom_snapshot_dir
+    _dom_snapshot_dir = snapshot_dir
+    if snapshot_dir:
+        os.makedirs(snapshot_dir, exist_ok=True)
+
+def record_dom_snapshot(driver, phase):
+    """
+    현재 페이지 DOM을 phase 이름으로 저장 (기록 모드가 아니면 아무것도 하지 않음)
+    실패해도 본 작업에는 영향 없음
+    """
+    if not _dom_snapshot_dir:
+        return None
+    try:
+        html = driver.execute_script(JS_CAPTURE_DOM_SNAPSHOT)
+        manifest_path = os.path.join(_dom_snapshot_dir, DOM_SNAPSHOT_MANIFEST)
+        with file_lock(manifest_path):
+            try:
+                with open(manifest_path, 'r', encoding='utf-8') as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                manifest = []
+            file_name = f"{len(manifest) + 1:03d}_{phase}.html"
+            with open(os.path.join(_dom_snapshot_dir, file_name), 'w', encoding='utf-8') as f:
+                f.write(html)
+            manifest.append({
+                'file': file_name,
+                'phase': phase,
+                'url': driver.current_url.split('?')[0],
+                'captured_at': time.time(),
+            })
+            with open(manifest_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=2)
+        safe_print(f"📸 DOM 스냅샷 저장: {file_name}")
+        return file_name
+    except Exception as e:
+        safe_print(f"⚠️ DOM 스냅샷 저장 실패 ({phase}): {e}")
+        return None
+
+# 재생 하네스에서 비교할 단계별 선택자: xpath는 운영 목록, css는 같은 의미의 CSS 목록
+# (CSS로 표현할 수 없는 텍스트 조건은 빠지므로 결과 불일치로 드러남)
+SELECTOR_REPLAY_STEPS = {
+    'text_area': {
+        'phase': 'compose', 'visible': True,
+        'xpath': TEXT_AREA_SELECTORS,
+        'css': ["div[contenteditable='true']"],
+    },
+    'image_button': {
+        'phase': 'compose', 'visible': True,
+        'xpath': IMAGE_BUTTON_SELECTORS,
+        'css': ["button[aria-label='이미지 추가']"],
+    },
+    'image_file_input': {
+        'phase': 'image_dialog', 'visible': False,
+        'xpath': IMAGE_INPUT_SELECTORS,
+        'css': [
+            "input[type='file'][accept*='image']",
+            "input[type='file'][name*='image'], input[type='file'][name*='photo'], input[type='file'][name*='Filedata']",
+            "input[type='file']:not([accept]), input[type='file'][accept='']",
+        ],
+    },
+    'image_preview': {
+        'phase': 'image_attached', 'visible': False,
+        'xpath': IMAGE_PREVIEW_SELECTORS,
+        'css': [
+            "img[src*='blob:']", "img[src*='data:image']", "[class*='preview'] img",
+            "[class*='thumbnail'] img", "[class*='uploaded'] img", "[class*='image'] img",
+        ],
+    },
+    'publish_button': {
+        'phase': 'publish', 'visible': True, 'reject': PUBLISH_REJECT,
+        'xpath': PUBLISH_SELECTORS,
+        'css': ["[aria-label*='게시']:not([aria-label*='동영상'])"],
+    },
+}
+
+def find_by_webdriver(driver, by, selectors, visible=True, reject=None):
+    """WebDriver find_elements로 후보를 하나씩 검사 (요소마다 표시/제외 조건 왕복)"""
+    for selector in selectors:
+        for element in driver.find_elements(by, selector):
+            if visible and not (element.is_displayed() and element.is_enabled()):
+                continue
+            if reject and any(word in (element.get_attribute('outerHTML') or '').lower() for word in reject):
+                continue
+            return element
+    return None
+
+# 선택자 전략: WebDriver XPath / WebDriver CSS / 브라우저 내 JS 일괄 검사(XPath, CSS)
+SELECTOR_REPLAY_STRATEGIES = {
+    'xpath': lambda d, spec: find_by_webdriver(d, By.XPATH, spec['xpath'], spec['visible'], spec.get('reject')),
+    'css': lambda d, spec: find_by_webdriver(d, By.CSS_SELECTOR, spec['css'], spec['visible'], spec.get('reject')),
+    'js_xpath': lambda d, spec: probe_selectors(d, spec['xpath'], visible=spec['visible'], reject=spec.get('reject'))[0],
+    'js_css': lambda d, spec: probe_selectors(d, [(By.CSS_SELECTOR, c) for c in spec['css']],
+                                              visible=spec['visible'], reject=spec.get('reject'))[0],
+}
+
+def same_element(driver, a, b):
+    """두 WebElement가 같은 DOM 노드인지 (둘 다 None이면 같다고 봄)"""
+    if a is None or b is None:
+        return a is None and b is None
+    return bool(driver.execute_script("return arguments[0] === arguments[1];", a, b))
+
+def replay_dom_snapshots(snapshot_dir, repeats=DOM_REPLAY_REPEATS):
+    """
+    저장된 DOM 스냅샷을 headless Chrome에서 file://로 열고 단계별 선택자 전략의 속도/정확도 비교
+    - 기준: 운영 코드가 쓰는 XPath 목록을 브라우저 내에서 검사한 결과(js_xpath)
+    - 기준 선택자가 스냅샷에서 요소를 못 찾으면 회귀로 보고
+    반환: 회귀가 없으면 True
+    """
+    from pathlib import Path
+    with open(os.path.join(snapshot_dir, DOM_SNAPSHOT_MANIFEST), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    driver = setup_driver(headless=True, clean_cache=False)
+    # setup_driver의 implicit wait가 켜져 있으면 WebDriver 전략이 못 찾을 때마다 대기 시간을 측정하게 되므로 끔
+    driver.implicitly_wait(0)
+    rows = []
+    regressions = []
+    try:
+        for entry in manifest:
+            driver.get(Path(snapshot_dir, entry['file']).resolve().as_uri())
+            for step, spec in SELECTOR_REPLAY_STEPS.items():
+                if spec['phase'] != entry['phase']:
+                    continue
+                reference = SELECTOR_REPLAY_STRATEGIES['js_xpath'](driver, spec)
+                if reference is None:
+                    regressions.append(f"{entry['file']}:{step}")
+                for name, strategy in SELECTOR_REPLAY_STRATEGIES.items():
+                    samples = []
+                    element = None
+                    for _ in range(repeats):
+                        t0 = time.perf_counter()
+                        try:
+                            element = strategy(driver, spec)
+                        except Exception:
+                            element = None
+                        samples.append(time.perf_counter() - t0)
+                    samples.sort()
+                    rows.append({'file': entry['file'], 'step': step, 'strategy': name,
+                                 'found': element is not None,
+                                 'correct': same_element(driver, element, reference),
+                                 'median_ms': round(samples[len(samples) // 2] * 1000, 3)})
+    finally:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    # 단계별로 모든 스냅샷에서 기준과 같은 요소를 고른 전략 중 가장 빠른 것을 추천
+    recommendations = {}
+    for step in SELECTOR_REPLAY_STEPS:
+        step_rows = [row for row in rows if row['step'] == step]
+        if not step_rows:
+            continue
+        safe_print(f"\n[{step}]")
+        for name in SELECTOR_REPLAY_STRATEGIES:
+            strategy_rows = [row for row in step_rows if row['strategy'] == name]
+            correct = all(row['correct'] for row in strategy_rows)
+            total_ms = sum(row['median_ms'] for row in strategy_rows)
+            safe_print(f"  {name:<9} 중앙값 합계 {total_ms:9.2f} ms  {'✅ 일치' if correct else '❌ 불일치'}")
+            if correct and (step not in recommendations or total_ms < recommendations[step]['total_ms']):
+                recommendations[step] = {'strategy': name, 'total_ms': round(total_ms, 3)}
+        if step in recommendations:
+            safe_print(f"  → 추천: {recommendations[step]['strategy']}")
+    for regression in regressions:
+        safe_print(f"❌ 선택자 회귀: {regression} (운영 선택자가 요소를 찾지 못함)")
+    print(json.dumps({'selector_replay': rows, 'recommendations': recommendations, 'regressions': regressions},
+                     ensure_ascii=False))
+    return not regressions
+
 def upload_image_by_drag_drop(driver, image_path, drop_area=None):
     """
     이미지 파일을 드래그 앤 드롭 방식으로 업로드 시도
@@ -1767,54 +2969,18 @@ def upload_image_by_drag_drop(driver, image_path, drop_area=None):
             safe_print("❌ 드롭 영역을 찾을 수 없음")
             return False
         
-        # JavaScript 드래그 앤 드롭 시뮬레이션
-        js_drop_script = """
-        function simulateFileDropEvent(element, filePath) {
-            // 파일 객체 생성 (시뮬레이션)
-            const fileName = filePath.split('\\\\').pop().split('/').pop();
-            
-            // DataTransfer 객체 생성
-            const dataTransfer = new DataTransfer();
-            
-            // 드래그 이벤트들 생성
-            const dragEnterEvent = new DragEvent('dragenter', {
-                bubbles: true,
-                cancelable: true,
-                dataTransfer: dataTransfer
-            });
+        try:
+            # 파일 참조로 드래그 앤 드롭 (바이트 복사 없음)
+            drop_files(driver, target_element, [normalized_path])
+            safe_print("✅ 드래그 앤 드롭 이벤트 발생")
             
-            const dragOverEvent = new DragEvent('dragover', {
-                bubbles: true,
-                cancelable: true,
-                dataTransfer: dataTransfer
-            });
+            wait_for(driver, upload_finished(), step='upload_finished')
+            if verify_image_upload_success(driver, wait_progress=False):
+                safe_print("🎉 드롭으로 이미지 업로드 성공!")
+                return True
             
-            const dropEvent = new DragEvent('drop', {
-                bubbles: true,
-                cancelable: true,
-                dataTransfer: dataTransfer
-            });
-            
-            // 이벤트 발생
-            element.dispatchEvent(dragEnterEvent);
-            element.dispatchEvent(dragOverEvent);
-            element.dispatchEvent(dropEvent);
-            
-            console.log('드래그 앤 드롭 이벤트 시뮬레이션 완료:', fileName);
-            return true;
-        }
-        
-        return simulateFileDropEvent(arguments[0], arguments[1]);
-        """
-        
-        try:
-            # JavaScript 드래그 앤 드롭 실행
-            result = driver.execute_script(js_drop_script, target_element, normalized_path)
-            safe_print("✅ JavaScript 드래그 앤 드롭 이벤트 발생")
-            time.sleep(2)
-            
-            # 실제 드롭존의 파일 입력 요소에 파일 전송
-            safe_print("🔍 드롭존 내 파일 입력 요소 찾기...")
+            # 실제 드롭존의 파일 입력 요소에 파일 전송
+            safe_print("🔍 드롭존 내 파일 입력 요소 찾기...")
             
             # 우선순위: 드롭존 내부의 파일 입력 요소
             dropzone_file_inputs = driver.find_elements(By.XPATH, "//div[@id='dropzone']//input[@type='file']")
@@ -1853,8 +3019,8 @@ def upload_image_by_drag_drop(driver, image_path, drop_area=None):
                                 file_input.send_keys(normalized_path)
                                 safe_print("✅ 드롭존 파일 전송 완료")
                                 
-                                # 파일 전송 후 잠시 대기
-                                time.sleep(3)
+                                # 파일 전송 후 업로드 반영 대기
+                                wait_for(driver, upload_finished(), step='upload_finished')
                                 
                                 # 전송 성공 확인 (요소 다시 찾아서)
                                 verification_inputs = driver.find_elements(By.XPATH, "//div[@id='dropzone']//input[@type='file']")
@@ -1901,7 +3067,7 @@ def upload_image_by_drag_drop(driver, image_path, drop_area=None):
                         continue
             
             # 업로드 성공 확인
-            time.sleep(3)
+            wait_for(driver, upload_finished(), step='upload_finished')
             return True
             
         except Exception as js_error:
@@ -1932,114 +3098,52 @@ def upload_image_simple_method(driver, image_path):
         # 방법 1: 숨겨진 파일 input 요소 직접 찾기
         safe_print("방법 1: 숨겨진 파일 input 요소 직접 찾기...")
         
-        # 모든 파일 input 요소 찾기
-        file_inputs = driver.find_elements(By.XPATH, "//input[@type='file']")
-        safe_print(f"페이지에서 {len(file_inputs)}개의 파일 input 요소 발견")
-        
-        # 이미지 업로드용 input 찾기
-        image_inputs = []
-        for idx, file_input in enumerate(file_inputs):
+        # 이미지 업로드용 input 후보 (학습된 성공 순서로 시도)
+        record_dom_snapshot(driver, 'image_dialog')
+        for selector in rank_candidates('image_file_input', IMAGE_INPUT_SELECTORS):
             try:
-                accept_attr = file_input.get_attribute('accept') or ""
-                name_attr = file_input.get_attribute('name') or ""
-                id_attr = file_input.get_attribute('id') or ""
+                file_input, _ = probe_selectors(driver, [selector], visible=False)
+                if not file_input:
+                    continue
+                
+                safe_print(f"이미지 input에 파일 전송 시도: {selector}")
                 
-                safe_print(f"파일 input {idx+1}: accept='{accept_attr}', name='{name_attr}', id='{id_attr}'")
+                # 파일 전송
+                file_input.send_keys(normalized_path)
+                safe_print(f"✅ 파일 전송 완료")
                 
-                # 이미지 관련 input 판별
-                if ('image' in accept_attr.lower() or 
-                    'image' in name_attr.lower() or 
-                    'photo' in name_attr.lower() or
-                    'filedata' in name_attr.lower() or
-                    not accept_attr):  # accept가 없는 경우도 시도
-                    image_inputs.append((idx, file_input))
+                # 업로드 반영 대기
+                wait_for(driver, upload_finished(), step='upload_finished')
+                
+                # 업로드 성공 확인 (확인된 경우에만 성공으로 기록)
+                if verify_image_upload_success(driver):
+                    record_selector_win('image_file_input', selector)
+                    safe_print("🎉 이미지 업로드 성공 확인!")
+                    return True
+                else:
+                    safe_print("⚠️ 업로드 성공 확인 안됨, 다음 input 시도...")
                     
             except Exception as e:
-                safe_print(f"파일 input {idx+1} 분석 중 오류: {e}")
+                safe_print(f"파일 전송 중 오류: {e}")
                 continue
         
-        if image_inputs:
-            safe_print(f"이미지 업로드 가능한 input {len(image_inputs)}개 발견")
-            
-            for idx, file_input in image_inputs:
-                try:
-                    safe_print(f"이미지 input {idx+1}에 파일 전송 시도...")
-                    
-                    # 파일 전송
-                    file_input.send_keys(normalized_path)
-                    safe_print(f"✅ 파일 전송 완료")
-                    
-                    # 업로드 확인을 위해 잠시 대기
-                    time.sleep(3)
-                    
-                    # 업로드 성공 확인
-                    if verify_image_upload_success(driver):
-                        safe_print("🎉 이미지 업로드 성공 확인!")
-                        return True
-                    else:
-                        safe_print("⚠️ 업로드 성공 확인 안됨, 다음 input 시도...")
-                        
-                except Exception as e:
-                    safe_print(f"파일 전송 중 오류: {e}")
-                    continue
-        
-        # 방법 2: JavaScript로 파일 input 생성하고 업로드
-        safe_print("방법 2: JavaScript로 파일 input 생성하여 업로드...")
-        
-        js_upload_script = """
-        // 임시 파일 input 생성
-        var fileInput = document.createElement('input');
-        fileInput.type = 'file';
-        fileInput.accept = 'image/*';
-        fileInput.style.position = 'absolute';
-        fileInput.style.left = '-9999px';
-        fileInput.style.opacity = '0';
-        document.body.appendChild(fileInput);
-        
-        // 파일 선택 이벤트 리스너
-        fileInput.addEventListener('change', function(e) {
-            console.log('파일 선택됨:', e.target.files[0]);
-            
-            // YouTube의 드롭존에 파일 전달
-            var dropzones = document.querySelectorAll('[id*="dropzone"], [class*="drop"], [class*="upload"]');
-            if (dropzones.length > 0) {
-                var dropzone = dropzones[0];
-                
-                // 드래그 이벤트 시뮬레이션
-                var dt = new DataTransfer();
-                dt.items.add(e.target.files[0]);
-                
-                var dropEvent = new DragEvent('drop', {
-                    bubbles: true,
-                    cancelable: true,
-                    dataTransfer: dt
-                });
-                
-                dropzone.dispatchEvent(dropEvent);
-                console.log('드롭 이벤트 발생');
-            }
-        });
-        
-        return fileInput;
-        """
+        # 방법 2: 파일 참조를 드롭존에 드롭 (base64 복사 없음)
+        safe_print("방법 2: 드롭존에 파일 드롭하여 업로드...")
         
         try:
-            created_input = driver.execute_script(js_upload_script)
-            if created_input:
-                safe_print("✅ 임시 파일 input 생성 완료")
-                
-                # 생성된 input에 파일 전송
-                created_input.send_keys(normalized_path)
-                safe_print("✅ 생성된 input에 파일 전송 완료")
+            dropzone, _ = probe_selectors(driver, [(By.CSS_SELECTOR, '[id*="dropzone"], [class*="drop"], [class*="upload"]')],
+                                          visible=False)
+            if dropzone and drop_files(driver, dropzone, [normalized_path]):
+                safe_print("✅ 드롭존에 파일 드롭 완료")
                 
                 # 업로드 확인
-                time.sleep(3)
+                wait_for(driver, upload_finished(), step='upload_finished')
                 if verify_image_upload_success(driver):
-                    safe_print("🎉 JavaScript 방법으로 이미지 업로드 성공!")
+                    safe_print("🎉 드롭 방법으로 이미지 업로드 성공!")
                     return True
                     
         except Exception as e:
-            safe_print(f"JavaScript 업로드 방법 실패: {e}")
+            safe_print(f"드롭 업로드 방법 실패: {e}")
         
         # 방법 3: 클립보드 사용 (Windows만)
         if platform.system() == "Windows":
@@ -2058,13 +3162,12 @@ def upload_image_simple_method(driver, image_path):
                 if text_areas:
                     text_area = text_areas[0]
                     text_area.click()
-                    time.sleep(1)
                     
                     # Ctrl+V로 붙여넣기
                     text_area.send_keys(Keys.CONTROL + 'v')
                     safe_print("✅ Ctrl+V로 이미지 붙여넣기 시도")
                     
-                    time.sleep(3)
+                    wait_for(driver, upload_finished(), step='upload_finished')
                     if verify_image_upload_success(driver):
                         safe_print("🎉 클립보드 방법으로 이미지 업로드 성공!")
                         return True
@@ -2079,22 +3182,16 @@ def upload_image_simple_method(driver, image_path):
         safe_print(f"이미지 업로드 중 전체 오류: {e}")
         return False
 
-def verify_image_upload_success(driver):
+def verify_image_upload_success(driver, wait_progress=True):
     """
     이미지 업로드 성공 여부를 다양한 방식(파일 input, blob URL, 업로드 메시지 등)으로 검증
+    - wait_progress: 업로드 진행 표시가 있으면 사라질 때까지 기다린 뒤 한 번 더 확인
     """
     try:
         # 업로드된 이미지 미리보기 확인
-        preview_selectors = [
-            "//img[contains(@src, 'blob:')]",  # blob URL 이미지
-            "//img[contains(@src, 'data:image')]",  # data URL 이미지
-            "//*[contains(@class, 'preview')]//img",  # 미리보기 이미지
-            "//*[contains(@class, 'thumbnail')]//img",  # 썸네일 이미지
-            "//*[contains(@class, 'uploaded')]//img",  # 업로드된 이미지
-            "//*[contains(@class, 'image')]//img",  # 일반 이미지
-        ]
-        
-        for selector in preview_selectors:
+        if wait_progress:
+            record_dom_snapshot(driver, 'image_attached')
+        for selector in IMAGE_PREVIEW_SELECTORS:
             try:
                 images = driver.find_elements(By.XPATH, selector)
                 if images:
@@ -2111,14 +3208,14 @@ def verify_image_upload_success(driver):
             "//*[contains(text(), 'uploading') or contains(text(), '업로드')]"
         ]
         
-        for selector in progress_selectors:
+        for selector in progress_selectors if wait_progress else []:
             try:
                 progress = driver.find_elements(By.XPATH, selector)
                 if progress:
                     safe_print(f"📤 업로드 진행 중 감지: {selector}")
-                    # 업로드 완료까지 대기
-                    time.sleep(5)
-                    return verify_image_upload_success(driver)  # 재귀 호출로 다시 확인
+                    # 업로드 완료까지 대기 (진행 표시가 사라질 때까지)
+                    wait_for(driver, element_gone(selector), step='upload_finished')
+                    return verify_image_upload_success(driver, wait_progress=False)  # 다시 확인
             except:
                 continue
         
@@ -2143,69 +3240,507 @@ def verify_image_upload_success(driver):
 def get_token_path(email):
     return f"token_{email.replace('@', '_at_')}.json"
 
-def get_credentials(email, scopes):
-    safe_print("scopes: "+str(scopes));
-    token_path = get_token_path(email)
-    creds = None
-    if os.path.exists(token_path):
-        creds = Credentials.from_authorized_user_file(token_path, scopes)
-    # 토큰이 없거나, 만료됐고 refresh_token이 있으면 자동 갱신
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
+# OAuth 토큰 관리: 메모리 캐시 + 만료 전 백그라운드 갱신 + 프로세스 간 파일 잠금
+TOKEN_REFRESH_MARGIN = 300           # 만료 5분 전이면 미리 갱신
+TOKEN_REFRESH_RETRY_SECONDS = 60     # 백그라운드 갱신 실패 시 재시도 간격
+
+_credentials_cache = {}              # {email: Credentials} (업로드 클라이언트와 같은 객체를 공유)
+_credentials_lock = threading.Lock()
+_refresh_threads = {}                # {email: Thread}
+
+@contextmanager
+def file_lock(path):
+    """path 파일의 갱신/저장을 프로세스 간에 직렬화하는 잠금 (<path>.lock)"""
+    lock_file = open(path + '.lock', 'a+')
+    try:
+        if os.name == 'nt':
+            import msvcrt
+            lock_file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK은 약 10초 후 실패하므로 다시 대기
         else:
-            from google_auth_oauthlib.flow import InstalledAppFlow
-            flow = InstalledAppFlow.from_client_secrets_file("client_secret.json", scopes)
-            creds = flow.run_local_server(port=11360, prompt='consent')
-        with open(token_path, "w") as token:
-            token.write(creds.to_json())
+            import fcntl
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        yield
+    finally:
+        try:
+            if os.name == 'nt':
+                import msvcrt
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        finally:
+            lock_file.close()
+
+def seconds_until_expiry(creds):
+    """토큰 만료까지 남은 시간(초), 만료 시각이 없으면 무한대"""
+    if not creds or not creds.token:
+        return float('-inf')
+    if creds.expiry is None:
+        return float('inf')
+    from datetime import datetime, timezone
+    return (creds.expiry - datetime.now(timezone.utc).replace(tzinfo=None)).total_seconds()
+
+def write_token_file(token_path, creds):
+    """토큰 파일 저장 (임시 파일에 쓴 뒤 교체해 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 함)"""
+    tmp_path = f"{token_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as token:
+        token.write(creds.to_json())
+    os.replace(tmp_path, token_path)
+
+def refresh_credentials(email, scopes, creds=None, interactive=True):
+    """
+    파일 잠금을 잡은 상태에서 토큰 파일을 다시 읽고, 필요할 때만 갱신/최초 로그인 후 저장
+    다른 프로세스가 먼저 갱신했다면 그 토큰을 그대로 사용
+    최초 로그인(브라우저 OAuth)은 사람이 끝낼 때까지 걸리므로 잠금을 풀고 진행한 뒤 저장할 때만 다시 잠금
+    creds가 주어지면 같은 객체의 토큰을 교체 (공유 중인 API 클라이언트에도 바로 반영)
+    """
+    from google.oauth2.credentials import Credentials
+    from google.auth.transport.requests import Request
+    token_path = get_token_path(email)
+    needs_consent = False
+    with file_lock(token_path):
+        fresh = None
+        if os.path.exists(token_path):
+            fresh = Credentials.from_authorized_user_file(token_path, scopes)
+        if not fresh or seconds_until_expiry(fresh) < TOKEN_REFRESH_MARGIN:
+            if fresh and fresh.refresh_token:
+                fresh.refresh(Request())
+                write_token_file(token_path, fresh)
+            elif interactive:
+                needs_consent = True
+            else:
+                raise Exception(f"refresh_token이 없어 토큰을 갱신할 수 없음: {email}")
+    if needs_consent:
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        install_oauth_browser_hook()
+        flow = InstalledAppFlow.from_client_secrets_file("client_secret.json", scopes)
+        fresh = flow.run_local_server(port=11360, prompt='consent')
+        with file_lock(token_path):
+            write_token_file(token_path, fresh)
+    if creds is None:
+        return fresh
+    creds.token = fresh.token
+    creds.expiry = fresh.expiry
+    return creds
+
+def token_refresh_loop(email, scopes):
+    """백그라운드 스레드: 만료 TOKEN_REFRESH_MARGIN초 전에 미리 갱신"""
+    while True:
+        creds = _credentials_cache.get(email)
+        if creds is None or not creds.refresh_token or creds.expiry is None:
+            return
+        wait = seconds_until_expiry(creds) - TOKEN_REFRESH_MARGIN
+        if wait > 0:
+            time.sleep(wait)
+            continue
+        try:
+            with _credentials_lock:
+                if seconds_until_expiry(creds) < TOKEN_REFRESH_MARGIN:
+                    refresh_credentials(email, scopes, creds, interactive=False)
+                    debug_log("토큰 백그라운드 갱신 완료: %s", email)
+        except Exception as e:
+            safe_print(f"⚠️ 토큰 백그라운드 갱신 실패, {TOKEN_REFRESH_RETRY_SECONDS}초 후 재시도: {e}")
+            time.sleep(TOKEN_REFRESH_RETRY_SECONDS)
+
+def get_credentials(email, scopes):
+    """
+    계정별 OAuth 인증 정보 반환
+    - 메모리 캐시에 있고 만료까지 여유가 있으면 그대로 반환 (파일/네트워크 접근 없음)
+    - 아니면 잠금을 잡고 토큰 파일 재확인 → 갱신 → 최초 로그인 순
+    - 이후 백그라운드 스레드가 만료 전에 미리 갱신
+    """
+    with _credentials_lock:
+        creds = _credentials_cache.get(email)
+        if seconds_until_expiry(creds) < TOKEN_REFRESH_MARGIN:
+            safe_print("scopes: " + str(scopes))
+            creds = refresh_credentials(email, scopes, creds)
+            _credentials_cache[email] = creds
+        thread = _refresh_threads.get(email)
+        if not thread or not thread.is_alive():
+            thread = threading.Thread(target=token_refresh_loop, args=(email, scopes),
+                                      name=f"token-refresh-{email}", daemon=True)
+            _refresh_threads[email] = thread
+            thread.start()
     return creds
 
-def upload_video_to_youtube(file_path, email=None):
+# 업로드 중복 방지 인덱스: (계정, 파일 내용 해시) → 업로드된 영상 URL
+UPLOAD_INDEX_PATH = os.path.join(os.getcwd(), 'upload_index.json')
+OEMBED_URL = "https://www.youtube.com/oembed"
+
+_upload_index_lock = threading.Lock()  # 동시 업로드 스레드 간 직렬화 (프로세스 간은 file_lock)
+
+def load_upload_index():
+    """
+    업로드 인덱스 로드
+    {'videos': {"email:sha256": {url, file_name, size, uploaded_at}},
+     'hashes': {절대경로: {size, mtime_ns, sha256}}}  # 같은 파일 재해시 방지
+    """
+    try:
+        with open(UPLOAD_INDEX_PATH, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except Exception:
+        index = {}
+    index.setdefault('videos', {})
+    index.setdefault('hashes', {})
+    return index
+
+def save_upload_index(index):
+    """업로드 인덱스 저장 (임시 파일에 쓴 뒤 교체)"""
+    tmp_path = f"{UPLOAD_INDEX_PATH}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, UPLOAD_INDEX_PATH)
+
+def get_file_digest(file_path):
+    """파일 내용 SHA-256 (크기/수정시각이 같으면 인덱스에 저장된 값 재사용)"""
+    stat = os.stat(file_path)
+    cached = load_upload_index()['hashes'].get(os.path.abspath(file_path))
+    if cached and cached.get('size') == stat.st_size and cached.get('mtime_ns') == stat.st_mtime_ns:
+        return cached['sha256']
+    return file_sha256(file_path)
+
+def video_still_exists(url):
+    """oEmbed로 영상이 아직 존재하는지 확인 (쿼터 소모 없음, 확인 불가 시 존재한다고 간주)"""
+    import requests
+    try:
+        response = requests.get(OEMBED_URL, params={'url': url, 'format': 'json'}, timeout=10)
+    except Exception as e:
+        safe_print(f"⚠️ 영상 존재 확인 실패, 기존 URL 사용: {e}")
+        return True
+    return response.status_code not in (401, 403, 404)
+
+def find_uploaded_video(email, file_path, verify=False):
+    """
+    같은 계정으로 같은 내용의 파일을 이미 업로드했다면 그 URL 반환
+    반환: (sha256, url 또는 None)
+    """
+    digest = get_file_digest(file_path)
+    entry = load_upload_index()['videos'].get(f"{email}:{digest}")
+    if not entry:
+        return digest, None
+    if verify and not video_still_exists(entry['url']):
+        safe_print(f"⚠️ 이전에 업로드한 영상이 더 이상 없음, 다시 업로드: {entry['url']}")
+        return digest, None
+    return digest, entry['url']
+
+def record_uploaded_video(email, file_path, digest, url):
+    """업로드 결과를 인덱스에 기록"""
+    stat = os.stat(file_path)
+    try:
+        with _upload_index_lock, file_lock(UPLOAD_INDEX_PATH):
+            index = load_upload_index()
+            index['videos'][f"{email}:{digest}"] = {
+                'url': url,
+                'file_name': os.path.basename(file_path),
+                'size': stat.st_size,
+                'uploaded_at': time.time(),
+            }
+            index['hashes'][os.path.abspath(file_path)] = {
+                'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest,
+            }
+            save_upload_index(index)
+    except Exception as e:
+        safe_print(f"업로드 인덱스 저장 실패 (무시됨): {e}")
+
+# 재개 가능한 Data API 업로드 설정
+UPLOAD_STATE_DIR = os.path.join(os.getcwd(), 'upload_sessions')
+UPLOAD_SESSION_MAX_AGE_DAYS = 6          # 업로드 세션 URI는 약 1주일 유효, 그 전에 폐기
+UPLOAD_CHUNK_UNIT = 256 * 1024           # 청크 크기는 256KB의 배수여야 함
+UPLOAD_CHUNK_INITIAL = 8 * 1024 * 1024
+UPLOAD_CHUNK_MIN = 1024 * 1024
+UPLOAD_CHUNK_MAX = 128 * 1024 * 1024
+UPLOAD_CHUNK_TARGET_SECONDS = 10         # 청크 하나가 이 시간 정도에 전송되도록 크기 조절
+UPLOAD_MAX_RETRIES = 8
+UPLOAD_RETRY_STATUSES = (500, 502, 503, 504)
+UPLOAD_MAX_WORKERS = 3                   # 로컬 영상 동시 업로드 수
+UPLOAD_SCOPES = ["https://www.googleapis.com/auth/youtube.upload"]
+
+def get_upload_state_path(email, file_path):
+    """계정+파일(경로/크기/수정시각)별 업로드 상태 파일 경로"""
+    import hashlib
+    stat = os.stat(file_path)
+    key = f"{email}|{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+    return os.path.join(UPLOAD_STATE_DIR, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+
+def load_upload_state(state_path):
+    """저장된 업로드 세션 로드 (없거나 오래됐으면 None)"""
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except Exception:
+        return None
+    if time.time() - state.get('created_at', 0) > UPLOAD_SESSION_MAX_AGE_DAYS * 86400:
+        remove_upload_state(state_path)
+        return None
+    return state
+
+def save_upload_state(state_path, state):
+    """업로드 세션 저장 (임시 파일에 쓴 뒤 교체)"""
+    try:
+        os.makedirs(UPLOAD_STATE_DIR, exist_ok=True)
+        tmp_path = state_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, state_path)
+    except Exception as e:
+        safe_print(f"업로드 상태 저장 실패 (무시됨): {e}")
+
+def remove_upload_state(state_path):
+    try:
+        os.remove(state_path)
+    except OSError:
+        pass
+
+def next_chunk_size(current, sent_bytes, seconds):
+    """측정한 전송 속도로 다음 청크 크기 계산 (256KB 배수, 최소/최대 제한)"""
+    if sent_bytes <= 0 or seconds <= 0:
+        return current
+    target = sent_bytes / seconds * UPLOAD_CHUNK_TARGET_SECONDS
+    target = min(target, current * 4)  # 한 번에 너무 크게 늘리지 않음
+    target = int(target // UPLOAD_CHUNK_UNIT) * UPLOAD_CHUNK_UNIT
+    return max(UPLOAD_CHUNK_MIN, min(UPLOAD_CHUNK_MAX, target))
+
+def query_upload_offset(request, session_uri, total_size):
+    """
+    업로드 세션에 서버가 받은 위치 조회
+    반환: (다음 전송 위치, None) / 이미 완료된 경우 (total_size, 응답) / 세션 만료 시 (None, None)
+    """
+    resp, content = request.http.request(
+        session_uri, "PUT", headers={"Content-Range": f"bytes */{total_size}", "Content-Length": "0"})
+    if resp.status in (200, 201):
+        return total_size, json.loads(content)
+    if resp.status == 308:
+        received = resp.get('range')
+        return (int(received.split('-')[1]) + 1 if received else 0), None
+    return None, None
+
+def print_upload_progress(file_path, sent, total):
+    """기본 업로드 진행률 출력"""
+    percent = sent * 100 / total if total else 100
+    safe_print(f"⬆️ {os.path.basename(file_path)}: {sent / 1024 / 1024:.1f}/{total / 1024 / 1024:.1f} MB ({percent:.0f}%)")
+
+# YouTube Data API discovery 문서: 라이브러리 내장본 → 로컬 캐시 → 최초 1회 다운로드 순으로 사용
+DISCOVERY_CACHE_PATH = os.path.join(os.getcwd(), 'discovery_cache', 'youtube.v3.json')
+YOUTUBE_DISCOVERY_URL = "https://www.googleapis.com/discovery/v1/apis/youtube/v3/rest"
+
+_youtube_discovery = None  # 파싱된 discovery 문서 (프로세스당 1회)
+_youtube_clients = {}      # {email: (creds, youtube)} 계정별 클라이언트 캐시
+
+def load_youtube_discovery():
+    """YouTube v3 discovery 문서를 네트워크 없이 로드 (없을 때만 1회 다운로드 후 캐시)"""
+    global _youtube_discovery
+    if _youtube_discovery is not None:
+        return _youtube_discovery
+    doc = None
+    try:
+        from googleapiclient.discovery_cache import get_static_doc  # google-api-python-client 2.x 내장 문서
+        doc = get_static_doc("youtube", "v3")
+    except ImportError:
+        pass
+    if not doc and os.path.exists(DISCOVERY_CACHE_PATH):
+        with open(DISCOVERY_CACHE_PATH, 'r', encoding='utf-8') as f:
+            doc = f.read()
+    if not doc:
+        import requests
+        safe_print("YouTube API discovery 문서 다운로드 (최초 1회)...")
+        response = requests.get(YOUTUBE_DISCOVERY_URL, timeout=10)
+        response.raise_for_status()
+        doc = response.text
+        os.makedirs(os.path.dirname(DISCOVERY_CACHE_PATH), exist_ok=True)
+        tmp_path = DISCOVERY_CACHE_PATH + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(doc)
+        os.replace(tmp_path, DISCOVERY_CACHE_PATH)
+    _youtube_discovery = json.loads(doc)
+    return _youtube_discovery
+
+def build_youtube_client(email):
+    """
+    계정의 인증 정보와 YouTube Data API 클라이언트 반환
+    로컬 discovery 문서로 만들고 계정별로 캐시해 업로드마다 다시 만들지 않음
+    """
+    if email in _youtube_clients:
+        return _youtube_clients[email]
+    from googleapiclient.discovery import build_from_document  # pip install google-api-python-client
+    creds = get_credentials(email, UPLOAD_SCOPES)
+    client = (creds, build_from_document(load_youtube_discovery(), credentials=creds))
+    _youtube_clients[email] = client
+    return client
+
+def build_authorized_http(creds):
+    """스레드별 인증 HTTP 객체 (httplib2.Http는 스레드 간 공유 불가)"""
+    import google_auth_httplib2
+    import httplib2
+    return google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http())
+
+def upload_video_to_youtube(file_path, email=None, progress=None, youtube=None, http=None, verify_existing=False):
     """
     로컬 영상을 YouTube에 업로드하고, 업로드된 영상의 URL을 반환
     email 인자를 받아 계정별로 토큰을 분리 저장/사용
+    - 청크 단위 재개 가능 업로드, 청크 크기는 측정한 전송 속도에 맞춰 조절
+    - 5xx/연결 오류는 지수 백오프로 재시도
+    - 세션 URI/전송 위치를 upload_sessions/에 저장해 프로세스 재시작 시 이어서 업로드
+    - progress(file_path, 보낸 바이트, 전체 바이트): 청크마다 호출되는 진행률 콜백
+    - youtube/http: 공유 클라이언트와 이 스레드 전용 인증 HTTP (없으면 새로 생성)
+    - 같은 계정으로 같은 내용의 파일을 올린 적이 있으면 업로드 없이 기존 URL 반환
+      (verify_existing=True면 그 영상이 아직 있는지 확인 후 사용)
     """
     try:
-        from googleapiclient.discovery import build  # pip install google-api-python-client
+        import random
+        import httplib2
+        from googleapiclient.errors import HttpError
         from googleapiclient.http import MediaFileUpload
-        SCOPES = ["https://www.googleapis.com/auth/youtube.upload"]
         # email 인자가 없으면 기본 계정(기존 방식)
         if not email:
             email = "default"
-        creds = get_credentials(email, SCOPES)
-        youtube = build("youtube", "v3", credentials=creds)
+        report = progress or print_upload_progress
+        
+        def progress(path, sent, total):
+            report(path, sent, total)
+            emit_event('upload_progress', file=os.path.basename(path), sent=sent, total=total,
+                       percent=round(sent * 100 / total, 1) if total else 100.0)
+        
+        digest, existing_url = find_uploaded_video(email, file_path, verify=verify_existing)
+        if existing_url:
+            safe_print(f"♻️ 이미 업로드된 영상 재사용: {os.path.basename(file_path)} → {existing_url}")
+            total_size = os.path.getsize(file_path)
+            progress(file_path, total_size, total_size)
+            return existing_url
+        
+        if youtube is None:
+            _, youtube = build_youtube_client(email)
+        
+        total_size = os.path.getsize(file_path)
+        state_path = get_upload_state_path(email, file_path)
+        state = load_upload_state(state_path)
+        media = MediaFileUpload(file_path, chunksize=(state or {}).get('chunk_size', UPLOAD_CHUNK_INITIAL),
+                                resumable=True)
         request = youtube.videos().insert(
             part="snippet,status",
             body={
                 "snippet": {"title": os.path.basename(file_path), "description": "자동 업로드"},
                 "status": {"privacyStatus": "unlisted"},
             },
-            media_body=MediaFileUpload(file_path)
+            media_body=media
         )
-        response = request.execute()
+        if http is not None:
+            request.http = http
+        
+        response = None
+        if state:
+            offset, response = query_upload_offset(request, state['session_uri'], total_size)
+            if offset is None:
+                safe_print("⚠️ 이전 업로드 세션이 만료됨 - 처음부터 업로드")
+                remove_upload_state(state_path)
+                state = None
+            elif response is None:
+                request.resumable_uri = state['session_uri']
+                request.resumable_progress = offset
+                safe_print(f"🔄 이전 업로드 이어서 진행: {offset:,}/{total_size:,} bytes")
+        if not state:
+            state = {'file_path': os.path.abspath(file_path), 'email': email, 'created_at': time.time()}
+        
+        retries = 0
+        while response is None:
+            sent_before = request.resumable_progress
+            chunk_started = time.perf_counter()
+            try:
+                _, response = request.next_chunk()
+            except HttpError as e:
+                if e.resp.status not in UPLOAD_RETRY_STATUSES:
+                    raise
+                error = e
+            except (OSError, httplib2.HttpLib2Error) as e:
+                error = e
+            else:
+                retries = 0
+                if response is None:
+                    # MediaFileUpload는 청크 크기를 생성 시에만 받으므로 직접 갱신
+                    media._chunksize = next_chunk_size(media.chunksize(), request.resumable_progress - sent_before,
+                                                       time.perf_counter() - chunk_started)
+                    state.update(session_uri=request.resumable_uri, offset=request.resumable_progress,
+                                 chunk_size=media.chunksize())
+                    save_upload_state(state_path, state)
+                    progress(file_path, request.resumable_progress, total_size)
+                continue
+            
+            # 재시도: 다음 next_chunk가 서버에 받은 위치를 조회한 뒤 이어서 전송
+            retries += 1
+            if retries > UPLOAD_MAX_RETRIES:
+                raise error
+            delay = min(2 ** retries, 64) + random.random()
+            safe_print(f"⚠️ 업로드 오류, {delay:.1f}초 후 재시도 ({retries}/{UPLOAD_MAX_RETRIES}): {error}")
+            time.sleep(delay)
+        
+        remove_upload_state(state_path)
+        progress(file_path, total_size, total_size)
         video_id = response['id']
         video_url = f"https://www.youtube.com/watch?v={video_id}"
+        record_uploaded_video(email, file_path, digest, video_url)
         safe_print(f"✅ 유튜브 업로드 완료: {video_url}")
         return video_url
     except Exception as e:
         safe_print(f"❌ 유튜브 업로드 실패: {e}")
+        report_error('upload_failed', e, file=os.path.basename(file_path), cause=classify_error(e))
         return None
 
+def upload_videos_concurrently(file_paths, email=None, max_workers=UPLOAD_MAX_WORKERS, verify_existing=False):
+    """
+    여러 로컬 영상을 제한된 스레드 풀로 동시에 업로드
+    인증 정보와 API 클라이언트는 한 번만 만들어 공유하고, HTTP 연결만 스레드별로 사용
+    반환: 입력 순서대로 [{'file_path', 'url', 'elapsed'}] (실패 시 url은 None)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    if not file_paths:
+        return []
+    email = email or "default"
+    try:
+        creds, youtube = build_youtube_client(email)
+    except Exception as e:
+        safe_print(f"❌ 유튜브 API 인증/클라이언트 생성 실패: {e}")
+        report_error('auth_error', e, cause=classify_error(e))
+        return [{'file_path': path, 'url': None, 'elapsed': 0} for path in file_paths]
+
+    sizes = {path: os.path.getsize(path) for path in file_paths}
+    total = sum(sizes.values())
+    sent = {path: 0 for path in file_paths}
+    lock = threading.Lock()
+
+    def report(path, sent_bytes, size):
+        with lock:
+            sent[path] = sent_bytes
+            done = sum(sent.values())
+        percent = done * 100 / total if total else 100
+        safe_print(f"⬆️ {os.path.basename(path)}: {sent_bytes / 1024 / 1024:.1f}/{size / 1024 / 1024:.1f} MB "
+                   f"| 전체 {done / 1024 / 1024:.1f}/{total / 1024 / 1024:.1f} MB ({percent:.0f}%)")
+
+    def upload_one(path):
+        started = time.time()
+        url = upload_video_to_youtube(path, email=email, progress=report, youtube=youtube,
+                                      http=build_authorized_http(creds), verify_existing=verify_existing)
+        return {'file_path': path, 'url': url, 'elapsed': round(time.time() - started, 3)}
+
+    safe_print(f"영상 {len(file_paths)}개 동시 업로드 시작 (최대 {max_workers}개, 총 {total / 1024 / 1024:.1f} MB)")
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths))) as pool:
+        results = list(pool.map(upload_one, file_paths))
+
+    succeeded = sum(1 for result in results if result['url'])
+    safe_print(f"영상 업로드 결과: 성공 {succeeded}/{len(results)}")
+    for result in results:
+        status = result['url'] or '실패'
+        safe_print(f"  {os.path.basename(result['file_path'])}: {status} ({result['elapsed']}초)")
+    return results
+
 def open_chrome_with_temp_profile(url):
-    # 크롬 실행 파일 경로를 환경변수 또는 PATH에서 동적으로 찾기
-    chrome_path = shutil.which('chrome') or shutil.which('chrome.exe')
-    if not chrome_path:
-        # 일반적인 설치 경로 후보들
-        possible_paths = [
-            os.path.expandvars(r'%ProgramFiles%/Google/Chrome/Application/chrome.exe'),
-            os.path.expandvars(r'%ProgramFiles(x86)%/Google/Chrome/Application/chrome.exe'),
-            os.path.expandvars(r'%LocalAppData%/Google/Chrome/Application/chrome.exe'),
-        ]
-        for path in possible_paths:
-            if os.path.exists(path):
-                chrome_path = path
-                break
+    # 크롬 실행 파일 경로를 PATH 또는 플랫폼별 설치 경로에서 찾기
+    chrome_path = find_chrome_binary()
     if not chrome_path:
         raise FileNotFoundError('Chrome 실행 파일을 찾을 수 없습니다.')
     # 임시 폴더 내 사용자 데이터 디렉토리 사용
@@ -2218,8 +3753,9 @@ def open_chrome_with_temp_profile(url):
         url
     ])
 
-# webbrowser.open을 monkey patch
-webbrowser.open = open_chrome_with_temp_profile
+def install_oauth_browser_hook():
+    """OAuth 동의 화면을 임시 프로필 Chrome으로 열도록 webbrowser.open을 monkey patch"""
+    webbrowser.open = open_chrome_with_temp_profile
 
 def save_cookies(driver, path):
     """
@@ -2228,39 +3764,818 @@ def save_cookies(driver, path):
     with open(path, 'w', encoding='utf-8') as f:
         json.dump(driver.get_cookies(), f, ensure_ascii=False, indent=2)
 
-def load_cookies(driver, path, domain='youtube.com'):
+def cookie_to_cdp(cookie):
+    """Selenium 쿠키(dict)를 CDP Network.CookieParam 형식으로 변환 (만료 시각 유지)"""
+    param = {
+        'name': cookie['name'],
+        'value': cookie['value'],
+        'path': cookie.get('path', '/'),
+        'secure': cookie.get('secure', False),
+        'httpOnly': cookie.get('httpOnly', False),
+    }
+    domain = cookie.get('domain', '')
+    if domain.startswith('.'):
+        param['domain'] = domain
+    else:
+        # 호스트 전용 쿠키는 domain 대신 url로 지정해야 하위 도메인으로 퍼지지 않음
+        param['url'] = f"https://{domain}{param['path']}"
+    if cookie.get('sameSite') in ('Strict', 'Lax', 'None'):
+        param['sameSite'] = cookie['sameSite']
+    if 'expiry' in cookie:
+        param['expires'] = cookie['expiry']
+    return param
+
+@timed('cookie_restore')
+def load_cookies(driver, path, landing_url=None, domain='youtube.com'):
     """
     저장된 쿠키를 불러와 세션에 적용
+    - CDP Network.setCookies 한 번으로 첫 페이지 이동 전에 모두 설정 (만료 시각 유지, 만료된 쿠키 제외)
+    - landing_url이 있으면 그 페이지로 바로 이동 (복원에 필요한 이동은 이 한 번뿐)
+    CDP를 쓸 수 없으면 도메인 이동 후 쿠키를 하나씩 추가하는 기존 방식 사용
+    반환: 적용한 쿠키 수
     """
     with open(path, 'r', encoding='utf-8') as f:
         cookies = json.load(f)
-    driver.get(f'https://{domain}/')
-    for cookie in cookies:
-        cookie.pop('sameSite', None)
-        cookie.pop('expiry', None)
-        try:
-            driver.add_cookie(cookie)
-        except Exception:
-            continue
-    driver.refresh()
+    now = time.time()
+    cookies = [cookie for cookie in cookies if cookie.get('expiry', now + 1) > now]
+    try:
+        driver.execute_cdp_cmd('Network.setCookies', {'cookies': [cookie_to_cdp(c) for c in cookies]})
+    except Exception as e:
+        debug_log("CDP 쿠키 일괄 설정 실패, 개별 추가로 대체: %s", e, level="WARNING")
+        driver.get(f'https://{domain}/')
+        for cookie in cookies:
+            cookie.pop('sameSite', None)
+            try:
+                driver.add_cookie(cookie)
+            except Exception:
+                continue
+        if not landing_url:
+            driver.refresh()
+    if landing_url:
+        driver.get(landing_url)
+    return len(cookies)
 
-def is_logged_in(driver):
+def is_logged_in(driver, navigate=True):
     """
     현재 세션이 YouTube에 로그인되어 있는지 확인
+    navigate=False면 홈페이지로 이동하지 않고 현재 페이지(이미 YouTube에 있는 경우)에서 확인
     """
     try:
-        driver.get('https://www.youtube.com/')
-        time.sleep(2)
-        user_icons = driver.find_elements(By.XPATH, "//button[contains(@aria-label, '계정') or contains(@aria-label, 'Account')]")
-        if user_icons:
-            return True
-        login_btns = driver.find_elements(By.XPATH, "//a[contains(@href, 'accounts.google.com')]")
-        if login_btns:
+        if navigate or "youtube.com" not in driver.current_url:
+            driver.get(YOUTUBE_HOME_URL)
+        # 상단바가 렌더링되어 계정 버튼 또는 로그인 링크가 나타날 때까지 대기
+        # (어느 쪽이 나타났는지는 probe 결과 인덱스로 판정 - implicit wait가 걸린 find_elements를 다시 호출하지 않음)
+        _, winner = wait_for(driver, selector_probe([
+            "//button[contains(@aria-label, '계정') or contains(@aria-label, 'Account')]",
+            "//a[contains(@href, 'accounts.google.com')]",
+        ], visible=False), step='page_load') or (None, None)
+        return winner != 1
+    except Exception:
+        return False
+
+# 세션 유효성 판정 캐시: 계정별로 마지막 확인 결과를 TTL 동안 재사용
+SESSION_CACHE_PATH = os.path.join(os.getcwd(), 'session_cache.json')
+SESSION_CHECK_TTL = 1800                  # 초, --session-ttl로 변경 가능 (0이면 캐시 사용 안 함)
+SESSION_AUTH_COOKIES = ('SID', '__Secure-1PSID', '__Secure-3PSID', 'SAPISID', 'LOGIN_INFO')
+SESSION_PROBE_URL = "https://www.youtube.com/account"
+
+def load_session_cache():
+    try:
+        with open(SESSION_CACHE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+def record_session_verdict(email, cookie_path, valid):
+    """
+    세션 확인 결과 저장 (쿠키 파일이 바뀌면 무효가 되도록 수정 시각도 함께 기록)
+    --manifest/--queue 워커가 동시에 기록해도 서로의 결과를 덮어쓰지 않도록 잠금 안에서 읽고 씀
+    """
+    try:
+        with file_lock(SESSION_CACHE_PATH):
+            cache = load_session_cache()
+            cache[email] = {
+                'valid': valid,
+                'checked_at': time.time(),
+                'cookie_mtime': os.path.getmtime(cookie_path) if os.path.exists(cookie_path) else None,
+            }
+            tmp_path = f"{SESSION_CACHE_PATH}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, SESSION_CACHE_PATH)
+    except Exception as e:
+        safe_print(f"세션 확인 결과 저장 실패 (무시됨): {e}")
+
+def check_session(email, cookie_path, ttl=SESSION_CHECK_TTL):
+    """
+    브라우저 없이 저장된 쿠키의 로그인 유효성 판정
+    1. TTL 이내의 확인 결과가 있고 쿠키 파일이 그대로면 그 결과 사용
+    2. 로그인 쿠키가 없거나 만료됐으면 False
+    3. 쿠키로 가벼운 요청 한 번 (로그인 상태면 200, 아니면 로그인 페이지로 리다이렉트)
+    반환: True/False, 판단할 수 없으면 None (브라우저에서 확인 필요)
+    """
+    entry = load_session_cache().get(email)
+    if (ttl and entry and time.time() - entry.get('checked_at', 0) < ttl
+            and entry.get('cookie_mtime') == os.path.getmtime(cookie_path)):
+        return entry['valid']
+
+    try:
+        with open(cookie_path, 'r', encoding='utf-8') as f:
+            cookies = json.load(f)
+    except Exception:
+        return False
+    now = time.time()
+    auth_cookies = [c for c in cookies if c.get('name') in SESSION_AUTH_COOKIES]
+    if not auth_cookies or any(c.get('expiry', now + 1) <= now for c in auth_cookies):
+        record_session_verdict(email, cookie_path, False)
+        return False
+
+    try:
+        import requests
+        response = requests.get(
+            SESSION_PROBE_URL,
+            cookies={c['name']: c['value'] for c in cookies if c.get('expiry', now + 1) > now},
+            headers={'User-Agent': 'Mozilla/5.0'},
+            allow_redirects=False,
+            timeout=10,
+        )
+    except Exception as e:
+        debug_log("세션 확인 요청 실패: %s", e, level="WARNING")
+        return None
+    if response.status_code == 200:
+        valid = True
+    elif response.is_redirect and 'accounts.google.com' in response.headers.get('Location', ''):
+        valid = False
+    else:
+        return None
+    record_session_verdict(email, cookie_path, valid)
+    return valid
+
+def get_cookie_path(email):
+    return f'youtube_cookies_{email}.json'
+
+def decide_headless(email, is_video_post):
+    """
+    headless 모드 결정
+    최초 인증(토큰 파일 없음) 또는 영상 게시물일 때는 headless=False, 그 외는 headless=True
+    """
+    if not os.path.exists(get_token_path(email)) or is_video_post:
+        safe_print('[정책] 최초 인증 또는 영상 게시물: headless 모드 OFF (창 띄움)')
+        return False
+    safe_print('[정책] 사진/글 게시물: headless 모드 ON (창 없이 실행)')
+    return True
+
+def collect_video_paths(email, videos_online=None, videos_local=None, videos=None, verify_uploads=False,
+                        failed=None):
+    """
+    온라인 URL / 로컬 파일(API 업로드 후 URL) / 기존 --videos 인자를 하나의 목록으로 합침
+    verify_uploads: 이전에 업로드한 영상을 재사용하기 전에 아직 존재하는지 확인
+    failed: 리스트를 넘기면 업로드에 실패한 로컬 파일 경로를 추가함
+    """
+    video_paths = []
+    # 온라인 영상 URL
+    if videos_online:
+        video_paths.extend(videos_online)
+    # 로컬 영상 파일 업로드
+    if videos_local:
+        existing = [local_path for local_path in videos_local if os.path.exists(local_path)]
+        for result in upload_videos_concurrently(existing, email=email, verify_existing=verify_uploads):
+            if result['url']:
+                video_paths.append(result['url'])
+            else:
+                safe_print(f"❌ 영상 업로드 실패: {result['file_path']}")
+                if failed is not None:
+                    failed.append(result['file_path'])
+    # 기존 --videos 인자도 호환
+    if videos:
+        for v in videos:
+            if v.startswith('http'):
+                video_paths.append(v)
+            elif os.path.exists(v) and os.path.splitext(v)[1].lower() in ['.mp4', '.avi', '.mov', '.mkv', '.webm']:
+                video_paths.append(v)
+    return video_paths
+
+def establish_session(driver, username, password, is_video_post=False, session_ttl=SESSION_CHECK_TTL):
+    """
+    쿠키 재사용 또는 로그인으로 YouTube 세션 확보
+    - 영상 게시물: 쿠키가 있어도 무조건 로그인
+    - 일반 게시물: 쿠키가 있으면 쿠키로, 없으면 로그인
+    - 쿠키 유효성은 check_session()으로 먼저 판정 (session_ttl초 동안 결과 캐시)
+      유효하면 페이지 확인 없이 바로 사용, 무효하면 쿠키 적용을 건너뛰고 바로 로그인
+    로그인 실패 시 쿠키 파일을 삭제하고 False 반환
+    """
+    cookie_path = get_cookie_path(username)
+    cookie_login_success = False
+
+    if is_video_post:
+        safe_print("[정책] 영상 게시물: 쿠키 무시, 무조건 로그인 진행")
+    elif os.path.exists(cookie_path):
+        safe_print("쿠키 기반 자동 로그인 시도...")
+        verdict = check_session(username, cookie_path, ttl=session_ttl)
+        if verdict is False:
+            safe_print("❌ 저장된 쿠키 세션이 만료됨, 재로그인 시도")
+        else:
+            try:
+                # 쿠키를 먼저 모두 설정하고 YouTube로 한 번만 이동
+                load_cookies(driver, cookie_path, landing_url=YOUTUBE_HOME_URL)
+                if verdict:
+                    safe_print("✅ 쿠키 자동 로그인 성공! (세션 확인됨)")
+                    cookie_login_success = True
+                elif is_logged_in(driver, navigate=False):
+                    safe_print("✅ 쿠키 자동 로그인 성공!")
+                    record_session_verdict(username, cookie_path, True)
+                    cookie_login_success = True
+                else:
+                    safe_print("❌ 쿠키 자동 로그인 실패, 재로그인 시도")
+                    record_session_verdict(username, cookie_path, False)
+            except Exception as e:
+                safe_print(f"쿠키 자동 로그인 중 오류: {e}")
+
+    if not cookie_login_success:
+        if not login_youtube(driver, username, password):
+            if os.path.exists(cookie_path):
+                try:
+                    os.remove(cookie_path)
+                    safe_print("❌ 실패한 쿠키 파일 삭제")
+                except Exception:
+                    pass
             return False
+        save_cookies(driver, cookie_path)
+        record_session_verdict(username, cookie_path, True)
+        safe_print("✅ 로그인 성공, 쿠키 저장 완료")
+    return True
+
+# 게시 완료 알림(토스트)에 붙는 새 게시물 링크 (피드의 다른 게시물 링크는 제외)
+JS_FIND_POST_URL = """
+var links = document.querySelectorAll(
+    'tp-yt-paper-toast a[href*="/post/"], yt-notification-action-renderer a[href*="/post/"], [role="alert"] a[href*="/post/"]');
+for (var i = 0; i < links.length; i++) {
+    if (links[i].href) return links[i].href;
+}
+return null;
+"""
+
+def find_post_url(driver):
+    """방금 게시한 게시물 URL을 완료 알림에서 찾기 (못 찾으면 None)"""
+    try:
+        return driver.execute_script(JS_FIND_POST_URL)
+    except Exception:
+        return None
+
+def publish_post(driver, content, images=None, video_paths=None, speed='normal'):
+    """
+    게시물 작성 페이지 이동 후 게시물 작성까지 수행
+    """
+    # 이미지 전처리 (브라우저 작업 전에 캐시에서 가져오거나 변환)
+    if images:
+        images = [preprocess_image(path) for path in images]
+    
+    # 게시물 작성 페이지로 이동
+    if not navigate_to_create_post(driver):
+        safe_print("⚠️ 일반 게시물 작성 페이지 이동 실패")
+        safe_print("현재 페이지에서 직접 게시물 작성을 시도합니다...")
+        
+        # 현재 페이지가 YouTube인지 확인
+        current_url = driver.current_url
+        if "youtube.com" not in current_url:
+            safe_print("YouTube 메인 페이지로 이동...")
+            driver.get(YOUTUBE_HOME_URL)
+    
+    # 게시물 작성
+    return create_post(driver, content, images, video_paths, speed)
+
+# 워커 모드: 계정별로 로그인된 브라우저를 유지하며 작업을 순차 처리
+# {username: {'driver': ..., 'headless': bool, 'last_used': float}}
+_warm_sessions = {}
+
+def close_warm_session(username):
+    """워커 세션 하나를 종료"""
+    session = _warm_sessions.pop(username, None)
+    if session:
+        safe_print(f"[워커] 세션 종료: {username}")
+        try:
+            with timing_span('driver_quit', account=username):
+                session['driver'].quit()
+        except Exception:
+            pass
+
+def close_all_warm_sessions():
+    """모든 워커 세션 종료"""
+    for username in list(_warm_sessions):
+        close_warm_session(username)
+
+def is_driver_alive(driver):
+    """드라이버(브라우저)가 아직 응답하는지 확인"""
+    try:
+        driver.current_url
         return True
     except Exception:
         return False
 
+def get_warm_session(username, password, options, is_video_post=False):
+    """
+    계정의 로그인된 드라이버를 반환 (없거나 죽었으면 새로 실행 후 로그인)
+    - 영상 게시물인데 headless 세션이면 창 있는 세션으로 다시 실행
+    - options['max_sessions'] 초과 시 가장 오래 사용하지 않은 세션 종료
+    """
+    session = _warm_sessions.get(username)
+    if session:
+        if not is_driver_alive(session['driver']):
+            safe_print(f"[워커] 응답 없는 세션 재시작: {username}")
+            close_warm_session(username)
+            session = None
+        elif is_video_post and session['headless']:
+            safe_print(f"[워커] 영상 게시물을 위해 창 있는 세션으로 재시작: {username}")
+            close_warm_session(username)
+            session = None
+
+    if session:
+        safe_print(f"[워커] 기존 세션 재사용: {username}")
+        session['last_used'] = time.time()
+        return session['driver']
+
+    while len(_warm_sessions) >= options['max_sessions']:
+        oldest = min(_warm_sessions, key=lambda name: _warm_sessions[name]['last_used'])
+        close_warm_session(oldest)
+
+    headless = decide_headless(username, is_video_post)
+    driver = setup_driver(headless=headless, speed=options['speed'],
+                          profile_account=username if options.get('persistent_profile') else None)
+    if not establish_session(driver, username, password, is_video_post=is_video_post,
+                             session_ttl=options.get('session_ttl', SESSION_CHECK_TTL)):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        return None
+    _warm_sessions[username] = {'driver': driver, 'headless': headless, 'last_used': time.time()}
+    return driver
+
+def run_worker_job(job, options, checkpoints=None, on_checkpoint=None):
+    """
+    워커 작업 하나 처리 후 결과 dict 반환
+    job: {"id", "username", "password", "content", "images", "videos",
+          "videos_local", "videos_online", "speed"}
+    checkpoints: 이전 시도에서 완료한 단계 {단계: 데이터} (해당 단계는 다시 하지 않음)
+    on_checkpoint(단계, 데이터): 단계가 끝날 때마다 호출 (작업 큐가 저장)
+    """
+    started = time.time()
+    checkpoints = checkpoints or {}
+    result = {'id': job.get('id'), 'username': job.get('username'), 'success': False, 'timings': {}}
+    set_timing_context(account=job.get('username'), job=job.get('id'))
+    try:
+        username = job['username']
+        password = job.get('password', '')
+        content = job['content']
+    except KeyError as e:
+        result['error'] = f"필수 항목 누락: {e}"
+        result['error_code'] = 'invalid_job'
+        return result
+
+    try:
+        if 'published' in checkpoints:
+            # 이전 시도에서 이미 게시됨 (완료 기록 전에 중단된 경우) - 중복 게시하지 않음
+            safe_print(f"[작업 {job.get('id')}] 이미 게시된 작업, 완료 처리만 수행")
+            result['success'] = True
+            result['resumed_from'] = 'published'
+            result['post_url'] = checkpoints['published'].get('post_url')
+            return result
+
+        step_started = time.time()
+        if 'videos' in checkpoints:
+            # 영상 업로드 단계는 이전 시도에서 완료됨
+            video_paths = checkpoints['videos']['video_paths']
+            result['resumed_from'] = 'videos'
+        else:
+            failed_uploads = []
+            video_paths = collect_video_paths(
+                username,
+                videos_online=job.get('videos_online'),
+                videos_local=job.get('videos_local'),
+                videos=job.get('videos'),
+                verify_uploads=options.get('verify_uploads', False),
+                failed=failed_uploads,
+            )
+            if failed_uploads:
+                # 일부 영상만으로 게시하거나 부분 결과를 체크포인트로 고정하지 않음 (재시도 시 다시 업로드)
+                result['error'] = f"영상 업로드 실패: {', '.join(failed_uploads)}"
+                result['error_code'] = 'upload_failed'
+                result['timings']['videos'] = round(time.time() - step_started, 3)
+                return result
+            if on_checkpoint:
+                on_checkpoint('videos', {'video_paths': video_paths})
+        result['timings']['videos'] = round(time.time() - step_started, 3)
+
+        step_started = time.time()
+        result['session_reused'] = username in _warm_sessions
+        driver = get_warm_session(
+            username, password,
+            dict(options, speed=job.get('speed', options['speed'])),
+            is_video_post=len(video_paths) > 0,
+        )
+        result['timings']['session'] = round(time.time() - step_started, 3)
+        if not driver:
+            result['error'] = "로그인 실패"
+            result['error_code'] = 'login_failed'
+            return result
+
+        # 이전 작업의 다이얼로그/페이지 상태 초기화
+        step_started = time.time()
+        driver.get(YOUTUBE_HOME_URL)
+
+        images = job.get('images') or None
+        if images:
+            images = images[:1]  # 이미지 1장만 업로드
+        result['success'] = bool(publish_post(driver, content, images, video_paths,
+                                                     job.get('speed', options['speed'])))
+        result['timings']['post'] = round(time.time() - step_started, 3)
+        if result['success']:
+            result['post_url'] = find_post_url(driver)
+            if on_checkpoint:
+                on_checkpoint('published', {'post_url': result['post_url']})
+        else:
+            result['error'] = "게시물 작성 실패"
+            result['error_code'] = 'publish_failed'
+    except Exception as e:
+        result['error'] = str(e)
+        result['error_code'] = classify_error(e)
+        # 오류 후 세션 상태를 알 수 없으므로 브라우저가 죽었으면 정리
+        session = _warm_sessions.get(username)
+        if session and not is_driver_alive(session['driver']):
+            close_warm_session(username)
+    finally:
+        result['elapsed'] = round(time.time() - started, 3)
+    return result
+
+def handle_worker_line(line, reply, options):
+    """
+    JSON 한 줄을 처리하고 결과를 reply(dict)로 전달
+    반환값이 False면 워커 종료
+    """
+    line = line.strip()
+    if not line:
+        return True
+    try:
+        job = json.loads(line)
+    except ValueError as e:
+        reply({'success': False, 'error': f"JSON 파싱 오류: {e}"})
+        return True
+
+    cmd = job.get('cmd', 'post')
+    if cmd == 'shutdown':
+        reply({'cmd': 'shutdown', 'success': True})
+        return False
+    if cmd == 'ping':
+        reply({'cmd': 'ping', 'success': True, 'sessions': sorted(_warm_sessions)})
+        return True
+    if cmd == 'close':
+        close_warm_session(job.get('username'))
+        reply({'cmd': 'close', 'success': True, 'username': job.get('username')})
+        return True
+    reply(run_worker_job(job, options))
+    return True
+
+def run_worker(options, port=None):
+    """
+    상주 워커 모드
+    options: {'speed', 'max_sessions', 'persistent_profile', 'verify_uploads', 'session_ttl'}
+    - port 없음: stdin으로 JSON 한 줄씩 작업을 받고 stdout으로 결과 JSON 한 줄씩 응답
+      (사람용 로그는 stderr로 출력)
+    - port 지정: 127.0.0.1:port 에서 같은 JSON 줄 프로토콜로 작업 수신
+    브라우저 실행/로그인은 계정별로 한 번만 수행하고 이후 작업은 기존 세션 재사용
+    """
+    saved_stdout = sys.stdout
+    reply_stream = _event_stream or sys.stdout  # --events json이면 이벤트와 같은 stdout으로 응답
+    if not port:
+        sys.stdout = sys.stderr  # 결과 JSON과 로그가 섞이지 않도록 로그는 stderr로
+    try:
+        # 동시에 실행 중인 다른 워커/매니페스트 프로세스의 Chrome 프로필을 지우지 않도록 전역 정리는 하지 않음
+        if port:
+            import socketserver
+
+            class WorkerHandler(socketserver.StreamRequestHandler):
+                def handle(self):
+                    def reply(obj):
+                        self.wfile.write((json.dumps(obj, ensure_ascii=False) + '\n').encode('utf-8'))
+                        self.wfile.flush()
+                    for raw in self.rfile:
+                        if not handle_worker_line(raw.decode('utf-8'), reply, options):
+                            self.server.stop_requested = True
+                            break
+
+            with socketserver.TCPServer(('127.0.0.1', port), WorkerHandler) as server:
+                server.stop_requested = False
+                safe_print(f"[워커] 127.0.0.1:{port} 에서 작업 대기 중...")
+                while not server.stop_requested:
+                    server.handle_request()
+        else:
+            def reply(obj):
+                reply_stream.write(json.dumps(obj, ensure_ascii=False) + '\n')
+                reply_stream.flush()
+
+            safe_print("[워커] stdin에서 작업 대기 중...")
+            for line in sys.stdin:
+                if not handle_worker_line(line, reply, options):
+                    break
+    except KeyboardInterrupt:
+        safe_print("사용자에 의해 중단됨")
+    finally:
+        close_all_warm_sessions()
+        cleanup_temp_files(own_only=True)
+        sys.stdout = saved_stdout
+
+def load_manifest(path, default_username=None, default_password=None):
+    """
+    JSONL 매니페스트 로드 (한 줄에 게시물 하나, 빈 줄/# 주석 무시)
+    각 항목은 워커 작업과 같은 형식이며 username/password가 없으면 기본값 사용
+    반환: (작업 목록, 파싱 오류 결과 목록)
+    """
+    jobs = []
+    errors = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                job = json.loads(line)
+                if not isinstance(job, dict):
+                    raise ValueError("JSON 객체가 아님")
+            except ValueError as e:
+                errors.append({'id': line_no, 'line': line_no, 'success': False, 'error': f"JSON 파싱 오류: {e}"})
+                continue
+            job.setdefault('id', line_no)
+            job['line'] = line_no
+            if default_username and not job.get('username'):
+                job['username'] = default_username
+            if default_password and not job.get('password'):
+                job['password'] = default_password
+            jobs.append(job)
+    return jobs, errors
+
+def run_manifest(path, options, default_username=None, default_password=None):
+    """
+    매니페스트 배치 모드
+    - 계정별로 묶어 한 번 실행/로그인한 브라우저로 해당 계정의 게시물을 순서대로 처리
+    - 게시물마다 결과와 단계별 시간을 JSON 한 줄로 stdout에 즉시 출력 (사람용 로그는 stderr)
+    - 마지막 줄은 전체 요약
+    반환값: 실패한 게시물 수
+    """
+    saved_stdout = sys.stdout
+    reply_stream = _event_stream or sys.stdout  # --events json이면 이벤트와 같은 stdout으로 응답
+    sys.stdout = sys.stderr  # 결과 JSON과 로그가 섞이지 않도록 로그는 stderr로
+
+    def reply(obj):
+        reply_stream.write(json.dumps(obj, ensure_ascii=False) + '\n')
+        reply_stream.flush()
+
+    started = time.time()
+    succeeded = 0
+    failed = 0
+    try:
+        jobs, errors = load_manifest(path, default_username, default_password)
+        for error in errors:
+            reply(error)
+        failed += len(errors)
+
+        # 계정별로 묶기 (처음 등장한 순서 유지, 계정 안에서는 파일 순서 유지)
+        by_account = {}
+        for job in jobs:
+            by_account.setdefault(job.get('username'), []).append(job)
+        safe_print(f"[매니페스트] 게시물 {len(jobs)}개, 계정 {len(by_account)}개")
+
+        # 동시에 실행 중인 다른 워커/매니페스트 프로세스의 Chrome 프로필을 지우지 않도록 전역 정리는 하지 않음
+        for username, account_jobs in by_account.items():
+            for job in account_jobs:
+                result = run_worker_job(job, options)
+                result['line'] = job['line']
+                reply(result)
+                if result['success']:
+                    succeeded += 1
+                else:
+                    failed += 1
+            # 다음 계정으로 넘어가기 전에 브라우저 종료 (동시에 하나만 유지)
+            close_warm_session(username)
+    except KeyboardInterrupt:
+        safe_print("사용자에 의해 중단됨")
+        failed += 1
+    finally:
+        close_all_warm_sessions()
+        cleanup_temp_files(own_only=True)
+        reply({'summary': True, 'succeeded': succeeded, 'failed': failed,
+               'elapsed': round(time.time() - started, 3)})
+        sys.stdout = saved_stdout
+    return failed
+
+# 작업 큐 (--queue): SQLite에 작업을 저장해 호스트가 재시작돼도 이어서 처리
+# 워커는 리스(lease)를 잡은 작업만 실행하고, 실패 시 지수 백오프로 다시 예약하며,
+# 단계별 체크포인트를 남겨 재시도 때 완료된 단계(영상 업로드, 게시)는 건너뜀
+JOB_LEASE_SECONDS = 600          # 리스 유효 시간 (실행 중에는 1/3 주기로 갱신)
+JOB_MAX_ATTEMPTS = 5
+JOB_BACKOFF_BASE = 30            # 재시도 대기: 30초, 60초, 120초, ... (최대 JOB_BACKOFF_MAX)
+JOB_BACKOFF_MAX = 3600
+JOB_POLL_INTERVAL = 5            # 실행할 작업이 없을 때 다시 확인하는 간격 (초)
+
+JOB_DB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    run_at REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    lease_owner TEXT,
+    lease_expires REAL,
+    checkpoints TEXT NOT NULL DEFAULT '{}',
+    last_error TEXT,
+    result TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (status, run_at);
+"""
+
+def open_job_db(path):
+    """작업 큐 DB 열기 (없으면 생성, 비밀번호가 들어 있으므로 소유자만 읽기/쓰기)"""
+    import sqlite3
+    is_new = not os.path.exists(path)
+    conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA busy_timeout=30000")
+    conn.executescript(JOB_DB_SCHEMA)
+    if is_new and os.name != 'nt':
+        os.chmod(path, 0o600)
+    return conn
+
+def parse_run_at(value):
+    """예약 시각 해석: epoch 초 또는 ISO 8601 (시간대 없으면 로컬 시각), None이면 지금"""
+    if value is None:
+        return time.time()
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+def enqueue_job(conn, job, run_at=None, max_attempts=JOB_MAX_ATTEMPTS):
+    """작업 추가 후 작업 id 반환"""
+    now = time.time()
+    cursor = conn.execute(
+        "INSERT INTO jobs (payload, run_at, max_attempts, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+        (json.dumps(job, ensure_ascii=False), parse_run_at(run_at), max_attempts, now, now))
+    return cursor.lastrowid
+
+def claim_job(conn, owner, lease_seconds=JOB_LEASE_SECONDS):
+    """
+    실행 시각이 된 작업 또는 리스가 만료된 실행 중 작업 하나를 원자적으로 가져옴
+    - 워커가 비정상 종료(OOM, 브라우저 충돌, SIGKILL)해 finish_job까지 가지 못한 작업도
+      시도 횟수에 포함되므로, 리스가 만료됐고 시도 횟수를 다 쓴 작업은 failed로 정리
+    반환: 작업 row(dict) 또는 None
+    """
+    now = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.execute(
+            "UPDATE jobs SET status = 'failed', lease_owner = NULL, lease_expires = NULL,"
+            " last_error = COALESCE(last_error, '리스 만료 (워커 비정상 종료)'), updated_at = ?"
+            " WHERE status = 'running' AND lease_expires < ? AND attempts >= max_attempts",
+            (now, now))
+        row = conn.execute(
+            "SELECT * FROM jobs WHERE (status = 'queued' AND run_at <= ?)"
+            " OR (status = 'running' AND lease_expires < ? AND attempts < max_attempts)"
+            " ORDER BY run_at, id LIMIT 1",
+            (now, now)).fetchone()
+        if row is None:
+            conn.execute("COMMIT")
+            return None
+        conn.execute(
+            "UPDATE jobs SET status = 'running', lease_owner = ?, lease_expires = ?,"
+            " attempts = attempts + 1, updated_at = ? WHERE id = ?",
+            (owner, now + lease_seconds, now, row['id']))
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    job = dict(row)
+    job['attempts'] += 1
+    job['checkpoints'] = json.loads(job['checkpoints'] or '{}')
+    return job
+
+def renew_lease(conn, job_id, owner, lease_seconds=JOB_LEASE_SECONDS):
+    """리스 연장 (다른 워커가 가져갔으면 False)"""
+    cursor = conn.execute(
+        "UPDATE jobs SET lease_expires = ?, updated_at = ? WHERE id = ? AND lease_owner = ? AND status = 'running'",
+        (time.time() + lease_seconds, time.time(), job_id, owner))
+    return cursor.rowcount == 1
+
+def save_job_checkpoint(conn, job_id, owner, stage, data, lease_seconds=JOB_LEASE_SECONDS):
+    """단계 체크포인트 저장 (리스도 함께 연장)"""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute("SELECT checkpoints FROM jobs WHERE id = ? AND lease_owner = ?",
+                           (job_id, owner)).fetchone()
+        if row is None:
+            conn.execute("COMMIT")
+            return False
+        checkpoints = json.loads(row['checkpoints'] or '{}')
+        checkpoints[stage] = dict(data, completed_at=round(time.time(), 3))
+        conn.execute(
+            "UPDATE jobs SET checkpoints = ?, lease_expires = ?, updated_at = ? WHERE id = ?",
+            (json.dumps(checkpoints, ensure_ascii=False), time.time() + lease_seconds, time.time(), job_id))
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return True
+
+def job_backoff(attempts):
+    """attempts번째 실패 후 다시 시도하기까지 대기 시간 (지수 백오프 + 지터)"""
+    import random
+    return min(JOB_BACKOFF_BASE * 2 ** (attempts - 1), JOB_BACKOFF_MAX) * (0.8 + random.random() * 0.4)
+
+def finish_job(conn, job, owner, result):
+    """
+    실행 결과 기록: 성공이면 done, 실패면 남은 시도 횟수에 따라 백오프 후 재예약 또는 failed
+    반환: 새 상태 (리스를 잃었으면 None)
+    """
+    now = time.time()
+    if result.get('success'):
+        status, run_at = 'done', job['run_at']
+    elif job['attempts'] >= job['max_attempts']:
+        status, run_at = 'failed', job['run_at']
+    else:
+        status, run_at = 'queued', now + job_backoff(job['attempts'])
+    cursor = conn.execute(
+        "UPDATE jobs SET status = ?, run_at = ?, lease_owner = NULL, lease_expires = NULL,"
+        " last_error = ?, result = ?, updated_at = ? WHERE id = ? AND lease_owner = ?",
+        (status, run_at, result.get('error'), json.dumps(result, ensure_ascii=False, default=str),
+         now, job['id'], owner))
+    return status if cursor.rowcount == 1 else None
+
+def lease_heartbeat(db_path, job_id, owner, stop, lease_seconds=JOB_LEASE_SECONDS):
+    """작업 실행 중 리스를 주기적으로 연장하는 스레드 본문 (sqlite 연결은 스레드별로 사용)"""
+    conn = open_job_db(db_path)
+    try:
+        while not stop.wait(lease_seconds / 3):
+            if not renew_lease(conn, job_id, owner, lease_seconds):
+                safe_print(f"⚠️ [큐] 작업 {job_id}의 리스를 잃음 (다른 워커가 가져감)")
+                break
+    finally:
+        conn.close()
+
+def run_job_queue(db_path, options, once=False):
+    """
+    작업 큐 워커 모드
+    - 실행 시각이 된 작업을 리스로 잡아 run_worker_job으로 처리 (계정 세션은 워커 모드처럼 재사용)
+    - 체크포인트가 있으면 완료된 단계는 건너뛰고 이어서 실행
+    - once=True면 실행할 작업이 없을 때 종료
+    """
+    import socket
+    owner = f"{socket.gethostname()}:{os.getpid()}"
+    conn = open_job_db(db_path)
+    safe_print(f"[큐] {db_path} 에서 작업 대기 중... (워커 {owner})")
+    try:
+        # 같은 큐를 처리하는 다른 워커의 Chrome 프로필을 지우지 않도록 시작 시 전역 정리는 하지 않음
+        while True:
+            job = claim_job(conn, owner)
+            if job is None:
+                if once:
+                    break
+                time.sleep(JOB_POLL_INTERVAL)
+                continue
+
+            payload = dict(json.loads(job['payload']), id=job['id'])
+            safe_print(f"[큐] 작업 {job['id']} 시작 (시도 {job['attempts']}/{job['max_attempts']}"
+                       + (f", 완료 단계: {', '.join(job['checkpoints'])})" if job['checkpoints'] else ")"))
+            stop = threading.Event()
+            heartbeat = threading.Thread(target=lease_heartbeat, args=(db_path, job['id'], owner, stop), daemon=True)
+            heartbeat.start()
+            try:
+                result = run_worker_job(
+                    payload, options, checkpoints=job['checkpoints'],
+                    on_checkpoint=lambda stage, data: save_job_checkpoint(conn, job['id'], owner, stage, data))
+            finally:
+                stop.set()
+                heartbeat.join()
+            result['attempts'] = job['attempts']
+            status = finish_job(conn, job, owner, result)
+            emit_event('result', ok=bool(result.get('success')), status=status, attempts=job['attempts'],
+                       post_url=result.get('post_url'), code=result.get('error_code'))
+            if status == 'done':
+                safe_print(f"✅ [큐] 작업 {job['id']} 완료")
+            elif status == 'queued':
+                safe_print(f"⚠️ [큐] 작업 {job['id']} 실패, 재시도 예약: {result.get('error')}")
+            elif status == 'failed':
+                safe_print(f"❌ [큐] 작업 {job['id']} 최종 실패 ({job['attempts']}회 시도): {result.get('error')}")
+            else:
+                safe_print(f"⚠️ [큐] 작업 {job['id']} 결과를 기록하지 못함 (리스 만료)")
+    except KeyboardInterrupt:
+        safe_print("사용자에 의해 중단됨")
+    finally:
+        close_all_warm_sessions()
+        cleanup_temp_files(own_only=True)
+        conn.close()
+
 def main():
     """
     전체 자동화 실행의 진입점
@@ -2268,18 +4583,52 @@ def main():
     - 정책 변화/실패 시 상세 로그 및 예외 처리
     """
     parser = argparse.ArgumentParser(description='YouTube 게시물 자동화 - 수정된 버전')
-    parser.add_argument('--username', required=True, help='YouTube 계정 이메일')
-    parser.add_argument('--password', required=True, help='YouTube 계정 비밀번호')
-    parser.add_argument('--content', required=True, help='게시물 내용')
+    parser.add_argument('--username', help='YouTube 계정 이메일')
+    parser.add_argument('--password', help='YouTube 계정 비밀번호')
+    parser.add_argument('--content', help='게시물 내용')
     parser.add_argument('--images', nargs='*', help='업로드할 이미지 파일 경로들 (1장만 업로드, 첫 번째 파일만 사용)')
     parser.add_argument('--videos', nargs='*', help='추가할 동영상 파일 경로들')
     parser.add_argument('--videos-local', nargs='*', help='로컬 영상 파일 경로들')
     parser.add_argument('--videos-online', nargs='*', help='온라인(YouTube 등) 영상 URL들')
     parser.add_argument('--speed', choices=['slow', 'normal', 'fast'], default='normal', help='실행 속도')
-    parser.add_argument('--debug', action='store_true', help='디버그 모드 (상세 로그 출력)')
+    parser.add_argument('--debug', action='store_true', help='디버그 모드 (상세 로그 출력, --log-level DEBUG와 같음)')
+    parser.add_argument('--log-level', choices=list(LOG_LEVELS), default=DEFAULT_LOG_LEVEL,
+                        help=f'디버그 로그 출력 기준 레벨 (기본 {DEFAULT_LOG_LEVEL}, WARNING 이상이면 요소/페이지 정보 수집 생략)')
+    parser.add_argument('--worker', action='store_true', help='상주 워커 모드 (계정별 브라우저 유지, JSON 줄 단위 작업 수신)')
+    parser.add_argument('--worker-port', type=int, help='워커 모드에서 stdin 대신 사용할 로컬 TCP 포트')
+    parser.add_argument('--worker-max-sessions', type=int, default=3, help='워커 모드에서 동시에 유지할 최대 계정 세션 수')
+    parser.add_argument('--import-profile', action='store_true', help='모듈별 임포트/시작 시간 측정 후 종료')
+    parser.add_argument('--manifest', help='JSONL 매니페스트 파일 (한 줄에 게시물 하나, 한 브라우저 세션으로 순차 처리)')
+    parser.add_argument('--persistent-profile', action='store_true', help='계정별 Chrome 프로필을 유지해 캐시 재사용 (매 실행 초기화 안 함)')
+    parser.add_argument('--session-ttl', type=int, default=SESSION_CHECK_TTL,
+                        help='쿠키 세션 확인 결과를 재사용할 시간(초), 0이면 매번 확인')
+    parser.add_argument('--verify-uploads', action='store_true', help='이전에 업로드한 같은 영상을 재사용하기 전에 아직 존재하는지 확인')
+    parser.add_argument('--timings', nargs='?', const='-', metavar='PATH',
+                        help='단계별 소요 시간을 JSON 줄로 기록 (경로 생략 시 stdout)')
+    parser.add_argument('--events', choices=['text', 'json'], default='text',
+                        help='json: 단계/진행률/오류/결과 이벤트를 stdout에 JSON 줄로 출력하고 사람용 로그는 stderr로')
+    parser.add_argument('--bench-attach', nargs='*', type=float, metavar='MB',
+                        help='이미지 크기(MB)별 파일 첨부 방식(파일 참조 vs base64) 벤치마크 후 종료')
+    parser.add_argument('--queue', metavar='DB',
+                        help='SQLite 작업 큐 파일: 단독 지정 시 큐 워커로 실행, --enqueue와 함께면 작업 추가')
+    parser.add_argument('--enqueue', action='store_true',
+                        help='--queue에 작업 추가 후 종료 (--username/--content 등 또는 --manifest의 모든 게시물)')
+    parser.add_argument('--run-at', help='--enqueue 작업의 예약 실행 시각 (ISO 8601 또는 epoch 초)')
+    parser.add_argument('--max-attempts', type=int, default=JOB_MAX_ATTEMPTS, help='--enqueue 작업의 최대 시도 횟수')
+    parser.add_argument('--queue-once', action='store_true', help='큐 워커가 실행할 작업이 없으면 종료')
+    parser.add_argument('--record-dom', metavar='DIR',
+                        help='게시물 작성 단계별 DOM 스냅샷을 민감정보 제거 후 DIR에 저장')
+    parser.add_argument('--replay-dom', metavar='DIR',
+                        help='저장된 DOM 스냅샷에서 선택자 전략(XPath/CSS/JS)별 속도와 정확도 비교 후 종료')
     
     try:
         args = parser.parse_args()
+        if (not args.worker and not args.import_profile and args.bench_attach is None and not args.replay_dom
+                and not (args.queue and not args.enqueue)):
+            required = ('username', 'password', 'content') if not args.manifest else ()
+            missing = [name for name in required if getattr(args, name) is None]
+            if missing:
+                parser.error('다음 인자가 필요합니다: ' + ', '.join(f'--{name}' for name in missing))
     except SystemExit as e:
         safe_print(f"인자 파싱 오류: {e}")
         safe_print("사용법: python automation_fixed.py --username 이메일 --password 비밀번호 --content 내용")
@@ -2287,95 +4636,99 @@ def main():
     except Exception as e:
         safe_print(f"예상치 못한 인자 파싱 오류: {e}")
         sys.exit(1)
+
+    set_log_level('DEBUG' if args.debug else args.log_level)
+
+    configure_events(args.events)
+
+    if args.timings:
+        configure_timings(args.timings)
+
+    if args.import_profile:
+        run_import_profile()
+        return
+
+    if args.bench_attach is not None:
+        run_attach_benchmark(args.bench_attach)
+        return
+
+    if args.replay_dom:
+        sys.exit(0 if replay_dom_snapshots(args.replay_dom) else 1)
+
+    if args.record_dom:
+        configure_dom_recorder(args.record_dom)
+
+    worker_options = {
+        'speed': args.speed,
+        'max_sessions': args.worker_max_sessions,
+        'persistent_profile': args.persistent_profile,
+        'verify_uploads': args.verify_uploads,
+        'session_ttl': args.session_ttl,
+    }
+    if args.worker:
+        run_worker(worker_options, port=args.worker_port)
+        return
+
+    if args.queue and args.enqueue:
+        if args.manifest:
+            jobs, errors = load_manifest(args.manifest, args.username, args.password)
+            for error in errors:
+                safe_print(f"❌ 매니페스트 {error['line']}번째 줄: {error['error']}")
+        else:
+            jobs = [{
+                'username': args.username, 'password': args.password, 'content': args.content,
+                'images': args.images, 'videos': args.videos,
+                'videos_local': args.videos_local, 'videos_online': args.videos_online, 'speed': args.speed,
+            }]
+        conn = open_job_db(args.queue)
+        try:
+            for job in jobs:
+                job.pop('id', None)
+                job_id = enqueue_job(conn, job, run_at=job.pop('run_at', args.run_at), max_attempts=args.max_attempts)
+                safe_print(f"[큐] 작업 {job_id} 추가")
+        finally:
+            conn.close()
+        return
+
+    if args.queue:
+        run_job_queue(args.queue, worker_options, once=args.queue_once)
+        return
+
+    if args.manifest:
+        if run_manifest(args.manifest, worker_options, args.username, args.password):
+            sys.exit(1)
+        return
     
     safe_print("YouTube 게시물 자동화 시작 (수정된 버전)")
     safe_print(f"계정: {args.username}")
+    set_timing_context(account=args.username)
     safe_print(f"내용: {args.content}")
 
     # 영상 파일 실제 존재 여부 및 확장자 체크
-    video_paths = []
-    # 온라인 영상 URL
-    if hasattr(args, 'videos_online') and args.videos_online:
-        video_paths.extend(args.videos_online)
-    # 로컬 영상 파일 업로드
-    if hasattr(args, 'videos_local') and args.videos_local:
-        for local_path in args.videos_local:
-            if os.path.exists(local_path):
-                uploaded_url = upload_video_to_youtube(local_path, email=args.username)
-                if uploaded_url:
-                    video_paths.append(uploaded_url)
-                else:
-                    safe_print(f'❌ 영상 업로드 실패: {local_path}')
-
-    # 기존 --videos 인자도 호환
-    if hasattr(args, 'videos') and args.videos:
-        for v in args.videos:
-            if v.startswith('http'):
-                video_paths.append(v)
-            elif os.path.exists(v) and os.path.splitext(v)[1].lower() in ['.mp4', '.avi', '.mov', '.mkv', '.webm']:
-                video_paths.append(v)
+    video_paths = collect_video_paths(
+        args.username,
+        videos_online=args.videos_online,
+        videos_local=args.videos_local,
+        videos=args.videos,
+        verify_uploads=args.verify_uploads,
+    )
 
     # headless 모드 결정 로직 추가
-    COOKIE_PATH = f'youtube_cookies_{args.username}.json'
-    token_path = get_token_path(args.username)
     is_video_post = len(video_paths) > 0
-    # 최초 인증(토큰 파일 없음) 또는 영상 게시물일 때는 headless=False, 그 외는 headless=True
-    if not os.path.exists(token_path) or is_video_post:
-        headless = False
-        
-        safe_print('[정책] 최초 인증 또는 영상 게시물: headless 모드 OFF (창 띄움)')
-    else:
-        headless = True
-        safe_print('[정책] 사진/글 게시물: headless 모드 ON (창 없이 실행)')
+    headless = decide_headless(args.username, is_video_post)
 
     driver = None
     try:
         cleanup_temp_files()
-        driver = setup_driver(headless=headless, speed=args.speed)
-        cookie_login_success = False
-
-        # 영상이 포함된 게시물인지 판별
-        is_video_post = len(video_paths) > 0
-
-        if is_video_post:
-            # 영상 게시물: 쿠키가 있어도 무조건 로그인
-            safe_print("[정책] 영상 게시물: 쿠키 무시, 무조건 로그인 진행")
-            if not login_youtube(driver, args.username, args.password):
-                safe_print("로그인 실패로 인한 종료")
-                if os.path.exists(COOKIE_PATH):
-                    try:
-                        os.remove(COOKIE_PATH)
-                        safe_print("❌ 실패한 쿠키 파일 삭제")
-                    except Exception:
-                        pass
-                sys.exit(1)
-            save_cookies(driver, COOKIE_PATH)
-            safe_print("✅ 로그인 성공, 쿠키 저장 완료")
-        else:
-            # 일반 게시물: 쿠키가 있으면 쿠키로, 없으면 로그인
-            if os.path.exists(COOKIE_PATH):
-                safe_print("쿠키 기반 자동 로그인 시도...")
-                try:
-                    load_cookies(driver, COOKIE_PATH)
-                    if is_logged_in(driver):
-                        safe_print("✅ 쿠키 자동 로그인 성공!")
-                        cookie_login_success = True
-                    else:
-                        safe_print("❌ 쿠키 자동 로그인 실패, 재로그인 시도")
-                except Exception as e:
-                    safe_print(f"쿠키 자동 로그인 중 오류: {e}")
-            if not cookie_login_success:
-                if not login_youtube(driver, args.username, args.password):
-                    safe_print("로그인 실패로 인한 종료")
-                    if os.path.exists(COOKIE_PATH):
-                        try:
-                            os.remove(COOKIE_PATH)
-                            safe_print("❌ 실패한 쿠키 파일 삭제")
-                        except Exception:
-                            pass
-                    sys.exit(1)
-                save_cookies(driver, COOKIE_PATH)
-                safe_print("✅ 로그인 성공, 쿠키 저장 완료")
+        driver = setup_driver(headless=headless, speed=args.speed,
+                              profile_account=args.username if args.persistent_profile else None)
+
+        if not establish_session(driver, args.username, args.password, is_video_post=is_video_post,
+                                 session_ttl=args.session_ttl):
+            safe_print("로그인 실패로 인한 종료")
+            emit_event('result', ok=False, code='login_failed')
+            sys.exit(1)
+
         # 이미지 1장만 업로드
         image_path = None
         if hasattr(args, 'images') and args.images and len(args.images) > 0:
@@ -2385,37 +4738,30 @@ def main():
         else:
             images = None
         
-        # 게시물 작성 페이지로 이동
-        if not navigate_to_create_post(driver):
-            safe_print("⚠️ 일반 게시물 작성 페이지 이동 실패")
-            safe_print("현재 페이지에서 직접 게시물 작성을 시도합니다...")
-            
-            # 현재 페이지가 YouTube인지 확인
-            current_url = driver.current_url
-            if "youtube.com" not in current_url:
-                safe_print("YouTube 메인 페이지로 이동...")
-                driver.get("https://www.youtube.com")
-                time.sleep(3)
-        
         # 게시물 작성
-        if not create_post(driver, args.content, images, video_paths):
+        if not publish_post(driver, args.content, images, video_paths, args.speed):
             safe_print("게시물 작성 실패로 인한 종료")
+            emit_event('result', ok=False, code='publish_failed')
             sys.exit(1)
         
         safe_print("모든 작업 완료!")
+        emit_event('result', ok=True, post_url=find_post_url(driver), videos=video_paths)
         
     except KeyboardInterrupt:
         safe_print("사용자에 의해 중단됨")
+        emit_event('result', ok=False, code='interrupted')
         sys.exit(1)
         
     except Exception as e:
         safe_print(f"오류: {e}")
+        emit_event('result', ok=False, code=classify_error(e), message=str(e))
         sys.exit(1)
         
     finally:
         if driver:
             safe_print("브라우저 종료 중...")
-            driver.quit()
+            with timing_span('driver_quit'):
+                driver.quit()
         
         # 종료 시 임시 파일 정리
         safe_print("임시 파일 정리 중...")
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+오프라인 모의 YouTube/Studio 벤치마크
+
+로컬 HTTP 서버가 YouTube 홈, Google 로그인, Studio, 커뮤니티 게시물 작성 다이얼로그를
+automation_fixed.py의 선택자가 찾는 id/aria-label 그대로 흉내 내고,
+headless Chrome으로 실제 login_youtube() → navigate_to_create_post() → create_post()를 실행해
+단계별(--timings 스팬) 지연 시간 백분위수를 출력합니다.
+
+- 모의 페이지는 네트워크 없이 동작 (*.localhost 호스트는 Chrome이 루프백으로 해석)
+- Chrome과 캐시된 chromedriver(chromedriver/ + manifest.json)가 필요
+  캐시가 비어 있으면 setup_driver()의 download_compatible_chromedriver()가 처음 한 번은 네트워크로 내려받음
+- composer_removed 시나리오: 게시 후 작성 다이얼로그 노드를 제거해 실제 Studio처럼 게시 버튼이 분리됨
+- 사용법: python mock_studio_benchmark.py --runs 10 [--json 결과.json]
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import automation_fixed as af
+from automation_fixed import safe_print
+
+# 모의 서버 호스트 (실제 도메인 뒤에 .localhost를 붙여 URL 기반 분기 로직이 그대로 동작하도록 함)
+YOUTUBE_HOST = "www.youtube.com.localhost"
+ACCOUNTS_HOST = "accounts.google.com.localhost"
+STUDIO_HOST = "studio.youtube.com.localhost"
+MOCK_SESSION_COOKIE = "SID=mock-session"
+
+# 벤치마크 기본값
+DEFAULT_RUNS = 5
+BENCH_PASSWORD = "mockpw"
+BENCH_PERCENTILES = (50, 90, 99)
+
+# 벤치마크 동안 모의 서버를 보도록 바꿨다가 종료 시 복원하는 automation_fixed 전역값
+PATCHED_GLOBALS = ('YOUTUBE_HOME_URL', 'STUDIO_COMMUNITY_URL', 'SELECTOR_STATS_PATH')
+
+# 로그인 전 상단바 (로그인 링크)
+TOPBAR_LOGGED_OUT = """
+  <a id="signin" href="http://{accounts}:{port}/signin/identifier" aria-label="로그인">로그인</a>
+"""
+
+# 로그인 후 상단바 (만들기 버튼 + 계정 버튼)
+TOPBAR_LOGGED_IN = """
+  <button id="create" aria-label="만들기">만들기</button>
+  <button id="avatar" aria-label="계정 메뉴">A</button>
+"""
+
+# 게시물 작성 다이얼로그 (YouTube 홈과 Studio가 공유)
+COMPOSER_HTML = """
+<div id="composer" role="dialog" hidden>
+  <div id="editor" contenteditable="true" aria-label="내용 입력" style="min-height:80px;border:1px solid #ccc"></div>
+  <div id="preview"></div>
+  <button id="imageBtn" aria-label="이미지 추가">이미지</button>
+  <button id="publishBtn" aria-label="게시">게시</button>
+</div>
+"""
+
+COMPOSER_SCRIPT = """
+var composer = document.getElementById('composer');
+var editor = document.getElementById('editor');
+var preview = document.getElementById('preview');
+document.getElementById('imageBtn').onclick = function() {
+  if (document.getElementById('imageInput')) return;
+  var input = document.createElement('input');
+  input.type = 'file';
+  input.accept = 'image/*';
+  input.id = 'imageInput';
+  input.style.display = 'none';
+  input.onchange = function() {
+    var img = document.createElement('img');
+    img.src = URL.createObjectURL(input.files[0]);
+    img.width = 64;
+    preview.appendChild(img);
+  };
+  composer.appendChild(input);
+};
+document.getElementById('publishBtn').onclick = function() {
+  var body = JSON.stringify({text: editor.innerText, images: preview.querySelectorAll('img').length});
+  fetch('/api/post', {method: 'POST', headers: {'Content-Type': 'application/json'}, body: body})
+    .then(function(response) { return response.json(); })
+    .then(function(reply) {
+      if (reply.remove_composer) {
+        // 실제 Studio처럼 작성 다이얼로그 노드 자체를 제거 (게시 버튼이 분리됨)
+        composer.remove();
+        history.replaceState(null, '', location.pathname);
+        return;
+      }
+      composer.hidden = true;
+      editor.textContent = '';
+      preview.textContent = '';
+      var input = document.getElementById('imageInput');
+      if (input) input.remove();
+      history.replaceState(null, '', location.pathname);
+    });
+};
+"""
+
+HOME_PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>YouTube (mock)</title>
+<style>tp-yt-paper-item {{ display: block; padding: 4px; cursor: pointer; }}</style></head>
+<body>
+<div id="masthead">{topbar}</div>
+<div id="menu" hidden>
+  <tp-yt-paper-item id="postItem" role="menuitem"><yt-formatted-string>게시물</yt-formatted-string></tp-yt-paper-item>
+</div>
+{composer}
+<script>
+{composer_script}
+var create = document.getElementById('create');
+if (create) create.onclick = function() {{ document.getElementById('menu').hidden = false; }};
+document.getElementById('postItem').onclick = function() {{
+  document.getElementById('menu').hidden = true;
+  composer.hidden = false;
+  history.pushState(null, '', '/?show_create_dialog=1');
+}};
+</script>
+</body></html>
+"""
+
+STUDIO_PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>YouTube Studio (mock)</title></head>
+<body>
+<h1>채널 커뮤니티</h1>
+{composer}
+<script>{composer_script}</script>
+</body></html>
+"""
+
+SIGNIN_EMAIL_PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>로그인 (mock)</title></head>
+<body>
+<input type="email" id="identifierId" autocomplete="username" aria-label="이메일 또는 휴대전화">
+<div id="identifierNext"><button type="button">다음</button></div>
+<script>
+document.getElementById('identifierNext').onclick = function() { location.href = '/signin/challenge/pwd'; };
+</script>
+</body></html>
+"""
+
+SIGNIN_PASSWORD_PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>비밀번호 (mock)</title></head>
+<body>
+<input type="password" name="Passwd" aria-label="비밀번호 입력" autocomplete="current-password">
+<div id="passwordNext"><button type="button">다음</button></div>
+<script>
+document.getElementById('passwordNext').onclick = function() {{ location.href = 'http://{youtube}:{port}/auth_done'; }};
+</script>
+</body></html>
+"""
+
+
+class MockStudioHandler(BaseHTTPRequestHandler):
+    """Host 헤더로 YouTube/Google 계정/Studio 페이지를 구분해 응답"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_html(self, html):
+        body = html.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        host = self.headers.get('Host', '').split(':')[0]
+        path = self.path.split('?')[0]
+        port = self.server.server_address[1]
+        composer = {'composer': COMPOSER_HTML, 'composer_script': COMPOSER_SCRIPT}
+
+        if host == ACCOUNTS_HOST:
+            if path == '/signin/identifier':
+                return self.send_html(SIGNIN_EMAIL_PAGE)
+            if path == '/signin/challenge/pwd':
+                return self.send_html(SIGNIN_PASSWORD_PAGE.format(youtube=YOUTUBE_HOST, port=port))
+        elif host == STUDIO_HOST:
+            return self.send_html(STUDIO_PAGE.format(**composer))
+        elif host == YOUTUBE_HOST:
+            if path == '/auth_done':
+                # 로그인 완료: 세션 쿠키 설정 후 홈으로 리다이렉트
+                self.send_response(302)
+                self.send_header('Set-Cookie', f"{MOCK_SESSION_COOKIE}; Path=/")
+                self.send_header('Location', '/')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            if path == '/':
+                logged_in = MOCK_SESSION_COOKIE in self.headers.get('Cookie', '')
+                topbar = TOPBAR_LOGGED_IN if logged_in else TOPBAR_LOGGED_OUT.format(accounts=ACCOUNTS_HOST, port=port)
+                return self.send_html(HOME_PAGE.format(topbar=topbar, **composer))
+        self.send_error(404)
+
+    def do_POST(self):
+        if self.path.split('?')[0] != '/api/post':
+            return self.send_error(404)
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            post = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            post = {}
+        with self.server.posts_lock:
+            self.server.posts.append(post)
+        body = json.dumps({'remove_composer': self.server.remove_composer}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_mock_server():
+    """모의 서버를 임의 포트로 백그라운드 실행 (server, port 반환)"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), MockStudioHandler)
+    server.daemon_threads = True
+    server.posts = []
+    server.remove_composer = False  # True면 게시 후 작성 다이얼로그를 숨기지 않고 DOM에서 제거
+    server.posts_lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, server.server_address[1]
+
+
+def write_test_png(path, size=32):
+    """Pillow 없이 단색 PNG 생성 (이미지 첨부 시나리오용)"""
+    def chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff)
+    raw = b''.join(b'\x00' + b'\xcc\x00\x00' * size for _ in range(size))
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(chunk(b'IHDR', struct.pack('>IIBBBBB', size, size, 8, 2, 0, 0, 0)))
+        f.write(chunk(b'IDAT', zlib.compress(raw)))
+        f.write(chunk(b'IEND', b''))
+    return path
+
+
+def percentile(values, pct):
+    """nearest-rank 백분위수"""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    rank = max(1, -(-pct * len(ordered) // 100))
+    return ordered[int(rank) - 1]
+
+
+def summarize_spans(records):
+    """스팬 기록을 '시나리오/스팬' 별로 묶어 백분위수 요약"""
+    groups = {}
+    for record in records:
+        key = f"{record.get('scenario', '-')}/{record['span']}"
+        group = groups.setdefault(key, {'durations': [], 'failures': 0})
+        group['durations'].append(record['duration_ms'])
+        if not record.get('ok', True):
+            group['failures'] += 1
+    summary = {}
+    for key, group in groups.items():
+        durations = group['durations']
+        entry = {'count': len(durations), 'failures': group['failures'], 'max': max(durations)}
+        for pct in BENCH_PERCENTILES:
+            entry[f'p{pct}'] = percentile(durations, pct)
+        summary[key] = entry
+    return summary
+
+
+def print_summary(summary):
+    """백분위수 요약 표 출력 (ms)"""
+    header = f"{'시나리오/스팬':<40} {'n':>4} {'실패':>4} " + ' '.join(f"{'p' + str(p):>9}" for p in BENCH_PERCENTILES) + f" {'max':>9}"
+    safe_print(header)
+    safe_print('-' * len(header))
+    for key in sorted(summary):
+        entry = summary[key]
+        pcts = ' '.join(f"{entry[f'p{p}']:>9.1f}" for p in BENCH_PERCENTILES)
+        safe_print(f"{key:<40} {entry['count']:>4} {entry['failures']:>4} {pcts} {entry['max']:>9.1f}")
+
+
+def publish_span_ms(records, name, run):
+    """해당 시나리오/회차의 publish 스팬 소요 시간(ms), 없으면 None"""
+    for record in reversed(records):
+        if record['span'] == 'publish' and record.get('scenario') == name and record.get('run') == run:
+            return record['duration_ms']
+    return None
+
+
+def run_scenario(driver, server, name, run, image_paths=None, via_studio=False, remove_composer=False):
+    """게시물 작성 시나리오 1회 실행 후 서버가 본문을 받았는지 확인"""
+    af.set_timing_context(scenario=name, run=run)
+    server.remove_composer = remove_composer
+    content = f"모의 벤치마크 게시물 {name} #{run} 🚀"
+    expected = len(server.posts) + 1
+    if via_studio:
+        # Studio로 리다이렉트된 상황: create_post가 홈으로 돌아가 다시 작성 창을 여는 경로
+        driver.get(af.STUDIO_COMMUNITY_URL)
+    elif not af.navigate_to_create_post(driver):
+        return False
+    if not af.create_post(driver, content, image_paths=image_paths):
+        return False
+    if not af.wait_for(driver, lambda d: len(server.posts) >= expected, step='publish_done'):
+        safe_print(f"❌ [{name}] 서버가 게시 요청을 받지 못함")
+        return False
+    post = server.posts[-1]
+    if af.normalize_editor_text(post.get('text', '')) != af.normalize_editor_text(content):
+        safe_print(f"❌ [{name}] 게시된 본문 불일치: {post.get('text')!r}")
+        return False
+    if image_paths and not post.get('images'):
+        safe_print(f"❌ [{name}] 이미지가 첨부되지 않음")
+        return False
+    return True
+
+
+def run_mock_benchmark(runs=DEFAULT_RUNS, headless=True):
+    """
+    모의 서버 + headless Chrome으로 로그인/작성/게시 흐름을 runs회 반복 실행
+    반환: (스팬 요약 dict, 성공 횟수, 전체 시나리오 수)
+    """
+    server, port = start_mock_server()
+    work_dir = tempfile.mkdtemp(prefix='mock_studio_')
+    records = []
+    publish_limit_ms = af.STEP_TIMEOUTS['publish_done'] * 1000
+
+    # 실제 주소 대신 모의 서버를 보도록 시작 URL 교체, 선택자 학습 기록은 임시 파일로 분리
+    # (다른 코드에서 import해 호출해도 automation_fixed가 localhost를 가리킨 채 남지 않도록 종료 시 복원)
+    saved_globals = {name: getattr(af, name) for name in PATCHED_GLOBALS}
+    af.YOUTUBE_HOME_URL = f"http://{YOUTUBE_HOST}:{port}/"
+    af.STUDIO_COMMUNITY_URL = f"http://{STUDIO_HOST}:{port}/channel/UC/community"
+    af.SELECTOR_STATS_PATH = os.path.join(work_dir, 'selector_stats.json')
+    af.configure_timings(records.append)
+    driver = None
+    passed = total = 0
+    try:
+        image_path = write_test_png(os.path.join(work_dir, 'bench.png'))
+        safe_print(f"🧪 모의 Studio 서버 실행: {af.YOUTUBE_HOME_URL} (반복 {runs}회)")
+        driver = af.setup_driver(headless=headless)
+        if not driver:
+            raise RuntimeError("Chrome 드라이버를 시작할 수 없습니다 (로컬 Chrome/chromedriver 캐시 필요)")
+
+        for run in range(1, runs + 1):
+            # 매 회차 로그아웃 상태에서 시작
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            af.set_timing_context(scenario='login', run=run)
+            total += 1
+            if not af.login_youtube(driver, 'bench@example.com', BENCH_PASSWORD):
+                safe_print(f"❌ {run}회차 로그인 실패")
+                continue
+            passed += 1
+            for name, kwargs in (('text', {}),
+                                 ('image', {'image_paths': [image_path]}),
+                                 ('studio_redirect', {'via_studio': True}),
+                                 ('composer_removed', {'remove_composer': True})):
+                total += 1
+                if not run_scenario(driver, server, name, run, **kwargs):
+                    continue
+                # 게시 버튼이 DOM에서 분리돼도 완료 대기가 타임아웃까지 멈추지 않아야 함
+                publish_ms = publish_span_ms(records, name, run)
+                if publish_ms is not None and publish_ms >= publish_limit_ms:
+                    safe_print(f"❌ [{name}] publish 스팬 {publish_ms:.0f}ms가 단계 타임아웃({publish_limit_ms:.0f}ms)에 도달")
+                    continue
+                passed += 1
+            safe_print(f"✅ {run}/{runs}회차 완료")
+    finally:
+        if driver:
+            with af.timing_span('driver_quit'):
+                driver.quit()
+        af.configure_timings(None)
+        af.set_timing_context(scenario=None, run=None)
+        server.shutdown()
+        for name, value in saved_globals.items():
+            setattr(af, name, value)
+
+    return summarize_spans(records), passed, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description='오프라인 모의 YouTube/Studio 단계별 지연 벤치마크')
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS, help=f'반복 횟수 (기본 {DEFAULT_RUNS})')
+    parser.add_argument('--headed', action='store_true', help='브라우저 창을 띄워 실행 (디버깅용)')
+    parser.add_argument('--json', metavar='PATH', help='요약 결과를 JSON 파일로 저장')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    summary, passed, total = run_mock_benchmark(args.runs, headless=not args.headed)
+    elapsed = time.perf_counter() - started
+
+    safe_print("")
+    print_summary(summary)
+    safe_print(f"\n시나리오 성공 {passed}/{total}, 총 {elapsed:.1f}초")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'runs': args.runs, 'passed': passed, 'total': total, 'spans': summary},
+                      f, ensure_ascii=False, indent=2)
+        safe_print(f"📄 결과 저장: {args.json}")
+    return 0 if passed == total else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -38,6 +38,66 @@ function writeLog(level, message) {
     fs.appendFileSync(logFile, logEntry, 'utf8');
 }
 
+// Python 로그는 응답에 마지막 일부만 담음 (실행이 길어져도 메모리가 계속 늘지 않도록)
+const LOG_TAIL_LIMIT = 64 * 1024;
+
+function appendTail(buffer, chunk, limit = LOG_TAIL_LIMIT) {
+    const combined = buffer + chunk;
+    return combined.length > limit ? combined.slice(combined.length - limit) : combined;
+}
+
+// --events json 으로 실행한 Python 프로세스의 stdout 이벤트 줄 / stderr 로그 처리
+// 반환 객체의 result, errors, logTail을 프로세스 종료 시 응답에 사용
+function attachEventStream(pythonProcess, label) {
+    const state = { result: null, errors: [], logTail: '' };
+    let stdoutBuffer = '';
+
+    const handleEvent = (event) => {
+        if (event.event === 'result') {
+            state.result = event;
+        } else if (event.event === 'error') {
+            state.errors.push(event);
+            console.error(`${label} 오류 [${event.code}]: ${event.message}`);
+        } else if (event.event === 'upload_progress') {
+            console.log(`${label} 업로드 진행률: ${event.file} ${event.percent}%`);
+        } else if (event.event === 'phase_end') {
+            console.log(`${label} 단계 완료: ${event.phase} (${event.ok ? '성공' : '실패'}, ${event.duration_ms}ms)`);
+        }
+    };
+
+    // 이벤트 처리 (줄 단위로 바로 파싱, 전체 출력을 모아 두지 않음)
+    pythonProcess.stdout.on('data', (data) => {
+        stdoutBuffer += data.toString();
+        let newline;
+        while ((newline = stdoutBuffer.indexOf('\n')) !== -1) {
+            const line = stdoutBuffer.slice(0, newline).trim();
+            stdoutBuffer = stdoutBuffer.slice(newline + 1);
+            if (!line) continue;
+            let event = null;
+            try {
+                event = JSON.parse(line);
+            } catch (e) {
+                event = null;
+            }
+            if (event && typeof event === 'object' && event.event) {
+                handleEvent(event);
+            } else {
+                // 이벤트 스트림을 지원하지 않는 스크립트의 일반 출력
+                state.logTail = appendTail(state.logTail, line + '\n');
+                console.log(`${label} 출력:`, line);
+            }
+        }
+    });
+
+    pythonProcess.stderr.on('data', (data) => {
+        const message = data.toString();
+        state.logTail = appendTail(state.logTail, message);
+        console.log(`${label} 로그:`, message.trim());
+    });
+
+    return state;
+}
+
 // 메인 페이지
 app.get('/', (req, res) => {
     const realPath = path.join(__dirname, 'public', 'index.html');
@@ -135,6 +195,10 @@ app.post('/api/automate-batch', (req, res) => {
             pythonArgs.push('--manual-wait', settings.manualWait.toString());
         }
     }
+    // stdout은 JSON 이벤트 줄, 사람용 로그는 stderr (TURBO 스크립트는 이벤트 스트림 미지원 → 일반 출력으로 처리)
+    if (scriptName === 'automation_fixed.py') {
+        pythonArgs.push('--events', 'json');
+    }
     
     console.log('실제 파이썬 실행 인자:', pythonArgs);
     
@@ -145,24 +209,8 @@ app.post('/api/automate-batch', (req, res) => {
         stdio: ['pipe', 'pipe', 'pipe']
     });
     
-    let output = '';
-    let errorOutput = '';
-    
     // 출력 스트림 처리
-    pythonProcess.stdout.on('data', (data) => {
-        const message = data.toString();
-        output += message;
-        console.log(`[게시물 ${postIndex + 1}] ${message.trim()}`);
-        
-        // 실시간 로그를 클라이언트에 전송 (WebSocket이 있다면)
-        // io.emit('automation-log', { postIndex, message: message.trim() });
-    });
-    
-    pythonProcess.stderr.on('data', (data) => {
-        const error = data.toString();
-        errorOutput += error;
-        console.error(`[게시물 ${postIndex + 1} 오류] ${error.trim()}`);
-    });
+    const events = attachEventStream(pythonProcess, `[게시물 ${postIndex + 1}]`);
     
     // 프로세스 완료 처리
     pythonProcess.on('close', (code) => {
@@ -184,14 +232,17 @@ app.post('/api/automate-batch', (req, res) => {
             res.json({
                 success: true,
                 message: `게시물 ${postIndex + 1} 자동화 완료`,
-                output: output,
+                postUrl: events.result ? events.result.post_url : null,
+                output: events.logTail,
                 postIndex: postIndex
             });
         } else {
             res.json({
                 success: false,
                 error: `자동화 실패 (종료 코드: ${code})`,
-                errorOutput: errorOutput,
+                errorCode: events.result ? events.result.code : (events.errors.length ? events.errors[events.errors.length - 1].code : null),
+                errors: events.errors,
+                errorOutput: events.logTail,
                 postIndex: postIndex
             });
         }
@@ -277,6 +328,8 @@ app.post('/api/automate', (req, res) => {
         pythonArgs.push('--videos-online');
         pythonArgs.push(...onlineVideos);
     }
+    // stdout은 JSON 이벤트 줄, 사람용 로그는 stderr
+    pythonArgs.push('--events', 'json');
     console.log('실제 파이썬 실행 인자:', pythonArgs);
     const pythonExec = process.env.PYTHON_PATH || 'python';
     const pythonProcess = spawn(pythonExec, pythonArgs, {
@@ -284,20 +337,7 @@ app.post('/api/automate', (req, res) => {
         stdio: ['pipe', 'pipe', 'pipe']
     });
     
-    let output = '';
-    let errorOutput = '';
-    
-    pythonProcess.stdout.on('data', (data) => {
-        const message = data.toString();
-        output += message;
-        console.log('Python 출력:', message.trim());
-    });
-    
-    pythonProcess.stderr.on('data', (data) => {
-        const error = data.toString();
-        errorOutput += error;
-        console.error('Python 오류:', error.trim());
-    });
+    const events = attachEventStream(pythonProcess, 'Python');
     
     pythonProcess.on('close', (code) => {
         console.log(`Python 프로세스 종료: ${code}`);
@@ -306,13 +346,16 @@ app.post('/api/automate', (req, res) => {
             res.json({
                 success: true,
                 message: '자동화가 성공적으로 완료되었습니다.',
-                output: output
+                postUrl: events.result ? events.result.post_url : null,
+                output: events.logTail
             });
         } else {
             res.json({
                 success: false,
                 error: `자동화 실패 (종료 코드: ${code})`,
-                errorOutput: errorOutput
+                errorCode: events.result ? events.result.code : (events.errors.length ? events.errors[events.errors.length - 1].code : null),
+                errors: events.errors,
+                errorOutput: events.logTail
             });
         }
     });
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""테스트 공통 설정: 저장소 루트의 automation_fixed.py를 import할 수 있도록 경로 추가"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
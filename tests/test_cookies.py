@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""저장된 Selenium 쿠키를 CDP Network.setCookies 형식으로 바꾸는 cookie_to_cdp 테스트"""
+
+import automation_fixed as af
+
+
+def test_domain_cookie_keeps_domain_and_expiry():
+    param = af.cookie_to_cdp({
+        'name': 'SID', 'value': 'v', 'domain': '.youtube.com', 'path': '/',
+        'secure': True, 'httpOnly': True, 'sameSite': 'None', 'expiry': 1900000000,
+    })
+    assert param == {
+        'name': 'SID', 'value': 'v', 'domain': '.youtube.com', 'path': '/',
+        'secure': True, 'httpOnly': True, 'sameSite': 'None', 'expires': 1900000000,
+    }
+
+
+def test_host_only_cookie_uses_url_instead_of_domain():
+    param = af.cookie_to_cdp({'name': 'PREF', 'value': 'x', 'domain': 'www.youtube.com', 'path': '/watch'})
+    assert 'domain' not in param
+    assert param['url'] == 'https://www.youtube.com/watch'
+
+
+def test_defaults_and_unknown_same_site():
+    param = af.cookie_to_cdp({'name': 'a', 'value': 'b', 'domain': '.google.com', 'sameSite': 'bogus'})
+    assert param['path'] == '/'
+    assert param['secure'] is False
+    assert param['httpOnly'] is False
+    assert 'sameSite' not in param
+    assert 'expires' not in param  # 세션 쿠키는 만료 시각 없이 유지
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""작업 큐(--queue)의 리스 재획득, 최대 시도 횟수, 백오프 스케줄 테스트 (브라우저 불필요)"""
+
+import random
+
+import pytest
+
+import automation_fixed as af
+
+EXPIRED = -1  # 잡자마자 만료되는 리스 (finish_job 전에 워커가 죽은 상황)
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = af.open_job_db(str(tmp_path / 'jobs.db'))
+    yield conn
+    conn.close()
+
+
+def job_row(conn, job_id):
+    return dict(conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone())
+
+
+def test_claim_takes_queued_job_and_increments_attempts(conn):
+    job_id = af.enqueue_job(conn, {'username': 'a', 'content': 'x'})
+    job = af.claim_job(conn, 'w1')
+    assert job['id'] == job_id
+    assert job['attempts'] == 1
+    assert job['checkpoints'] == {}
+    row = job_row(conn, job_id)
+    assert row['status'] == 'running'
+    assert row['lease_owner'] == 'w1'
+    assert af.claim_job(conn, 'w2') is None  # 리스가 살아 있으면 다른 워커가 못 가져감
+
+
+def test_future_job_is_not_claimed(conn):
+    af.enqueue_job(conn, {'content': 'x'}, run_at=af.time.time() + 3600)
+    assert af.claim_job(conn, 'w1') is None
+
+
+def test_expired_lease_is_reclaimed_by_another_worker(conn):
+    job_id = af.enqueue_job(conn, {'content': 'x'}, max_attempts=3)
+    af.claim_job(conn, 'w1', lease_seconds=EXPIRED)
+    job = af.claim_job(conn, 'w2')
+    assert job['id'] == job_id
+    assert job['attempts'] == 2
+    assert job_row(conn, job_id)['lease_owner'] == 'w2'
+    # 리스를 잃은 워커는 연장/완료 기록을 할 수 없음
+    assert not af.renew_lease(conn, job_id, 'w1')
+    assert af.finish_job(conn, dict(job, attempts=1), 'w1', {'success': True}) is None
+
+
+def test_crashing_job_stops_after_max_attempts(conn):
+    job_id = af.enqueue_job(conn, {'content': 'x'}, max_attempts=2)
+    assert af.claim_job(conn, 'w1', lease_seconds=EXPIRED)['attempts'] == 1
+    assert af.claim_job(conn, 'w2', lease_seconds=EXPIRED)['attempts'] == 2
+    # 시도 횟수를 다 쓴 만료 작업은 다시 잡히지 않고 failed로 정리됨
+    assert af.claim_job(conn, 'w3') is None
+    row = job_row(conn, job_id)
+    assert row['status'] == 'failed'
+    assert row['attempts'] == 2
+    assert row['lease_owner'] is None
+    assert row['last_error']
+
+
+def test_exhausted_expired_lease_does_not_block_other_jobs(conn):
+    stuck = af.enqueue_job(conn, {'content': 'stuck'}, max_attempts=1)
+    af.claim_job(conn, 'w1', lease_seconds=EXPIRED)
+    ready = af.enqueue_job(conn, {'content': 'ready'})
+    job = af.claim_job(conn, 'w2')
+    assert job['id'] == ready
+    assert job_row(conn, stuck)['status'] == 'failed'
+
+
+def test_failure_is_requeued_with_backoff(conn, monkeypatch):
+    monkeypatch.setattr(random, 'random', lambda: 0.5)  # 지터 배율 1.0
+    job_id = af.enqueue_job(conn, {'content': 'x'}, max_attempts=3)
+    job = af.claim_job(conn, 'w1')
+    before = af.time.time()
+    assert af.finish_job(conn, job, 'w1', {'success': False, 'error': 'boom'}) == 'queued'
+    row = job_row(conn, job_id)
+    assert row['last_error'] == 'boom'
+    assert row['lease_owner'] is None
+    assert row['run_at'] == pytest.approx(before + af.JOB_BACKOFF_BASE, abs=1)
+    assert af.claim_job(conn, 'w1') is None  # 백오프가 끝나기 전에는 다시 잡히지 않음
+
+
+def test_failure_on_last_attempt_marks_failed(conn):
+    job_id = af.enqueue_job(conn, {'content': 'x'}, max_attempts=1)
+    job = af.claim_job(conn, 'w1')
+    assert af.finish_job(conn, job, 'w1', {'success': False, 'error': 'boom'}) == 'failed'
+    assert job_row(conn, job_id)['status'] == 'failed'
+
+
+def test_success_marks_done(conn):
+    job_id = af.enqueue_job(conn, {'content': 'x'})
+    job = af.claim_job(conn, 'w1')
+    assert af.finish_job(conn, job, 'w1', {'success': True}) == 'done'
+    assert job_row(conn, job_id)['status'] == 'done'
+
+
+def test_checkpoints_survive_reclaim(conn):
+    job_id = af.enqueue_job(conn, {'content': 'x'})
+    af.claim_job(conn, 'w1', lease_seconds=EXPIRED)
+    assert af.save_job_checkpoint(conn, job_id, 'w1', 'videos', {'video_paths': ['u']}, lease_seconds=EXPIRED)
+    job = af.claim_job(conn, 'w2')
+    assert job['checkpoints']['videos']['video_paths'] == ['u']
+    # 리스를 잃은 워커의 체크포인트는 저장되지 않음
+    assert not af.save_job_checkpoint(conn, job_id, 'w1', 'published', {})
+
+
+@pytest.mark.parametrize('attempts, expected', [
+    (1, af.JOB_BACKOFF_BASE),
+    (2, af.JOB_BACKOFF_BASE * 2),
+    (3, af.JOB_BACKOFF_BASE * 4),
+    (50, af.JOB_BACKOFF_MAX),
+])
+def test_backoff_doubles_until_cap(monkeypatch, attempts, expected):
+    monkeypatch.setattr(random, 'random', lambda: 0.5)
+    assert af.job_backoff(attempts) == pytest.approx(expected)
+
+
+def test_backoff_jitter_stays_within_twenty_percent(monkeypatch):
+    monkeypatch.setattr(random, 'random', lambda: 0.0)
+    assert af.job_backoff(1) == pytest.approx(af.JOB_BACKOFF_BASE * 0.8)
+    monkeypatch.setattr(random, 'random', lambda: 0.999999)
+    assert af.job_backoff(1) == pytest.approx(af.JOB_BACKOFF_BASE * 1.2, rel=1e-5)
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""--manifest JSONL 로드(load_manifest) 테스트"""
+
+import automation_fixed as af
+
+
+def write_manifest(tmp_path, text):
+    path = tmp_path / 'posts.jsonl'
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+def test_skips_blank_and_comment_lines(tmp_path):
+    path = write_manifest(tmp_path, '\n# 주석\n{"content": "첫 글"}\n\n{"id": "b", "content": "둘째 글"}\n')
+    jobs, errors = af.load_manifest(path)
+    assert errors == []
+    assert [(job['id'], job['line'], job['content']) for job in jobs] == [(3, 3, '첫 글'), ('b', 5, '둘째 글')]
+
+
+def test_fills_default_credentials_only_when_missing(tmp_path):
+    path = write_manifest(tmp_path, '{"content": "a"}\n{"content": "b", "username": "other@x.com", "password": "pw2"}\n')
+    jobs, _ = af.load_manifest(path, default_username='me@x.com', default_password='pw')
+    assert (jobs[0]['username'], jobs[0]['password']) == ('me@x.com', 'pw')
+    assert (jobs[1]['username'], jobs[1]['password']) == ('other@x.com', 'pw2')
+
+
+def test_invalid_lines_become_error_results(tmp_path):
+    path = write_manifest(tmp_path, '{"content": "ok"}\n{not json\n[1, 2]\n')
+    jobs, errors = af.load_manifest(path)
+    assert len(jobs) == 1
+    assert [error['line'] for error in errors] == [2, 3]
+    assert all(error['success'] is False and error['error'] for error in errors)
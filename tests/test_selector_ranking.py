@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""선택자 학습(selector_stats.json)의 반감기 감쇠와 오래된 기록 정리 테스트"""
+
+import json
+
+import pytest
+
+import automation_fixed as af
+
+DAY = 86400
+NOW = 1_800_000_000.0
+
+
+@pytest.fixture
+def stats_file(tmp_path, monkeypatch):
+    """통계 파일을 임시 경로로 돌리고, 프로세스 캐시와 현재 시각을 고정"""
+    path = tmp_path / 'selector_stats.json'
+    monkeypatch.setattr(af, 'SELECTOR_STATS_PATH', str(path))
+    monkeypatch.setattr(af, '_selector_stats', None)
+    monkeypatch.setattr(af.time, 'time', lambda: NOW)
+    monkeypatch.setattr(af, 'emit_event', lambda *args, **kwargs: None)
+
+    def write(stats):
+        path.write_text(json.dumps(stats), encoding='utf-8')
+        monkeypatch.setattr(af, '_selector_stats', None)
+    return write
+
+
+def entry(hits, days_ago):
+    return {'hits': hits, 'last_success': NOW - days_ago * DAY}
+
+
+def test_without_stats_keeps_original_order(stats_file):
+    assert af.rank_candidates('step', ['a', 'b', 'c']) == ['a', 'b', 'c']
+
+
+def test_more_hits_rank_first(stats_file):
+    stats_file({'step': {'b': entry(1, 0), 'c': entry(5, 0)}})
+    assert af.rank_candidates('step', ['a', 'b', 'c']) == ['c', 'b', 'a']
+
+
+def test_old_hits_decay_by_half_life(stats_file):
+    half_life = af.SELECTOR_HALF_LIFE_DAYS
+    # 3번 성공했지만 반감기 2번이 지난 후보(점수 0.75)는 최근 1번 성공한 후보보다 뒤
+    stats_file({'step': {'old': entry(3, 2 * half_life), 'new': entry(1, 0)}})
+    assert af.rank_candidates('step', ['old', 'new']) == ['new', 'old']
+    # 반감기 1번이면 점수 1.5로 여전히 앞
+    stats_file({'step': {'old': entry(3, half_life), 'new': entry(1, 0)}})
+    assert af.rank_candidates('step', ['old', 'new']) == ['old', 'new']
+
+
+def test_equal_scores_keep_original_order(stats_file):
+    stats_file({'step': {'a': entry(2, 1), 'b': entry(2, 1)}})
+    assert af.rank_candidates('step', ['b', 'a']) == ['b', 'a']
+
+
+def test_tuple_candidates_use_strategy_key(stats_file):
+    stats_file({'step': {'css selector=#publish': entry(4, 0)}})
+    candidates = ["//button", ('css selector', '#publish')]
+    assert af.rank_candidates('step', candidates) == [('css selector', '#publish'), "//button"]
+
+
+def test_records_older_than_max_age_are_dropped(stats_file):
+    stats_file({
+        'step': {'stale': entry(100, af.SELECTOR_MAX_AGE_DAYS + 1), 'fresh': entry(1, 1)},
+        'gone': {'x': entry(1, af.SELECTOR_MAX_AGE_DAYS + 1)},
+    })
+    stats = af.load_selector_stats()
+    assert set(stats['step']) == {'fresh'}
+    assert 'gone' not in stats
+    assert af.rank_candidates('step', ['stale', 'fresh']) == ['fresh', 'stale']
+
+
+def test_record_win_persists_and_promotes(stats_file, tmp_path):
+    af.record_selector_win('step', 'b')
+    af.record_selector_win('step', 'b')
+    assert af.rank_candidates('step', ['a', 'b']) == ['b', 'a']
+    saved = json.loads((tmp_path / 'selector_stats.json').read_text(encoding='utf-8'))
+    assert saved['step']['b'] == {'hits': 2, 'last_success': NOW}
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""임시 Chrome 프로필 정리(cleanup_temp_files)가 다른 프로세스의 실행 중인 프로필을 지우지 않는지 테스트"""
+
+import os
+import tempfile
+
+import pytest
+
+import automation_fixed as af
+
+
+@pytest.fixture
+def temp_base(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, 'gettempdir', lambda: str(tmp_path))
+    monkeypatch.setattr(af, '_owned_temp_dirs', set())
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def make_profile(base, name, locked=False):
+    path = base / name
+    path.mkdir()
+    if locked:
+        # 실행 중인 Chrome이 남기는 SingletonLock ("호스트명-PID" 심볼릭 링크)
+        os.symlink(f"host-{os.getpid()}", path / 'SingletonLock')
+    return str(path)
+
+
+def test_own_only_removes_just_this_process_profiles(temp_base):
+    mine = make_profile(temp_base, 'chrome_temp_mine')
+    other = make_profile(temp_base, 'chrome_temp_other')
+    af._owned_temp_dirs.add(mine)
+    af.cleanup_temp_files(own_only=True)
+    assert not os.path.exists(mine)
+    assert os.path.exists(other)
+    assert af._owned_temp_dirs == set()
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='SingletonLock 심볼릭 링크는 Linux/macOS 전용')
+def test_global_cleanup_skips_profiles_in_use(temp_base):
+    stale = make_profile(temp_base, 'chrome_temp_stale')
+    live = make_profile(temp_base, 'chrome_temp_live', locked=True)
+    af.cleanup_temp_files()
+    assert not os.path.exists(stale)
+    assert os.path.exists(live)
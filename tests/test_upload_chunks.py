@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""재개 가능한 영상 업로드의 청크 크기 조절(next_chunk_size) 테스트"""
+
+import pytest
+
+import automation_fixed as af
+
+MB = 1024 * 1024
+
+
+def test_unmeasured_transfer_keeps_current_size():
+    assert af.next_chunk_size(8 * MB, 0, 1.0) == 8 * MB
+    assert af.next_chunk_size(8 * MB, 8 * MB, 0) == 8 * MB
+
+
+def test_targets_configured_seconds_per_chunk():
+    # 1MB/s면 목표 시간 동안 보낼 수 있는 크기로 맞춤
+    size = af.next_chunk_size(16 * MB, 1 * MB, 1.0)
+    assert size == af.UPLOAD_CHUNK_TARGET_SECONDS * MB
+
+
+def test_growth_is_limited_to_four_times():
+    assert af.next_chunk_size(2 * MB, 100 * MB, 1.0) == 8 * MB
+
+
+@pytest.mark.parametrize('sent, seconds', [(1, 100.0), (3 * MB + 12345, 1.7), (500 * MB, 1.0)])
+def test_result_is_unit_aligned_and_clamped(sent, seconds):
+    size = af.next_chunk_size(af.UPLOAD_CHUNK_MAX, sent, seconds)
+    assert size % af.UPLOAD_CHUNK_UNIT == 0
+    assert af.UPLOAD_CHUNK_MIN <= size <= af.UPLOAD_CHUNK_MAX